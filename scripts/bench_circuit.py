@@ -0,0 +1,160 @@
+"""
+Micro-benchmark of the single-loop encoding (`add_circuit_constraint_from_undirected`).
+
+Every loop solver is run twice per instance: once with the reference encoding kept
+below (two arcs per edge, tied to the edge and to the node literals by seven
+implications) and once with the current one from `puzzlekit.utils.ortools_utils`.
+Model size, build time and solve time are summed per puzzle type.
+
+Instances come from `assets/data/<Name>/<Name>_dataset.json` (see README); puzzle
+types without a dataset fall back to the solver's metadata example.
+
+    python scripts/bench_circuit.py
+    python scripts/bench_circuit.py -p masyu slitherlink -n 50
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import importlib
+from typing import Any, Dict, Hashable, List, Tuple
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from ortools.sat.python import cp_model as cp
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers import get_solver_class, _SOLVER_META
+from puzzlekit.utils import ortools_utils
+from puzzlekit.utils.name_utils import infer_class_name
+
+ASSETS_DIR = os.path.join(project_root, "assets", "data")
+HELPER = "add_circuit_constraint_from_undirected"
+
+
+def reference_circuit_constraint(
+    model: cp.CpModel,
+    nodes: List[Hashable],
+    undirected_edges: Dict[Tuple[Hashable, Hashable], cp.IntVar]
+) -> Dict[Hashable, cp.IntVar]:
+    """The previous encoding, kept here as the baseline."""
+    node_to_index = {node: i for i, node in enumerate(nodes)}
+    circuit_arcs = []
+    node_active = {node: model.NewBoolVar(f"active_{node}") for node in nodes}
+    for node in nodes:
+        idx = node_to_index[node]
+        circuit_arcs.append([idx, idx, node_active[node].Not()])
+    for (u, v), edge_var in undirected_edges.items():
+        if u not in node_to_index or v not in node_to_index:
+            continue
+        u_idx, v_idx = node_to_index[u], node_to_index[v]
+        arc_u_v = model.NewBoolVar(f"arc_{u}->{v}")
+        arc_v_u = model.NewBoolVar(f"arc_{v}->{u}")
+        circuit_arcs.append([u_idx, v_idx, arc_u_v])
+        circuit_arcs.append([v_idx, u_idx, arc_v_u])
+        model.AddImplication(arc_u_v, edge_var)
+        model.AddImplication(arc_v_u, edge_var)
+        model.AddBoolOr([arc_u_v, arc_v_u]).OnlyEnforceIf(edge_var)
+        model.AddImplication(arc_u_v, arc_v_u.Not())
+        model.AddImplication(arc_u_v, node_active[u])
+        model.AddImplication(arc_u_v, node_active[v])
+        model.AddImplication(arc_v_u, node_active[u])
+        model.AddImplication(arc_v_u, node_active[v])
+    if circuit_arcs:
+        model.AddCircuit(circuit_arcs)
+    return node_active
+
+
+ENCODINGS = {
+    "reference": reference_circuit_constraint,
+    "current": getattr(ortools_utils, HELPER),
+}
+
+
+def loop_puzzle_types() -> List[str]:
+    """Puzzle types whose solver module builds its loop with the helper."""
+    types = []
+    for puzzle_type, (module_name, _) in sorted(_SOLVER_META.items()):
+        module = importlib.import_module(f"puzzlekit.solvers.{module_name}")
+        if hasattr(module, HELPER):
+            types.append(puzzle_type)
+    return types
+
+
+def load_instances(puzzle_type: str, limit: int) -> List[str]:
+    folder = infer_class_name(puzzle_type)
+    dataset_path = os.path.join(ASSETS_DIR, folder, f"{folder}_dataset.json")
+    if os.path.exists(dataset_path):
+        with open(dataset_path, "r", encoding="utf-8") as f:
+            puzzles = json.load(f).get("data", {})
+        problems = [val.get("problem", "") for val in puzzles.values()]
+        problems = [p for p in problems if p.strip()]
+    else:
+        example = get_solver_class(puzzle_type).metadata.get("input_example", "")
+        problems = [example] if example.strip() else []
+    return problems[:limit] if limit else problems
+
+
+def run_instance(puzzle_type: str, problem: str, encoding: str, solve_options: Dict[str, Any]) -> Dict[str, Any]:
+    module = importlib.import_module(f"puzzlekit.solvers.{_SOLVER_META[puzzle_type][0]}")
+    original = getattr(module, HELPER)
+    setattr(module, HELPER, ENCODINGS[encoding])
+    try:
+        solver = get_solver_class(puzzle_type)(**get_parser(puzzle_type)(problem.strip()))
+        tic = time.perf_counter()
+        result = solver.solve(**solve_options)
+        total = time.perf_counter() - tic
+    finally:
+        setattr(module, HELPER, original)
+    proto = solver.model.Proto()
+    build_time = result.solution_data["build_time"]
+    return {
+        "status": result.solution_data["status"],
+        "num_vars": len(proto.variables),
+        "num_constrs": len(proto.constraints),
+        "build_time": build_time,
+        "solve_time": total - build_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-loop circuit encoding.")
+    parser.add_argument("-p", "--puzzle", nargs="*", default=None,
+                        help="Puzzle types (snake_case) to run. Default: every loop solver.")
+    parser.add_argument("-n", "--limit", type=int, default=0,
+                        help="Max instances per puzzle type (0 = all).")
+    parser.add_argument("--max-time", type=float, default=None, help="Per-instance solver time limit.")
+    parser.add_argument("--num-workers", type=int, default=1, help="CP-SAT workers (default 1, for stable timings).")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    solve_options = dict(max_time=args.max_time, num_workers=args.num_workers, seed=args.seed)
+    puzzle_types = args.puzzle or loop_puzzle_types()
+
+    header = f"{'puzzle_type':<20} {'n':>4} {'encoding':<10} {'vars':>9} {'constrs':>9} {'build(s)':>9} {'solve(s)':>9} {'ok':>4}"
+    print(header)
+    print("-" * len(header))
+    totals = {name: {"build_time": 0.0, "solve_time": 0.0} for name in ENCODINGS}
+    for puzzle_type in puzzle_types:
+        problems = load_instances(puzzle_type, args.limit)
+        if not problems:
+            continue
+        for encoding in ENCODINGS:
+            rows = [run_instance(puzzle_type, p, encoding, solve_options) for p in problems]
+            solved = sum(r["status"] in ("Optimal", "Feasible") for r in rows)
+            stats = {key: sum(r[key] for r in rows) for key in ("num_vars", "num_constrs", "build_time", "solve_time")}
+            totals[encoding]["build_time"] += stats["build_time"]
+            totals[encoding]["solve_time"] += stats["solve_time"]
+            print(f"{puzzle_type:<20} {len(problems):>4} {encoding:<10} {stats['num_vars']:>9} {stats['num_constrs']:>9} "
+                  f"{stats['build_time']:>9.3f} {stats['solve_time']:>9.3f} {solved:>4}")
+
+    print("-" * len(header))
+    for encoding, t in totals.items():
+        print(f"{'TOTAL':<20} {'':>4} {encoding:<10} {'':>9} {'':>9} {t['build_time']:>9.3f} {t['solve_time']:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
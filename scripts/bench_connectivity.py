@@ -0,0 +1,65 @@
+"""
+Lazy versus eager connectivity for Heyawake.
+
+Solves each instance twice: with white-cell connectivity enforced by lazy cuts
+(`LazyConnectivity`, the default) and with the full encoding added up front
+(`HeyawakeSolver.eager_connectivity = True`). Reports time, rounds and cuts.
+Instances are the solver's metadata example, or puzzle files given with -f
+(one puzzle per file, in the parser's input format).
+
+    python scripts/bench_connectivity.py
+    python scripts/bench_connectivity.py -f puzzles/*.txt -t 60
+"""
+
+import os
+import sys
+import time
+import argparse
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers.heyawake import HeyawakeSolver
+
+
+def run(params, eager: bool, max_time: float):
+    previous = HeyawakeSolver.eager_connectivity
+    HeyawakeSolver.eager_connectivity = eager
+    try:
+        tic = time.perf_counter()
+        solution_data = HeyawakeSolver(**params).solve(max_time=max_time).solution_data
+        return time.perf_counter() - tic, solution_data
+    finally:
+        HeyawakeSolver.eager_connectivity = previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lazy against eager connectivity for Heyawake.")
+    parser.add_argument("-f", "--files", nargs="*", default=[])
+    parser.add_argument("-t", "--max-time", type=float, default=30.0)
+    args = parser.parse_args()
+
+    parse = get_parser("heyawake")
+    instances = [("metadata example", HeyawakeSolver.metadata["input_example"])]
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            instances.append((os.path.basename(path), f.read()))
+
+    print(f"{'instance':<24} {'lazy (s)':>9} {'rounds':>7} {'cuts':>5} {'fallback':>9} {'eager (s)':>10} {'speedup':>8}")
+    for name, text in instances:
+        params = parse(text.strip())
+        lazy_time, lazy = run(params, False, args.max_time)
+        eager_time, eager = run(params, True, args.max_time)
+        if lazy["status"] != eager["status"]:
+            print(f"{name:<24} status differs: lazy {lazy['status']}, eager {eager['status']}")
+            continue
+        print(
+            f"{name:<24} {lazy_time:>9.3f} {lazy.get('iterations', 0):>7} {lazy['num_cuts']:>5} "
+            f"{str(lazy['eager_connectivity']):>9} {eager_time:>10.3f} {eager_time / lazy_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Import-time benchmark: cold-start cost of `import puzzlekit` and of loading solvers.
+
+Each measurement runs in a fresh interpreter. The script also checks that the heavy
+optional modules (matplotlib, the linear solver, typeguard) are not loaded by a plain
+import, and exits with status 1 on a regression, so it can run in CI.
+
+    python scripts/bench_import.py
+    python scripts/bench_import.py -n 20 --max-ms 300
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ["matplotlib", "ortools.linear_solver.pywraplp", "typeguard"]
+
+SCENARIOS = {
+    "import puzzlekit": "import puzzlekit",
+    "load sudoku solver": "import puzzlekit; puzzlekit.solvers.get_solver_class('sudoku')",
+    "load hitori solver": "import puzzlekit; puzzlekit.solvers.get_solver_class('hitori')",
+}
+
+PROBE = """
+import json, sys, time
+tic = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - tic
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(code: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.join(project_root, "src"), env.get("PYTHONPATH", "")])
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code, lazy=LAZY_MODULES)],
+        capture_output=True, text=True, check=True, env=env
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold-start import time of puzzlekit.")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="Fresh interpreters per scenario.")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail if the median of 'import puzzlekit' exceeds this many milliseconds.")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'scenario':<22} {'median(ms)':>11} {'min(ms)':>9}  lazy modules loaded")
+    for name, code in SCENARIOS.items():
+        runs = [measure(code) for _ in range(args.repeat)]
+        times = [r["elapsed"] * 1000 for r in runs]
+        loaded = runs[-1]["loaded"]
+        print(f"{name:<22} {statistics.median(times):>11.1f} {min(times):>9.1f}  {', '.join(loaded) or '-'}")
+        if name == "import puzzlekit":
+            if loaded:
+                print(f"  REGRESSION: 'import puzzlekit' loaded {loaded}")
+                failed = True
+            if args.max_ms is not None and statistics.median(times) > args.max_ms:
+                print(f"  REGRESSION: median above {args.max_ms} ms")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Per-instance overhead of input validation in solver constructors.
+
+Constructs solvers from pre-parsed input many times, with typeguard validation on
+(the default) and off (`puzzlekit.configure(validate=False)`), and reports the mean
+construction time per instance. Solving is not included.
+
+    python scripts/bench_validation.py
+    python scripts/bench_validation.py -p sudoku hitori -n 2000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import puzzlekit
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers import get_solver_class
+
+DEFAULT_TYPES = ["sudoku", "hitori", "akari", "masyu", "nurikabe", "norinori", "starbattle"]
+
+
+def time_construction(puzzle_type: str, repeat: int) -> float:
+    solver_class = get_solver_class(puzzle_type)
+    params = get_parser(puzzle_type)(solver_class.metadata["input_example"].strip())
+    solver_class(**params)  # warm-up (typeguard instruments on first call)
+    tic = time.perf_counter()
+    for _ in range(repeat):
+        solver_class(**params)
+    return (time.perf_counter() - tic) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark solver construction with and without typeguard.")
+    parser.add_argument("-p", "--puzzle", nargs="*", default=DEFAULT_TYPES)
+    parser.add_argument("-n", "--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'puzzle_type':<14} {'validate=True (us)':>19} {'validate=False (us)':>20} {'speedup':>8}")
+    for puzzle_type in args.puzzle:
+        timings = {}
+        for validate in (True, False):
+            previous = puzzlekit.configure(validate=validate)
+            try:
+                timings[validate] = time_construction(puzzle_type, args.repeat) * 1e6
+            finally:
+                puzzlekit.configure(**previous)
+        print(f"{puzzle_type:<14} {timings[True]:>19.1f} {timings[False]:>20.1f} {timings[True] / timings[False]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,11 @@ import time
 import csv
 import pkgutil
 import argparse 
+import multiprocessing
+from multiprocessing.connection import wait as mp_wait
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import statistics
 
 # --- Add project root to path ---
@@ -123,6 +126,81 @@ def run_single_benchmark(puzzle_type: str, pid: str, problem_str: str, solution_
         
     return record
 
+def _failed_record(task: Tuple[str, str, str, str], status: str, error_msg: str) -> Dict[str, Any]:
+    puzzle_type, pid, _, _ = task
+    return {
+        "puzzle_type": puzzle_type, "pid": pid, "status": status,
+        "is_correct": "N/A", "total_time": 0.0, "error_msg": error_msg
+    }
+
+def _benchmark_worker(conn, task: Tuple[str, str, str, str]):
+    """Child process entry: run one instance and ship the record back through the pipe."""
+    try:
+        conn.send(run_single_benchmark(*task))
+    finally:
+        conn.close()
+
+def run_benchmarks_parallel(tasks: List[Tuple[str, str, str, str]], jobs: int, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Run benchmark tasks, one child process per instance, at most `jobs` at a time.
+    
+    Every instance gets its own process so that a crashed or hung CP-SAT call
+    only takes down that process: it is killed once it exceeds `timeout` seconds
+    of wall-clock time and reported as 'Timeout' (or 'Error' if it died).
+    
+    Args:
+        tasks: (puzzle_type, pid, problem_str, solution_str) tuples.
+        jobs: Maximum number of concurrent worker processes.
+        timeout: Per-instance wall-clock budget in seconds. None means unlimited.
+    
+    Returns:
+        Records sorted by (puzzle_type, pid), so output is deterministic.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    pending = deque(tasks)
+    running = {}  # recv_conn -> (process, task, deadline)
+    results = []
+    
+    while pending or running:
+        while pending and len(running) < jobs:
+            task = pending.popleft()
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_benchmark_worker, args=(send_conn, task), daemon=True)
+            proc.start()
+            send_conn.close()
+            deadline = time.monotonic() + timeout if timeout else None
+            running[recv_conn] = (proc, task, deadline)
+        
+        deadlines = [d for _, _, d in running.values() if d is not None]
+        wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        
+        for conn in mp_wait(list(running.keys()), timeout=wait_for):
+            proc, task, _ = running.pop(conn)
+            try:
+                record = conn.recv()
+            except EOFError:
+                proc.join()
+                record = _failed_record(task, "Error", f"Worker crashed (exit code {proc.exitcode})")
+            conn.close()
+            proc.join()
+            results.append(record)
+        
+        now = time.monotonic()
+        for conn, (proc, task, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                proc.kill()
+                proc.join()
+                conn.close()
+                running.pop(conn)
+                results.append(_failed_record(task, "Timeout", f"Exceeded wall-clock budget of {timeout:.1f} s"))
+        
+        done = len(tasks) - len(pending) - len(running)
+        print(f"\r  Progress: {done}/{len(tasks)} instances", end="", flush=True)
+    
+    print()
+    return sorted(results, key=lambda r: (r["puzzle_type"], r["pid"]))
+
 def parse_args():
     parser = argparse.ArgumentParser(description="PuzzleKit Benchmark Tool (supports _dataset.json format).")
     
@@ -135,6 +213,10 @@ def parse_args():
     
     parser.add_argument("--skip", type=str, default="",
                         help="Comma-separated list of puzzle names to skip (e.g., 'Nurikabe,Fillomino').")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of worker processes. Each instance runs in its own process when > 1.")
+    parser.add_argument("-t", "--timeout", type=float, default=None,
+                        help="Per-instance wall-clock budget in seconds; a worker exceeding it is killed. Implies process isolation.")
     return parser.parse_args()
 
 def main():
@@ -191,7 +273,14 @@ def main():
     
     print(f"Results will be saved to: {OUTPUT_CSV}")
 
-    # Iterate over puzzle types
+    use_workers = args.jobs > 1 or args.timeout is not None
+    if use_workers:
+        budget = f"{args.timeout:.1f} s" if args.timeout is not None else "unlimited"
+        print(f"Running with {max(1, args.jobs)} worker process(es), per-instance budget: {budget}")
+
+    # --- Pass 1: collect puzzle types and their instances ---
+    entries = []
+    all_tasks = []
     for idx, folder_name in enumerate(sorted_assets, 1):
         # Match solver class name
         puzzle_type = None
@@ -241,23 +330,48 @@ def main():
             except (ValueError, AttributeError):
                 pass
 
-        # Run benchmarks if solver exists and data available
+        tasks = []
         if has_solver_impl and num_pbl > 0:
-            print(f"[{idx}/{len(sorted_assets)}] Benchmarking {folder_name} ({num_pbl} instances)...")
-            
-            times = []
-            corrects = 0
-            
             for pid, p_data in puzzles_dict.items():
                 problem_str = p_data.get("problem", "")
                 solution_str = p_data.get("solution", "")  # May be empty string
-                
-                # Run benchmark for this instance
-                res = run_single_benchmark(puzzle_type, pid, problem_str, solution_str)
+                tasks.append((puzzle_type, pid, problem_str, solution_str))
+        all_tasks.extend(tasks)
+        entries.append((idx, folder_name, puzzle_type, num_pbl, num_sol, max_size, solver_status, tasks))
+
+    # --- Pass 2: run instances ---
+    records_by_type: Dict[str, List[Dict[str, Any]]] = {}
+    if use_workers:
+        print(f"Benchmarking {len(all_tasks)} instances...")
+        for res in run_benchmarks_parallel(all_tasks, max(1, args.jobs), args.timeout):
+            records_by_type.setdefault(res["puzzle_type"], []).append(res)
+    else:
+        for idx, folder_name, puzzle_type, num_pbl, _, _, _, tasks in entries:
+            if not tasks:
+                continue
+            print(f"[{idx}/{len(sorted_assets)}] Benchmarking {folder_name} ({num_pbl} instances)...")
+            # Run benchmark for each instance; write each row as it finishes, so an
+            # interrupted run keeps what it has done.
+            records = records_by_type.setdefault(puzzle_type, [])
+            for task in tasks:
+                res = run_single_benchmark(*task)
                 writer.writerow(res)
+                csv_file.flush()
+                records.append(res)
+
+    # --- Pass 3: aggregate per puzzle type ---
+    for idx, folder_name, puzzle_type, num_pbl, num_sol, max_size, solver_status, tasks in entries:
+        if tasks:
+            times = []
+            corrects = 0
+            
+            for res in records_by_type.get(puzzle_type, []):
+                if use_workers:
+                    # Parallel results arrive out of order; they are written sorted here.
+                    writer.writerow(res)
                 
                 # Collect timing stats for non-error runs
-                if res['status'] not in ["Error", "NotStarted"]:
+                if res['status'] not in ["Error", "NotStarted", "Timeout"]:
                     times.append(res['total_time'])
                 
                 # Count correct solutions (only when verification was performed)
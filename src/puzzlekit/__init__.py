@@ -1,10 +1,22 @@
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, Optional
 from puzzlekit.solvers import get_solver_class
 from puzzlekit.parsers.registry import get_parser 
+from puzzlekit.batch import solve_many
+from puzzlekit.cache import SolutionCache
+from puzzlekit.session import PuzzleSession
+from puzzlekit.config import configure
 
 def solve(
     source: Union[str, Dict[str, Any]], 
     puzzle_type: str, 
+    max_time: Optional[float] = None,
+    num_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    sat_params: Optional[Dict[str, Any]] = None,
+    slim: bool = False,
+    profile_build: bool = False,
+    cache: Optional[SolutionCache] = None,
+    count_solutions: Optional[int] = None,
     **kwargs
 ) -> Any:
     """
@@ -15,7 +27,16 @@ def solve(
             - A string containing the raw puzzle data (with headers, e.g. "9 9\n...").
             - A dictionary (pre-parsed data).
         puzzle_type: The snake_case type name (e.g., 'akari', 'fuzuli').
-        show: Whether to visualize the result.
+        max_time: Time limit in seconds for the search (SCIP: shared by all cut rounds).
+        num_workers: Number of search workers / threads.
+        seed: Random seed for the underlying solver.
+        sat_params: Extra backend parameters by name (CP-SAT `SatParameters` fields, or SCIP parameters).
+        slim: Keep only the parsed input in `result.puzzle_data` and release the model and solver.
+        profile_build: Report per-step model build timings in `solution_data['build_profile']`.
+        cache: A `SolutionCache`. A puzzle already in it is returned without building or solving
+            a model; either way `solution_data['cache_hit']` tells whether it was found.
+        count_solutions: Search for up to this many distinct solutions and report
+            `solution_data['num_solutions']` and `['is_unique']` (2 checks uniqueness).
         **kwargs: Overrides for solver parameters.
     """
     
@@ -48,13 +69,24 @@ def solve(
         raise ValueError(f"Unknown puzzle type '{puzzle_type}'.") from e
 
 
-    solver_instance = SolverClass(**init_params)
-    
-    result = solver_instance.solve()
+    def compute():
+        solver_instance = SolverClass(**init_params)
+        return solver_instance.solve(
+            max_time=max_time, 
+            num_workers=num_workers, 
+            seed=seed, 
+            sat_params=sat_params,
+            slim=slim,
+            profile_build=profile_build,
+            count_solutions=count_solutions
+        )
     
-    return result
+    if cache is not None:
+        variant = "" if count_solutions is None else f"count={count_solutions}"
+        return cache.lookup(puzzle_type, init_params, compute, variant=variant)
+    return compute()
 
-def solver(puzzle_type: str, data: Dict[str, Any] = None, **kwargs) -> Any:
+def solver(puzzle_type: str, data: Dict[str, Any] = None, cache: Optional[SolutionCache] = None, **kwargs) -> Any:
     # return solve(source=data, puzzle_type=puzzle_type, **kwargs)
     init_params = {}
     
@@ -69,7 +101,18 @@ def solver(puzzle_type: str, data: Dict[str, Any] = None, **kwargs) -> Any:
         SolverClass = get_solver_class(puzzle_type)
     except ValueError as e:
         raise ValueError(f"Unknown puzzle type '{puzzle_type}'.") from e
-    return SolverClass(**init_params)
+    solver_instance = SolverClass(**init_params)
+    if cache is not None:
+        # solver_instance.solve() now answers from the cache when it can.
+        cache.bind(solver_instance, puzzle_type, init_params)
+    return solver_instance
+
+def __getattr__(name: str) -> Any:
+    # The asyncio API is loaded on first use: importing asyncio would double the import time.
+    if name in ("solve_async", "solve_many_async"):
+        from puzzlekit import aio
+        return getattr(aio, name)
+    raise AttributeError(f"module 'puzzlekit' has no attribute '{name}'")
 
-__all__ = ["solve", "solver"]
+__all__ = ["solve", "solver", "solve_many", "solve_async", "solve_many_async", "SolutionCache", "PuzzleSession", "configure"]
 __version__ = '0.3.2'
\ No newline at end of file
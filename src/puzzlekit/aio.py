@@ -0,0 +1,182 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+from puzzlekit.batch import Source, _error_result, _make_state, _parse_source
+from puzzlekit.core.result import PuzzleResult
+
+
+class _StopHandle:
+    """
+    Links an awaiting coroutine to the solver instance running in a worker thread,
+    so that cancelling the coroutine can interrupt the search.
+    """
+    POLL_INTERVAL = 0.02
+
+    def __init__(self):
+        self.instance = None
+        self.stopped = threading.Event()
+        self.finished = threading.Event()
+
+    def _interrupt(self):
+        backend = getattr(self.instance, "solver", None)
+        # CP-SAT: StopSearch; pywraplp (IterativePuzzleSolver): InterruptSolve.
+        stop = getattr(backend, "StopSearch", None) or getattr(backend, "InterruptSolve", None)
+        if stop is not None:
+            stop()
+
+    def _stop_until_finished(self):
+        # The backend solver may not exist yet, or Solve may not have started: keep
+        # asking until the worker returns.
+        while not self.finished.wait(self.POLL_INTERVAL):
+            self._interrupt()
+
+    def stop(self):
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        threading.Thread(target=self._stop_until_finished, daemon=True).start()
+
+
+def _solve_task(
+    handle: Optional[_StopHandle],
+    source: Source,
+    puzzle_type: str,
+    solve_options: Dict[str, Any],
+    overrides: Dict[str, Any]
+) -> PuzzleResult:
+    """Parse, build and solve one puzzle in an executor. Raises like `puzzlekit.solve`."""
+    try:
+        state = _make_state(puzzle_type, solve_options, overrides)
+        init_params = _parse_source(source, state)
+        if handle is not None and handle.stopped.is_set():
+            raise asyncio.CancelledError()
+        instance = state["solver_class"](**init_params)
+        if handle is None:
+            # Process pools: only the parsed input can be pickled back.
+            result = instance.solve(**dict(solve_options, slim=True))
+            return PuzzleResult(puzzle_type=puzzle_type, puzzle_data=init_params, solution_data=result.solution_data)
+        handle.instance = instance
+        return instance.solve(**solve_options)
+    finally:
+        if handle is not None:
+            handle.finished.set()
+
+
+async def _run(
+    executor: Optional[Executor],
+    source: Source,
+    puzzle_type: str,
+    solve_options: Dict[str, Any],
+    overrides: Dict[str, Any]
+) -> PuzzleResult:
+    loop = asyncio.get_running_loop()
+    handle = None if isinstance(executor, ProcessPoolExecutor) else _StopHandle()
+    future = loop.run_in_executor(executor, _solve_task, handle, source, puzzle_type, solve_options, overrides)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        if handle is not None:
+            handle.stop()
+        raise
+
+
+async def solve_async(
+    source: Source,
+    puzzle_type: str,
+    max_time: Optional[float] = None,
+    num_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    sat_params: Optional[Dict[str, Any]] = None,
+    slim: bool = False,
+    count_solutions: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **kwargs
+) -> PuzzleResult:
+    """
+    Awaitable `puzzlekit.solve`: parsing, model build and search run in `executor`,
+    so the event loop stays responsive (CP-SAT releases the GIL while searching).
+
+    Args:
+        executor: Where to run. None uses the loop's default thread pool. With a thread
+            pool, cancelling the awaiting task interrupts the running search
+            (`CpSolver.StopSearch`). With a ProcessPoolExecutor, results come back
+            slim, and cancelling only drops a task that has not started yet.
+        Other arguments: as for `puzzlekit.solve`.
+
+    Usage:
+        res = await puzzlekit.solve_async(problem_str, "nurikabe", max_time=30)
+    """
+    solve_options = dict(
+        max_time=max_time, num_workers=num_workers, seed=seed, sat_params=sat_params,
+        slim=slim, count_solutions=count_solutions
+    )
+    # Resolve before submitting, so that an unknown type fails in the caller.
+    _make_state(puzzle_type, solve_options, kwargs)
+    return await _run(executor, source, puzzle_type, solve_options, kwargs)
+
+
+async def _run_guarded(executor, source, puzzle_type, solve_options, overrides) -> PuzzleResult:
+    try:
+        return await _run(executor, source, puzzle_type, solve_options, overrides)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        return _error_result(puzzle_type, f"{type(e).__name__}: {e}")
+
+
+async def solve_many_async(
+    sources: Iterable[Source],
+    puzzle_type: str,
+    concurrency: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    max_time: Optional[float] = None,
+    num_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    sat_params: Optional[Dict[str, Any]] = None,
+    **kwargs
+) -> AsyncIterator[PuzzleResult]:
+    """
+    Solve many puzzles of one type concurrently, yielding results as they complete.
+
+    At most `concurrency` puzzles (default: os.cpu_count()) are in flight, and `sources`
+    is consumed lazily. Results come back slim. As in `solve_many`, a puzzle that fails
+    gives a result with status 'Error' instead of raising. Leaving the loop early, or
+    cancelling the consuming task, interrupts the searches still running.
+
+    Usage:
+        async for res in puzzlekit.solve_many_async(problem_strs, "masyu", concurrency=8):
+            print(res.solution_data["status"])
+    """
+    if concurrency is None:
+        concurrency = os.cpu_count() or 1
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    if concurrency > 1 and num_workers is None:
+        num_workers = 1
+    solve_options = dict(max_time=max_time, num_workers=num_workers, seed=seed, sat_params=sat_params, slim=True)
+    _make_state(puzzle_type, solve_options, kwargs)
+
+    it = iter(sources)
+    exhausted = False
+    pending = set()
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    source = next(it)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run_guarded(executor, source, puzzle_type, solve_options, kwargs)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,193 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from puzzlekit.config import configure, get_config
+from puzzlekit.core.grid import Grid
+from puzzlekit.core.result import PuzzleResult
+from puzzlekit.parsers.registry import get_parser
+from puzzlekit.solvers import get_solver_class
+
+Source = Union[str, Dict[str, Any]]
+
+# Per-process state, filled once by `_init_worker` so that every task in a
+# worker reuses the same parser, solver class and options.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _resolve(puzzle_type: str) -> Tuple[Callable[[str], Dict[str, Any]], Type]:
+    try:
+        solver_class = get_solver_class(puzzle_type)
+    except ValueError as e:
+        raise ValueError(f"Unknown puzzle type '{puzzle_type}'.") from e
+    return get_parser(puzzle_type), solver_class
+
+
+def _make_state(puzzle_type: str, solve_options: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    parser, solver_class = _resolve(puzzle_type)
+    return {
+        "puzzle_type": puzzle_type,
+        "parser": parser,
+        "solver_class": solver_class,
+        "solve_options": solve_options,
+        "overrides": overrides,
+    }
+
+
+def _init_worker(puzzle_type: str, solve_options: Dict[str, Any], overrides: Dict[str, Any], config: Dict[str, Any]):
+    # Spawned workers do not inherit the parent's configure() call.
+    configure(**config)
+    _WORKER_STATE.update(_make_state(puzzle_type, solve_options, overrides))
+
+
+def _error_result(puzzle_type: str, message: str) -> PuzzleResult:
+    return PuzzleResult(
+        puzzle_type=puzzle_type,
+        puzzle_data={},
+        solution_data={
+            "status": "Error",
+            "error_msg": message,
+            "solution_grid": Grid.empty(),
+            "cpu_time": 0.0,
+            "build_time": 0.0,
+        }
+    )
+
+
+def _parse_source(source: Source, state: Dict[str, Any]) -> Dict[str, Any]:
+    """Solver constructor arguments for a raw string or pre-parsed dict, with overrides applied."""
+    puzzle_type = state["puzzle_type"]
+    if isinstance(source, dict):
+        init_params = source.copy()
+    elif isinstance(source, str):
+        init_params = state["parser"](source.strip())
+        if init_params is None:
+            raise ValueError(f"Parser returned None for type '{puzzle_type}'")
+    else:
+        raise TypeError(f"Source must be dict or raw string, got {type(source)}")
+    init_params.update(state["overrides"])
+    return init_params
+
+
+def _solve_one(source: Source, state: Dict[str, Any]) -> PuzzleResult:
+    puzzle_type = state["puzzle_type"]
+    try:
+        init_params = _parse_source(source, state)
+        result = state["solver_class"](**init_params).solve(slim=True, **state["solve_options"])
+    except Exception as e:
+        return _error_result(puzzle_type, f"{type(e).__name__}: {e}")
+
+    # Only the parsed input travels back: it is all the visualizer needs and,
+    # unlike the solver state, it can be pickled across processes.
+    # (slim=True above already released the model and solver.)
+    return PuzzleResult(
+        puzzle_type=puzzle_type,
+        puzzle_data=init_params,
+        solution_data=result.solution_data
+    )
+
+
+def _solve_chunk(chunk: List[Source]) -> List[PuzzleResult]:
+    return [_solve_one(source, _WORKER_STATE) for source in chunk]
+
+
+def _chunked(sources: Iterable[Source], chunk_size: int) -> Iterator[List[Source]]:
+    it = iter(sources)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_many(
+    sources: Iterable[Source],
+    puzzle_type: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 1,
+    ordered: bool = True,
+    max_time: Optional[float] = None,
+    num_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    sat_params: Optional[Dict[str, Any]] = None,
+    **kwargs
+) -> Iterator[PuzzleResult]:
+    """
+    Solve many puzzles of the same type, streaming results back as a generator.
+
+    The parser and solver class are resolved once per worker process, and the
+    workers are reused for all instances. `sources` is consumed lazily, with at
+    most a few chunks per worker in flight, so it may be an unbounded stream.
+
+    Args:
+        sources: Raw puzzle strings and/or pre-parsed dicts.
+        puzzle_type: The snake_case type name (e.g., 'akari', 'fuzuli').
+        workers: Number of worker processes. None uses os.cpu_count(); 0 or 1 solves in the calling process.
+        chunk_size: Number of instances sent to a worker per task.
+        ordered: Yield results in input order. If False, yield them as they complete.
+        max_time, num_workers, seed, sat_params: Passed to `solve()` of every instance.
+            With several worker processes, num_workers defaults to 1 to avoid oversubscribing cores.
+        **kwargs: Overrides for solver parameters, applied to every instance.
+
+    Returns:
+        An iterator of PuzzleResult, one per instance. Instances that fail to parse
+        or solve give a result with status 'Error' and the message in solution_data['error_msg'].
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and num_workers is None:
+        num_workers = 1
+    solve_options = dict(max_time=max_time, num_workers=num_workers, seed=seed, sat_params=sat_params)
+
+    # Resolve eagerly, so that an unknown type fails here rather than on first iteration.
+    state = _make_state(puzzle_type, solve_options, kwargs)
+    if workers <= 1:
+        return (_solve_one(source, state) for source in sources)
+    return _iter_pool(sources, puzzle_type, solve_options, kwargs, workers, chunk_size, ordered)
+
+
+def _iter_pool(
+    sources: Iterable[Source],
+    puzzle_type: str,
+    solve_options: Dict[str, Any],
+    overrides: Dict[str, Any],
+    workers: int,
+    chunk_size: int,
+    ordered: bool
+) -> Iterator[PuzzleResult]:
+    max_in_flight = workers * 2
+    chunks = _chunked(sources, chunk_size)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(puzzle_type, solve_options, overrides, get_config())
+    )
+    try:
+        if ordered:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(executor.submit(_solve_chunk, chunk))
+                if len(in_flight) >= max_in_flight:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+        else:
+            in_flight = set()
+            exhausted = False
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                    else:
+                        in_flight.add(executor.submit(_solve_chunk, chunk))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
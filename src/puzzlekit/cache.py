@@ -0,0 +1,221 @@
+import json
+import sqlite3
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from puzzlekit.core.grid import Grid
+from puzzlekit.core.position import Position
+from puzzlekit.core.result import PuzzleResult
+from puzzlekit.symmetry import canonicalize
+
+# Results that do not depend on the time budget; 'Unknown' and errors are never stored.
+CACHEABLE_STATUSES = ("Optimal", "Feasible", "Infeasible")
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Grid):
+        return value.matrix
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, Position):
+        return [value.r, value.c]
+    raise TypeError(f"Cannot use {type(value).__name__} in a cache key")
+
+
+def _solver_version(puzzle_type: str) -> str:
+    from puzzlekit import __version__
+    from puzzlekit.solvers import _SOLVER_META
+    module_name, class_name = _SOLVER_META.get(puzzle_type, ("", ""))
+    return f"{__version__}:{module_name}.{class_name}"
+
+
+def cache_key(puzzle_type: str, init_params: Dict[str, Any], variant: str = "") -> str:
+    """
+    Content hash of a puzzle: (puzzle_type, parsed input, solver version).
+
+    The input is serialized with sorted keys, tuples as lists and Grids as matrices,
+    so the raw string and an equivalent pre-parsed dict give the same key.
+    `variant` separates entries stored in different frames (e.g. 'canonical').
+    """
+    payload = json.dumps(
+        [puzzle_type, _solver_version(puzzle_type), variant, init_params],
+        sort_keys=True, separators=(",", ":"), default=_normalize
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _encode(solution_data: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe copy of solution_data; the grid is kept as its matrix."""
+    record = {}
+    for key, value in solution_data.items():
+        if key == "solution_grid":
+            value = value.matrix if isinstance(value, Grid) else []
+        elif key == "cache_hit":
+            continue
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        record[key] = value
+    return record
+
+
+def _decode(record: Dict[str, Any]) -> Dict[str, Any]:
+    solution_data = dict(record)
+    matrix = solution_data.get("solution_grid") or []
+    solution_data["solution_grid"] = Grid([list(row) for row in matrix]) if matrix else Grid.empty()
+    return solution_data
+
+
+class SolutionCache:
+    """
+    Two-tier cache of solved puzzles, keyed by `cache_key`.
+
+    The memory tier is an LRU of at most `max_entries` results. If `path` is given,
+    results are also written to a sqlite file there (zlib-compressed JSON), which
+    survives restarts and can be shared by several processes. A disk hit is promoted
+    to the memory tier.
+
+    Usage:
+        cache = SolutionCache(max_entries=4096, path="solutions.sqlite")
+        res = puzzlekit.solve(problem_str, "sudoku", cache=cache)
+        res.solution_data['cache_hit']  # False on the first call, True afterwards
+
+    With `canonical=True`, puzzles are keyed by their canonical form under the
+    type's symmetries (see `puzzlekit.symmetry`), so a rotated, mirrored or
+    relabeled copy of a solved puzzle is a hit; its solution is mapped back.
+
+    Only Optimal/Feasible/Infeasible results are stored. For a puzzle with several
+    solutions, a hit returns whichever one was stored first, regardless of seed.
+    """
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None, canonical: bool = False):
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = path
+        self.canonical = canonical
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The stored solution_data for `key` (a fresh copy), or None."""
+        with self._lock:
+            record = self._memory.get(key)
+            if record is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return _decode(record)
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM solutions WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    record = json.loads(zlib.decompress(row[0]))
+                    self._remember(key, record)
+                    self._stats["disk_hits"] += 1
+                    return _decode(record)
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key: str, solution_data: Dict[str, Any]) -> bool:
+        """Store a result. Returns False (and stores nothing) if its status is not cacheable."""
+        if solution_data.get("status") not in CACHEABLE_STATUSES:
+            return False
+        record = _encode(solution_data)
+        with self._lock:
+            self._remember(key, record)
+            if self._db is not None:
+                blob = zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+                self._db.execute("INSERT OR REPLACE INTO solutions (key, value) VALUES (?, ?)", (key, blob))
+                self._db.commit()
+        return True
+
+    def _remember(self, key: str, record: Dict[str, Any]):
+        if self.max_entries == 0:
+            return
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def lookup(
+        self,
+        puzzle_type: str,
+        init_params: Dict[str, Any],
+        compute: Callable[[], PuzzleResult],
+        variant: str = ""
+    ) -> PuzzleResult:
+        """
+        Return the cached result for this puzzle, or call `compute()` and store its result.
+        `solution_data['cache_hit']` tells which one happened. Inputs that cannot be
+        serialized into a key are solved without the cache. `variant` keeps results of
+        different kinds of solve apart (e.g. with solution counting).
+        """
+        form = None
+        try:
+            if self.canonical:
+                form = canonicalize(puzzle_type, init_params)
+                key = cache_key(puzzle_type, form.params, variant="canonical" + variant)
+            else:
+                key = cache_key(puzzle_type, init_params, variant=variant)
+        except (TypeError, ValueError, KeyError):
+            result = compute()
+            result.solution_data["cache_hit"] = False
+            return result
+        solution_data = self.get(key)
+        if solution_data is not None:
+            if form is not None:
+                solution_data["solution_grid"] = form.from_canonical_solution(solution_data["solution_grid"])
+            solution_data["cache_hit"] = True
+            return PuzzleResult(puzzle_type=puzzle_type, puzzle_data=dict(init_params), solution_data=solution_data)
+        result = compute()
+        stored = result.solution_data
+        if form is not None and isinstance(stored.get("solution_grid"), Grid):
+            stored = dict(stored, solution_grid=form.to_canonical_solution(stored["solution_grid"]))
+        self.put(key, stored)
+        result.solution_data["cache_hit"] = False
+        return result
+
+    def bind(self, solver_instance: Any, puzzle_type: str, init_params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Route `solver_instance.solve(...)` through this cache (see `puzzlekit.solver`).
+        The key is built from `init_params`, the arguments the instance was constructed
+        with; if omitted, the arguments the instance recorded are used.
+        """
+        solve = solver_instance.solve
+        if init_params is None:
+            init_params = solver_instance._input_data()
+
+        def cached_solve(*args, **kwargs) -> PuzzleResult:
+            count = kwargs.get("count_solutions")
+            variant = "" if count is None else f"count={count}"
+            return self.lookup(puzzle_type, init_params, lambda: solve(*args, **kwargs), variant=variant)
+
+        solver_instance.solve = cached_solve
+        return solver_instance
+
+    def clear(self, disk: bool = False):
+        """Drop the memory tier, and the disk tier too if `disk` is True."""
+        with self._lock:
+            self._memory.clear()
+            if disk and self._db is not None:
+                self._db.execute("DELETE FROM solutions")
+                self._db.commit()
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, size=len(self._memory), max_entries=self.max_entries)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
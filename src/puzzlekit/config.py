@@ -0,0 +1,47 @@
+import os
+from typing import Any, Dict, Optional
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off", "")
+
+# Process-wide settings. They can also be set with PUZZLEKIT_VALIDATE=0 / PUZZLEKIT_DEBUG_NAMES=1 / PUZZLEKIT_PRESOLVE=0
+# (e.g. for worker processes that do not inherit the parent's configure() call).
+_SETTINGS: Dict[str, Any] = {
+    "validate": _env_flag("PUZZLEKIT_VALIDATE", True),
+    "debug_names": _env_flag("PUZZLEKIT_DEBUG_NAMES", False),
+    "presolve": _env_flag("PUZZLEKIT_PRESOLVE", True),
+}
+
+
+def configure(validate: Optional[bool] = None, debug_names: Optional[bool] = None,
+              presolve: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Change global settings; arguments left as None are unchanged.
+
+    Args:
+        validate: Run typeguard's runtime type checks on solver constructors (default True).
+            With False, constructors only run their own `validate_input` pass, which still
+            rejects malformed grids but not e.g. a tuple where a list was declared.
+        debug_names: Give CP-SAT variables readable names (default False). Off, variables
+            are created unnamed and their name templates are never formatted.
+        presolve: Run the solvers' propagation rules before building models (default True),
+            fixing the deduced cells as constants. See `puzzlekit.core.presolve`.
+
+    Returns:
+        The previous settings, so they can be restored with `configure(**previous)`.
+    """
+    previous = dict(_SETTINGS)
+    if validate is not None:
+        _SETTINGS["validate"] = bool(validate)
+    if debug_names is not None:
+        _SETTINGS["debug_names"] = bool(debug_names)
+    if presolve is not None:
+        _SETTINGS["presolve"] = bool(presolve)
+    return previous
+
+
+def get_config() -> Dict[str, Any]:
+    return dict(_SETTINGS)
@@ -0,0 +1,143 @@
+from typing import Any, Callable, Dict, Generator, Hashable, List, Tuple
+import numpy as np
+from puzzlekit.core.grid import Grid
+from puzzlekit.core.position import Position
+
+
+def _code_dtype(num_symbols: int):
+    if num_symbols <= 1 << 8:
+        return np.uint8
+    if num_symbols <= 1 << 16:
+        return np.uint16
+    return np.uint32
+
+
+class ArrayGrid(Grid):
+    """
+    Grid backed by a compact NumPy array of symbol codes.
+
+    Each cell stores a small integer code into a symbol table (e.g. ['-', 'x']),
+    so a grid over a small alphabet takes one byte per cell, and whole-grid
+    operations (masks, counts, comparisons) run as array operations instead of
+    Python loops. The public API matches Grid; note that `matrix` returns a
+    decoded copy, so cells must be written through `set_value`.
+    """
+    def __init__(self, matrix: list[list[Hashable]]):
+        rows = matrix if matrix is not None else []
+        index: Dict[Hashable, int] = {}
+        codes = [[index.setdefault(cell, len(index)) for cell in row] for row in rows]
+        try:
+            self._codes = np.array(codes, dtype=_code_dtype(len(index)))
+        except ValueError as e:
+            raise ValueError(f"ArrayGrid requires a rectangular matrix: {e}") from e
+        if self._codes.ndim != 2:
+            self._codes = self._codes.reshape(len(rows), 0)
+        self._index = index
+        self._symbols: List[Hashable] = list(index)
+        self.num_rows, self.num_cols = self._codes.shape
+        self._walls = set()
+        self._neighbor_tables = {}
+
+    @staticmethod
+    def from_grid(grid: Grid) -> 'ArrayGrid':
+        if isinstance(grid, ArrayGrid):
+            return grid
+        return ArrayGrid(grid.matrix)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """2D array of symbol codes; `symbols[codes[r, c]]` is the cell value."""
+        return self._codes
+
+    @property
+    def symbols(self) -> List[Hashable]:
+        return self._symbols
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._codes.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self._codes.nbytes
+
+    @property
+    def matrix(self):
+        return self.to_numpy().tolist()
+
+    @property
+    def _matrix(self):
+        # Base class helpers read `_matrix` directly.
+        return self.matrix
+
+    def to_numpy(self) -> np.ndarray:
+        """Decoded cell values as an object array."""
+        return self.map_symbols(lambda s: s)
+
+    def map_symbols(self, fn: Callable[[Hashable], Any], dtype=object) -> np.ndarray:
+        """
+        Apply `fn` to every cell value, calling it once per distinct symbol.
+        e.g. grid.map_symbols(str.isdigit, bool) -> boolean mask of digit cells.
+        """
+        table = np.empty(len(self._symbols), dtype=dtype)
+        for code, symbol in enumerate(self._symbols):
+            table[code] = fn(symbol)
+        return table[self._codes]
+
+    def mask(self, value: Hashable) -> np.ndarray:
+        """Boolean array, True where the cell equals `value`."""
+        code = self._index.get(value)
+        if code is None:
+            return np.zeros(self._codes.shape, dtype=bool)
+        return self._codes == code
+
+    def count(self, value: Hashable) -> int:
+        return int(np.count_nonzero(self.mask(value)))
+
+    def value(self, r, c = None):
+        if isinstance(r, Position):
+            return self._symbols[self._codes[r.r, r.c]]
+        return self._symbols[self._codes[r, c]]
+
+    def set_value(self, position: Position, value):
+        code = self._index.get(value)
+        if code is None:
+            code = len(self._symbols)
+            self._index[value] = code
+            self._symbols.append(value)
+            dtype = _code_dtype(len(self._symbols))
+            if dtype != self._codes.dtype:
+                self._codes = self._codes.astype(dtype)
+        self._codes[position.r, position.c] = code
+
+    def __getitem__(self, key):
+        if isinstance(key, Position):
+            return self.value(key)
+        if isinstance(key, tuple):
+            return self.value(key[0], key[1])
+        return [self._symbols[code] for code in self._codes[key].tolist()]
+
+    def __iter__(self) -> Generator[tuple[Position, Any], None, None]:
+        symbols = self._symbols
+        for r, row in enumerate(self._codes.tolist()):
+            for c, code in enumerate(row):
+                yield Position(r, c), symbols[code]
+
+    def __eq__(self, other):
+        if not issubclass(type(other), Grid):
+            return False
+        if not isinstance(other, ArrayGrid):
+            return self.matrix == other.matrix
+        if self.shape != other.shape:
+            return False
+        # Translate our codes into the other grid's codes (-1 if the symbol is absent there).
+        lut = np.array([other._index.get(s, -1) for s in self._symbols] or [-1], dtype=np.int64)
+        return bool(np.array_equal(lut[self._codes], other._codes))
+
+    def __hash__(self):
+        return hash(str(self.matrix))
+
+    def __repr__(self) -> str:
+        if self.is_empty():
+            return "Grid.empty()"
+        return f"{self.num_rows} {self.num_cols}\n" + "\n".join(" ".join(str(cell) for cell in row) for row in self.matrix)
@@ -0,0 +1,89 @@
+import time
+from typing import Any, Dict, Tuple
+
+class BuildProfiler:
+    """
+    Opt-in instrumentation of a solver's model build.
+
+    While active, every `_add_*` / `_setup_*` method of the solver (except `_add_constr`
+    itself, whose total is `build_time`) is wrapped to record its call count, wall time,
+    and the number of variables and constraints it added to the model. Figures are
+    inclusive: a step that calls another step also counts the inner one.
+
+    Usage:
+        with BuildProfiler(solver) as profiler:
+            solver._add_constr()
+        profile = profiler.report(build_time)
+    """
+    PREFIXES = ("_add_", "_setup_")
+    EXCLUDED = ("_add_constr",)
+
+    def __init__(self, solver: Any, enabled: bool = True):
+        self.solver = solver
+        self.enabled = enabled
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._depth = 0
+        self._top_level_time = 0.0
+        self._wrapped = []
+
+    def _model_size(self) -> Tuple[Any, int, int]:
+        model = getattr(self.solver, "model", None)
+        if model is not None and hasattr(model, "Proto"):
+            proto = model.Proto()
+            return model, len(proto.variables), len(proto.constraints)
+        backend = getattr(self.solver, "solver", None)
+        if backend is not None and hasattr(backend, "NumConstraints"):
+            # MIP backend (IterativePuzzleSolver)
+            return backend, backend.NumVariables(), backend.NumConstraints()
+        return None, 0, 0
+
+    def _wrap(self, name: str, method):
+        def profiled(*args, **kwargs):
+            before_model, before_vars, before_constrs = self._model_size()
+            self._depth += 1
+            tic = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - tic
+                self._depth -= 1
+                after_model, after_vars, after_constrs = self._model_size()
+                if after_model is not before_model:
+                    # The step created the model itself.
+                    before_vars, before_constrs = 0, 0
+                stats = self.steps.setdefault(name, {"calls": 0, "time": 0.0, "num_vars": 0, "num_constrs": 0})
+                stats["calls"] += 1
+                stats["time"] += elapsed
+                stats["num_vars"] += after_vars - before_vars
+                stats["num_constrs"] += after_constrs - before_constrs
+                if self._depth == 0:
+                    self._top_level_time += elapsed
+        return profiled
+
+    def __enter__(self) -> 'BuildProfiler':
+        if not self.enabled:
+            return self
+        for name in dir(type(self.solver)):
+            if not name.startswith(self.PREFIXES) or name in self.EXCLUDED:
+                continue
+            method = getattr(self.solver, name, None)
+            if callable(method):
+                setattr(self.solver, name, self._wrap(name, method))
+                self._wrapped.append(name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Drop the instance-level wrappers, the class methods show through again.
+        for name in self._wrapped:
+            self.solver.__dict__.pop(name, None)
+        self._wrapped = []
+        return False
+
+    def report(self, build_time: float) -> Dict[str, Any]:
+        """Per-step stats sorted by time, plus the build time not spent in any step."""
+        steps = dict(sorted(self.steps.items(), key=lambda item: item[1]["time"], reverse=True))
+        return {
+            "steps": steps,
+            "total_time": build_time,
+            "other_time": max(0.0, build_time - self._top_level_time),
+        }
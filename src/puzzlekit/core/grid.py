@@ -13,6 +13,7 @@ class Grid(Generic[T]):
         except (TypeError, IndexError):
             self.num_cols = 0
         self._walls : set[FrozenSet[Position]] = set()
+        self._neighbor_tables: dict[str, dict[Position, frozenset[Position]]] = {}
     
     def __getitem__(self, key) -> T:
         if isinstance(key, Position):
@@ -24,8 +25,8 @@ class Grid(Generic[T]):
     def __eq__(self, other):
         if not issubclass(type(other), Grid):
             return False
-        if all(isinstance(cell, bool) for cell in self._matrix):
-            return all(value == other.value(position) for position, value in self)
+        if self.num_rows != other.num_rows or self.num_cols != other.num_cols:
+            return False
         return self.matrix == other.matrix
     
     def __hash__(self):
@@ -130,6 +131,27 @@ class Grid(Generic[T]):
         return position.down_right if position.down_right in self else None  # check if wall is not between position and position.down_right ?
     
     def get_neighbors(self, position: Position, mode = "orthogonal"):
+        """
+        Neighbors of `position` inside the grid, as a new set.
+        
+        Without walls, the answer comes from a per-mode table computed once for all cells.
+        """
+        if self._walls:
+            return self._compute_neighbors(position, mode)
+        table = self._neighbor_tables.get(mode)
+        if table is None:
+            table = {
+                Position(r, c): frozenset(self._compute_neighbors(Position(r, c), mode))
+                for r in range(self.num_rows) for c in range(self.num_cols)
+            }
+            self._neighbor_tables[mode] = table
+        neighbors = table.get(position)
+        if neighbors is None:
+            # Outside of the grid
+            return self._compute_neighbors(position, mode)
+        return set(neighbors)
+    
+    def _compute_neighbors(self, position: Position, mode = "orthogonal"):
         if mode == 'diagonal_only':
             return {self.neighbor_up_left(position), self.neighbor_up_right(position), self.neighbor_down_left(position), self.neighbor_down_right(position)} - {None}
 
@@ -0,0 +1,59 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+from ortools.sat.python import cp_model as cp
+from puzzlekit.config import _SETTINGS
+
+class ModelTemplate:
+    """
+    A clue-independent constraint skeleton, built once and cloned per instance.
+
+    `variables` are the handles created while building `model`. A clone keeps the
+    proto indices, so the same handles can be used to add constraints to it and to
+    read values back from a solver run on it.
+    """
+    def __init__(self, model: cp.CpModel, variables: Dict[Hashable, Any]):
+        self.model = model
+        self.variables = variables
+
+    def instantiate(self) -> Tuple[cp.CpModel, Dict[Hashable, Any]]:
+        """A fresh copy of the model, and a dict of its variables that the caller may extend."""
+        return self.model.Clone(), dict(self.variables)
+
+
+_TEMPLATES: Dict[Hashable, ModelTemplate] = {}
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0}
+
+
+def get_model_template(
+    key: Hashable,
+    build: Callable[[], Tuple[cp.CpModel, Dict[Hashable, Any]]]
+) -> ModelTemplate:
+    """
+    The template for `key`, calling `build()` on first use.
+
+    `key` must capture everything the skeleton depends on, typically
+    (solver class, num_rows, num_cols). Whether variables are named
+    (`configure(debug_names=...)`) is added to the key here.
+    """
+    key = (key, _SETTINGS["debug_names"])
+    with _LOCK:
+        template = _TEMPLATES.get(key)
+        if template is not None:
+            _STATS["hits"] += 1
+            return template
+        _STATS["misses"] += 1
+        template = ModelTemplate(*build())
+        _TEMPLATES[key] = template
+        return template
+
+
+def clear_model_templates():
+    with _LOCK:
+        _TEMPLATES.clear()
+        _STATS.update(hits=0, misses=0)
+
+
+def model_template_info() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS, size=len(_TEMPLATES))
@@ -1,9 +1,40 @@
 import math 
 from puzzlekit.core.direction import Direction
+
+# Interned integer positions: Position(r, c) with int coordinates always returns the same object.
+_INTERNED: dict = {}
+
 class Position:
-    def __init__(self, r, c):
-        self.r = r
-        self.c = c
+    """
+    An immutable (row, column) pair.
+    
+    Integer positions are interned (flyweight), so `pos.up`, `Position(r, c)` etc. in
+    model-building loops are a dict lookup instead of a new allocation.
+    """
+    __slots__ = ("r", "c", "_hash")
+
+    def __new__(cls, r, c):
+        if type(r) is int and type(c) is int:
+            key = (r, c)
+            pos = _INTERNED.get(key)
+            if pos is None:
+                pos = object.__new__(cls)
+                object.__setattr__(pos, "r", r)
+                object.__setattr__(pos, "c", c)
+                object.__setattr__(pos, "_hash", hash(key))
+                _INTERNED[key] = pos
+            return pos
+        pos = object.__new__(cls)
+        object.__setattr__(pos, "r", r)
+        object.__setattr__(pos, "c", c)
+        object.__setattr__(pos, "_hash", hash((r, c)))
+        return pos
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    def __reduce__(self):
+        return (Position, (self.r, self.c))
 
     def neighbors(self, mode='orthogonal') -> list['Position']:
         if mode == 'orthogonal':
@@ -113,10 +144,10 @@ class Position:
         return Position(math.ceil(self.r), math.ceil(self.c))
 
     def __eq__(self, other):
-        return isinstance(other, Position) and self.r == other.r and self.c == other.c
+        return self is other or (isinstance(other, Position) and self.r == other.r and self.c == other.c)
 
     def __hash__(self):
-        return hash((self.r, self.c))
+        return self._hash
 
     def __str__(self):
         return f'({self.r}, {self.c})'
@@ -158,10 +189,7 @@ class Position:
         return self.r if item == 0 else self.c
 
     def __setitem__(self, key, value):
-        if key == 0:
-            self.r = value
-        else:
-            self.c = value
+        raise TypeError("Position is immutable, create a new Position instead")
 
     def __iter__(self):
         return iter([self.r, self.c])
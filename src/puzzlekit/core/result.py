@@ -1,7 +1,6 @@
 import time
 from typing import Dict, Any, Optional
 from puzzlekit.core.grid import Grid
-from puzzlekit.viz import visualize
 
 class PuzzleResult:
     def __init__(self, 
@@ -26,6 +25,8 @@ class PuzzleResult:
         return header
     
     def _call_visualizer(self, show: bool, save_path: Optional[str], auto_close_sec: float = 0):
+        # matplotlib is only imported once a result is actually drawn.
+        from puzzlekit.viz import visualize
         try:
             # print(self.puzzle_data,)
             visualize(
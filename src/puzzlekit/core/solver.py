@@ -1,15 +1,136 @@
-from typing import Optional, List, Any, Callable, Dict
+from typing import Optional, List, Any, Callable, Dict, Iterator
 from abc import ABC, abstractmethod
 from ortools.sat.python import cp_model as cp
-from ortools.linear_solver import pywraplp
 from puzzlekit.core.grid import Grid
-from puzzlekit.utils.ortools_utils import ortools_cpsat_analytics, ortools_mip_analytics
+from puzzlekit.utils.ortools_utils import ortools_cpsat_analytics, ortools_mip_analytics, holds_ortools_objects, new_bool_var
 from puzzlekit.utils.name_utils import infer_puzzle_type
 from puzzlekit.core.result import PuzzleResult
+from puzzlekit.core.build_profiler import BuildProfiler
+from puzzlekit.core.presolve import Presolver
+from puzzlekit.config import _SETTINGS
+from functools import lru_cache
+import inspect
 import re
 import time
 
+class _ValueRecorder:
+    """
+    Stands in for the CP-SAT solver while `get_solution()` runs, and records every
+    value it reads. Those reads are what the solution grid depends on, so forbidding
+    them (`nogood_literals`) excludes exactly that grid from the model.
+    """
+    def __init__(self, solver: cp.CpSolver):
+        self.solver = solver
+        self.reads = []
+    
+    def Value(self, expr):
+        value = self.solver.Value(expr)
+        self.reads.append((expr, value))
+        return value
+    
+    def BooleanValue(self, literal):
+        value = self.solver.BooleanValue(literal)
+        self.reads.append((literal, int(value)))
+        return value
+    
+    value = Value
+    boolean_value = BooleanValue
+    
+    def __getattr__(self, name):
+        return getattr(self.solver, name)
+    
+    def nogood_literals(self, model: cp.CpModel, differs: Optional[Dict[Any, Any]] = None) -> List[Any]:
+        """
+        Literals of which at least one must hold in any solution with a different grid.
+        `differs` maps (variable index, value) to the literal for "variable != value"; pass
+        the same dict on every call so repeated nogoods reuse those literals.
+        """
+        literals, seen = [], set()
+        differs = {} if differs is None else differs
+        variables = model.Proto().variables
+        for expr, value in self.reads:
+            if isinstance(expr, (int, float)):
+                continue
+            # Only Index(), Not() and the proto are used here, which all supported OR-Tools
+            # versions share: a negated literal has a negative index, and a variable is
+            # boolean if its domain is [0, 1] (constants cannot be negated).
+            index = expr.Index() if hasattr(expr, "Index") and hasattr(expr, "Not") else None
+            if index is not None and (index < 0 or list(variables[index].domain) == [0, 1]):
+                key = (index, value)
+                if key not in seen:
+                    seen.add(key)
+                    literals.append(expr.Not() if value else expr)
+                continue
+            key = (index, value) if index is not None else None
+            if key is None or key not in differs:
+                literal = new_bool_var(model, "differs_{}", len(differs))
+                model.Add(expr != value).OnlyEnforceIf(literal)
+                if key is None:
+                    literals.append(literal)
+                    continue
+                differs[key] = literal
+            if key not in seen:
+                seen.add(key)
+                literals.append(differs[key])
+        return literals
+
+class SolutionIterator:
+    """
+    Iterator over the distinct solution grids of a puzzle, from `iter_solutions`.
+
+    `stop_reason` is None while more grids may follow. Once the iteration is over it
+    is one of:
+        "exhausted": every solution was found.
+        "timeout": the time limit ran out first.
+        "limit": `limit` grids were produced.
+        "closed": the iterator was closed early.
+    """
+    def __init__(self, run: Callable[['SolutionIterator'], Iterator[Grid]]):
+        self.stop_reason: Optional[str] = None
+        self.num_solutions = 0
+        self._solutions = run(self)
+    
+    @property
+    def exhausted(self) -> bool:
+        """True if the iteration ended because every solution was found."""
+        return self.stop_reason == "exhausted"
+    
+    def __iter__(self) -> 'SolutionIterator':
+        return self
+    
+    def __next__(self) -> Grid:
+        grid = next(self._solutions)
+        self.num_solutions += 1
+        return grid
+    
+    def close(self):
+        if self.stop_reason is None:
+            self.stop_reason = "closed"
+        self._solutions.close()
+
+@lru_cache(maxsize=None)
+def _init_signature(cls: type) -> inspect.Signature:
+    """Signature of a solver class's constructor; its arguments are the parsed input fields."""
+    return inspect.signature(cls.__init__)
+
 class PuzzleSolver(ABC):
+    def __new__(cls, *args, **kwargs):
+        # Record the constructor arguments as given: solvers often store them under other
+        # names or in converted form, and `_input_data` must return the input itself.
+        instance = super().__new__(cls)
+        try:
+            bound = _init_signature(cls).bind(instance, *args, **kwargs)
+        except TypeError:
+            # copy and pickle create the instance without arguments, then restore its
+            # attributes (recorded arguments included); a bad call fails in __init__.
+            return instance
+        bound.apply_defaults()
+        instance._init_args = {
+            name: value for name, value in list(bound.arguments.items())[1:]
+            if bound.signature.parameters[name].kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        }
+        return instance
+    
     @abstractmethod
     def __init__(self, *args, **kwargs):
         pass
@@ -95,6 +216,20 @@ class PuzzleSolver(ABC):
         if ignore is None:
             ignore = set()
         
+        # Fast path: collect the distinct values in one pass, and only check those.
+        # The cell-by-cell scan below then only runs to report the first bad cell.
+        try:
+            distinct = set()
+            for row in grid:
+                distinct.update(row)
+            if all(
+                str(val) in allowed or str(val) in ignore or (validator is not None and validator(str(val)))
+                for val in distinct
+            ):
+                return
+        except Exception:
+            pass
+        
         for r, row in enumerate(grid):
             for c, val in enumerate(row):
                 s_val = str(val)
@@ -117,19 +252,203 @@ class PuzzleSolver(ABC):
                         f"Allowed values: {allowed}, Ignore set: {ignore}"
                     )
     
-    def solve(self) -> dict:
+    def _input_data(self) -> Dict[str, Any]:
+        """
+        The parsed input fields of this puzzle: the constructor arguments, by parameter
+        name, as plain data. Grids are stored as their matrix; the visualizer rebuilds
+        them when asked to draw.
+        """
+        return {
+            name: value.matrix if isinstance(value, Grid) else value
+            for name, value in self._init_args.items()
+        }
+    
+    def _release_backend(self):
+        """Drop references to the OR-Tools model, solver and variables so they can be freed."""
+        for name, value in vars(self).items():
+            if not holds_ortools_objects(value):
+                continue
+            if isinstance(value, (dict, list, set)):
+                # Keep the container: some solvers fill it in place when building the model.
+                value.clear()
+            else:
+                setattr(self, name, None)
+    
+    def _presolve_rules(self) -> List[Callable]:
+        """
+        Propagation rules to run before the model is built (see `puzzlekit.core.presolve`).
+        None by default; solvers with deterministic deductions override this.
+        """
+        return []
+    
+    def _presolve(self, given: Optional[Dict[tuple, int]] = None) -> Dict[tuple, int]:
+        """
+        Run this solver's presolve rules from the `given` cell values. Returns the fixed
+        cells as {(r, c): 0 or 1}, for `_add_constr` to turn into constants. Returns {} if
+        the solver has no rules or presolve is off (`puzzlekit.configure(presolve=False)`).
+        The statistics end up in solution_data['presolve'].
+        """
+        self._presolve_stats = None
+        rules = self._presolve_rules()
+        if not rules or not _SETTINGS["presolve"]:
+            return {}
+        presolver = Presolver(self.num_rows, self.num_cols, rules)
+        fixed = presolver.run(given)
+        self._presolve_stats = presolver.stats
+        return fixed
+    
+    def _make_result(self, solution_dict: Dict[str, Any], slim: bool = False) -> PuzzleResult:
+        """
+        Wrap the solution into a PuzzleResult.
+        
+        By default puzzle_data is a shallow copy of all solver attributes, model and variables
+        included. With `slim=True` it only keeps the parsed input fields, and the OR-Tools objects
+        held by this solver are released (call `solve` again to rebuild them).
+        """
+        if getattr(self, "_presolve_stats", None) is not None:
+            solution_dict['presolve'] = self._presolve_stats
+        if slim:
+            puzzle_data = self._input_data()
+            self._release_backend()
+        else:
+            puzzle_data = vars(self).copy()
+        return PuzzleResult(
+            puzzle_type = self.puzzle_type,
+            puzzle_data = puzzle_data,
+            solution_data = solution_dict
+        )
+    
+    def _configure_cpsat_solver(self, max_time: Optional[float] = None, num_workers: Optional[int] = None,
+                                seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None):
+        """
+        Apply solve-time parameters to the CP-SAT solver created in `_add_constr`.
+        
+        Args:
+            max_time: Time limit in seconds (`max_time_in_seconds`).
+            num_workers: Number of search workers (`num_workers`).
+            seed: Random seed (`random_seed`).
+            sat_params: Any other `SatParameters` fields, e.g. {"log_search_progress": True}.
+        """
+        params = self.solver.parameters
+        if max_time is not None:
+            params.max_time_in_seconds = float(max_time)
+        if num_workers is not None:
+            params.num_workers = int(num_workers)
+        if seed is not None:
+            params.random_seed = int(seed)
+        for key, value in (sat_params or {}).items():
+            try:
+                setattr(params, key, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid CP-SAT parameter '{key}={value}': {e}") from e
+    
+    def cell_literal(self, r: int, c: int, value: str) -> Any:
+        """
+        A literal of the built model that is true iff cell (r, c) shows `value` in the
+        solution grid (used by `PuzzleSession`). The default covers solvers that keep one
+        non-Boolean integer variable per cell in `self.x` and print its value as is; others
+        (Boolean grids, shifted or derived values) override it.
+        """
+        var = getattr(self, "x", {}).get((r, c))
+        # A BoolVar is an IntVar too, but Boolean grids print their own symbols.
+        if (not isinstance(var, cp.IntVar) or not str(value).isdigit()
+                or list(self.model.Proto().variables[var.Index()].domain) == [0, 1]):
+            raise NotImplementedError(f"{type(self).__name__} does not map cell ({r}, {c}) = '{value}' to a literal.")
+        literal = new_bool_var(self.model, "cell_{}_{}_is_{}", r, c, value)
+        self.model.Add(var == int(value)).OnlyEnforceIf(literal)
+        self.model.Add(var != int(value)).OnlyEnforceIf(literal.Not())
+        return literal
+    
+    def _exclude_current_solution(self) -> Grid:
+        """
+        Read the current solution grid, then add a nogood to `self.model` that excludes
+        it, so that the next `Solve` finds a solution with a different grid (or none).
+        """
+        recorder = _ValueRecorder(self.solver)
+        self.solver = recorder
+        try:
+            grid = self.get_solution()
+        finally:
+            self.solver = recorder.solver
+        if getattr(self, "_differs_model", None) is not self.model:
+            self._differs_model, self._differs = self.model, {}
+        literals = recorder.nogood_literals(self.model, self._differs)
+        self.model.AddBoolOr(literals if literals else [False])
+        return grid
+    
+    @staticmethod
+    def _count_summary(num_solutions: int, exhausted: bool) -> Dict[str, Any]:
+        """
+        num_solutions: distinct solution grids found. is_unique: True/False when known,
+        None if the search stopped (count reached or time limit) before it could tell.
+        """
+        if num_solutions >= 2:
+            is_unique = False
+        elif exhausted:
+            is_unique = num_solutions == 1
+        else:
+            is_unique = None
+        return {'num_solutions': num_solutions, 'is_unique': is_unique}
+    
+    def _count_solutions(self, status: int, limit: int, max_time: Optional[float], start: float) -> Dict[str, Any]:
+        """
+        Keep solving `self.model` after the first solve, each time excluding the grid just
+        found, until `limit` distinct grids are found or none is left. The model is only
+        extended, never rebuilt; `max_time` is shared with the first solve.
+        """
+        num_solutions = 0
+        while status in (cp.OPTIMAL, cp.FEASIBLE):
+            num_solutions += 1
+            if num_solutions >= limit:
+                break
+            self._exclude_current_solution()
+            if max_time is not None:
+                remaining = max_time - (time.perf_counter() - start)
+                if remaining <= 0:
+                    status = cp.UNKNOWN
+                    break
+                self.solver.parameters.max_time_in_seconds = remaining
+            status = self.solver.Solve(self.model)
+        return self._count_summary(num_solutions, status == cp.INFEASIBLE)
+    
+    def solve(self, max_time: Optional[float] = None, num_workers: Optional[int] = None,
+              seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None,
+              slim: bool = False, profile_build: bool = False,
+              count_solutions: Optional[int] = None) -> dict:
+        """
+        Build the model and solve it.
+        
+        Args:
+            max_time: Time limit in seconds for the search.
+            num_workers: Number of parallel search workers (1 = single-threaded).
+            seed: Random seed, for reproducible runs.
+            sat_params: Extra CP-SAT parameters by field name.
+            slim: Keep only the input fields in the result and release the model and solver.
+            profile_build: Time each `_add_*` step of the model build and report it in
+                solution_data['build_profile'].
+            count_solutions: Look for up to this many distinct solutions and report
+                solution_data['num_solutions'] and ['is_unique'] (use 2 for a uniqueness
+                check). The returned grid is still the first solution found.
+        """
+        if count_solutions is not None and count_solutions < 1:
+            raise ValueError(f"count_solutions must be >= 1, got {count_solutions}")
         solution_dict = dict()
         solution_grid = Grid.empty() 
         
         
         tic = time.perf_counter() 
-        self._add_constr()
+        with BuildProfiler(self, enabled=profile_build) as profiler:
+            self._add_constr()
         toc = time.perf_counter()
         
         build_time = toc - tic
+        self._configure_cpsat_solver(max_time, num_workers, seed, sat_params)
+        start = time.perf_counter()
         status = self.solver.Solve(self.model)
         solution_dict = ortools_cpsat_analytics(self.model, self.solver)
         solution_dict['build_time'] = build_time
+        if profile_build:
+            solution_dict['build_profile'] = profiler.report(build_time)
         solution_status = {
             cp.OPTIMAL: "Optimal",
             cp.FEASIBLE: "Feasible",
@@ -143,20 +462,84 @@ class PuzzleSolver(ABC):
             solution_grid = self.get_solution()
         
         solution_dict['solution_grid'] = solution_grid
+        if count_solutions is not None:
+            solution_dict.update(self._count_solutions(status, count_solutions, max_time, start))
         
         # print(f"{self.puzzle_type}: \nStatus: {solution_dict.get('status', 'Unknown')}, \nCPU Time: {solution_dict.get('cpu_time', -1):.4f} s\nBuild Time: {solution_dict.get('build_time', -1):.4f} s")
         
-        return PuzzleResult(
-            puzzle_type = self.puzzle_type,
-            puzzle_data = vars(self).copy(),
-            solution_data = solution_dict
-        )
+        return self._make_result(solution_dict, slim)
+
+    def _build_search(self):
+        """
+        Build the model for repeated searches (`iter_solutions`). Solvers whose solve()
+        completes the model in rounds override this together with `_search`.
+        """
+        self._add_constr()
+    
+    def _search(self, max_time: Optional[float]) -> int:
+        """Search the built model once, within `max_time` seconds (None: no limit). Returns the CP-SAT status."""
+        self.solver.parameters.max_time_in_seconds = float("inf") if max_time is None else float(max_time)
+        return self.solver.Solve(self.model)
+    
+    def iter_solutions(self, limit: Optional[int] = None, timeout: Optional[float] = None,
+                       seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None) -> SolutionIterator:
+        """
+        Iterate over the distinct solution grids, one search per grid.
+        
+        The model is built once. After each solution, a nogood over the values the grid
+        was read from excludes that grid (as for `solve(count_solutions=...)`), so
+        auxiliary variables never make a grid come back. Grids are produced lazily;
+        closing the iterator early simply stops searching.
+        
+        Args:
+            limit: Stop after this many solutions (None: all of them).
+            timeout: Time limit in seconds for the whole enumeration.
+            seed: Random seed.
+            sat_params: Extra CP-SAT parameters by field name.
+        
+        Usage:
+            solutions = solver.iter_solutions(limit=100, timeout=30)
+            for grid in solutions:
+                ...
+            solutions.stop_reason  # "exhausted", "timeout", "limit" or "closed"
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        
+        def run(iterator: SolutionIterator) -> Iterator[Grid]:
+            self._build_search()
+            self._configure_cpsat_solver(None, None, seed, sat_params)
+            start = time.perf_counter()
+            while True:
+                remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+                if remaining is not None and remaining <= 0:
+                    iterator.stop_reason = "timeout"
+                    return
+                status = self._search(remaining)
+                if status == cp.INFEASIBLE:
+                    iterator.stop_reason = "exhausted"
+                    return
+                if status == cp.UNKNOWN:
+                    iterator.stop_reason = "timeout"
+                    return
+                if status not in (cp.OPTIMAL, cp.FEASIBLE):
+                    raise RuntimeError(f"Enumeration stopped: CP-SAT status {self.solver.StatusName(status)}")
+                grid = self._exclude_current_solution()
+                if limit is not None and iterator.num_solutions + 1 >= limit:
+                    iterator.stop_reason = "limit"
+                    yield grid
+                    return
+                yield grid
+        
+        return SolutionIterator(run)
 
 class IterativePuzzleSolver(PuzzleSolver, ABC):
     """
     Base class for puzzles solved using Iterative MIP (Cutting Planes).
     """
     def _add_constr(self):
+        # The linear solver is only loaded for MIP-based puzzles.
+        from ortools.linear_solver import pywraplp
         self.solver = pywraplp.Solver.CreateSolver('SCIP') 
         self._setup_initial_model()
 
@@ -173,69 +556,207 @@ class IterativePuzzleSolver(PuzzleSolver, ABC):
     def _check_and_add_cuts(self, current_solution_values: Dict) -> bool:
         """
         Check if the current solution satisfies certain Lazy Constraints.
-        If not, add new linear constraints (Cuts, Cutting Planes) to self.solver and return False.
+        If not, add new linear constraints (Cuts, Cutting Planes) to self.solver and return
+        True, or the number of cuts added. Return False (or 0) if nothing was violated.
         e.g., Hitori solver checks if the current solution satisfies the connectivity constraint.
-        If satisfied, return True.
         """
         pass
 
-    # Override solve method, encapsulate the common iterative logic.
-    def solve(self) -> dict:
+    def _current_assignment(self) -> tuple:
+        """The integer variables and their values in the last solve."""
+        variables = [var for var in self.solver.variables() if var.integer()]
+        return variables, [round(var.solution_value()) for var in variables]
+
+    def _configure_mip_solver(self, num_workers: Optional[int] = None, seed: Optional[int] = None,
+                              sat_params: Optional[Dict[str, Any]] = None):
+        """
+        Apply solve-time parameters to the SCIP solver created in `_add_constr`.
+        The time limit is handled per round in `solve`, as it is a budget over all rounds.
         
-        tic = time.perf_counter()
-        # 1. Build the initial model via child class' _add_constr method.
-        # Log the build time.
-        self._add_constr() 
-        toc = time.perf_counter()
-        build_time = toc - tic
+        Args:
+            num_workers: Number of threads.
+            seed: Random seed shift (`randomization/randomseedshift`).
+            sat_params: Extra SCIP parameters by name, e.g. {"limits/gap": 0.0}.
+        """
+        if num_workers is not None:
+            self.solver.SetNumThreads(int(num_workers))
+        specific = dict(sat_params or {})
+        if seed is not None:
+            specific["randomization/randomseedshift"] = int(seed)
+        if specific:
+            param_str = "\n".join(f"{key} = {value}" for key, value in specific.items())
+            if not self.solver.SetSolverSpecificParametersAsString(param_str):
+                raise ValueError(f"Invalid SCIP parameters: {specific}")
+
+    def _solve_with_cuts(self, max_time: Optional[float], start_time: float) -> tuple:
+        """
+        Solve, adding cuts until no lazy constraint is violated.
+        Returns (status string, number of rounds). Each round is logged in
+        `self._iteration_stats`.
+        """
+        from ortools.linear_solver import pywraplp
         
-        start_time = time.perf_counter()
         max_iterations = 10000
         iteration = 0
         status = pywraplp.Solver.NOT_SOLVED
         final_status_str = "Unknown"
         
-        # 2. Iterative Log-Cut Loop
         while iteration < max_iterations:
+            if max_time is not None:
+                remaining = max_time - (time.perf_counter() - start_time)
+                if remaining <= 0:
+                    final_status_str = "Unknown"
+                    break
+                self.solver.SetTimeLimit(max(1, int(remaining * 1000)))
             iteration += 1
+            round_tic = time.perf_counter()
             status = self.solver.Solve()
+            round_stats = {'solve_time': time.perf_counter() - round_tic, 'separation_time': 0.0, 'cuts': 0}
+            self._iteration_stats.append(round_stats)
             
             # If the basic model is infeasible, exit directly.
             if status not in [pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE]:
-                final_status_str = "Infeasible" if status == pywraplp.Solver.INFEASIBLE else "Error"
+                if status == pywraplp.Solver.INFEASIBLE:
+                    final_status_str = "Infeasible"
+                elif status == pywraplp.Solver.NOT_SOLVED and max_time is not None:
+                    final_status_str = "Unknown"
+                else:
+                    final_status_str = "Error"
                 break
                 
             # Check if it's necessary to add new cuts.
             # If _check_and_add_cuts returns True, it means the current solution does not satisfy the connectivity constraint,
             # and new constraints have been added. We need to continue solving.
+            # Read before the cuts change the model (which invalidates the solution).
+            incumbent = self._current_assignment()
+            separation_tic = time.perf_counter()
             cuts_added = self._check_and_add_cuts()
+            round_stats['separation_time'] = time.perf_counter() - separation_tic
+            round_stats['cuts'] = int(cuts_added)
             if not cuts_added:
                 # No new cuts added -> All constraints satisfied -> Found final solution.
                 final_status_str = "Optimal" if status == pywraplp.Solver.OPTIMAL else "Feasible"
                 break
+            # Warm start the next round from this (now cut off) solution.
+            self.solver.SetHint(*incumbent)
         
         else:
             final_status_str = "Not Solved (Max Iterations)"
+        
+        return final_status_str, iteration
+    
+    def _exclude_current_solution(self):
+        """
+        Add a nogood excluding the current assignment of the binary variables
+        (the cell variables of the MIP puzzles): at least one of them must flip.
+        """
+        flips = []
+        for var in self.solver.variables():
+            if not var.integer() or var.lb() != 0 or var.ub() != 1:
+                continue
+            flips.append(1 - var if var.solution_value() > 0.5 else var)
+        self.solver.Add(sum(flips) >= 1)
+    
+    def iter_solutions(self, limit: Optional[int] = None, timeout: Optional[float] = None,
+                       seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None) -> SolutionIterator:
+        """
+        Iterate over the distinct solution grids (see `PuzzleSolver.iter_solutions`). Each
+        solution is excluded by a nogood before the cut loop resumes for the next one.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        
+        def run(iterator: SolutionIterator) -> Iterator[Grid]:
+            self._add_constr()
+            self._configure_mip_solver(None, seed, sat_params)
+            start_time = time.perf_counter()
+            self._iteration_stats = []
+            while True:
+                status_str, _ = self._solve_with_cuts(timeout, start_time)
+                if status_str in ["Infeasible", "Unknown"]:
+                    iterator.stop_reason = "exhausted" if status_str == "Infeasible" else "timeout"
+                    return
+                if status_str not in ["Optimal", "Feasible"]:
+                    raise RuntimeError(f"Enumeration stopped: {status_str}")
+                grid = self.get_solution()
+                self._exclude_current_solution()
+                if limit is not None and iterator.num_solutions + 1 >= limit:
+                    iterator.stop_reason = "limit"
+                    yield grid
+                    return
+                yield grid
+        
+        return SolutionIterator(run)
+    
+    # Override solve method, encapsulate the common iterative logic.
+    def solve(self, max_time: Optional[float] = None, num_workers: Optional[int] = None,
+              seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None,
+              slim: bool = False, profile_build: bool = False,
+              count_solutions: Optional[int] = None) -> dict:
+        """
+        Build the relaxed model and solve it, adding cuts until no constraint is violated.
+        
+        Args:
+            max_time: Time limit in seconds, shared by all rounds.
+            num_workers: Number of SCIP threads.
+            seed: Random seed shift for SCIP.
+            sat_params: Extra SCIP parameters by name.
+            slim: Keep only the input fields in the result and release the model and solver.
+            profile_build: Time each `_add_*` step of the model build and report it in
+                solution_data['build_profile'].
+            count_solutions: Look for up to this many distinct solutions (see `PuzzleSolver.solve`).
+                Each found solution is excluded by a nogood and the cut loop resumes.
+        """
+        if count_solutions is not None and count_solutions < 1:
+            raise ValueError(f"count_solutions must be >= 1, got {count_solutions}")
+        tic = time.perf_counter()
+        # 1. Build the initial model via child class' _add_constr method.
+        # Log the build time.
+        with BuildProfiler(self, enabled=profile_build) as profiler:
+            self._add_constr() 
+        toc = time.perf_counter()
+        build_time = toc - tic
+        self._configure_mip_solver(num_workers, seed, sat_params)
+        
+        start_time = time.perf_counter()
+        self._iteration_stats = []
+        # 2. Iterative Log-Cut Loop
+        final_status_str, iteration = self._solve_with_cuts(max_time, start_time)
+        
+        solution_grid = Grid.empty()
+        if final_status_str in ["Optimal", "Feasible"]:
+            solution_grid = self.get_solution()
+        # Analytics describe the run that produced the returned solution.
+        solution_dict = ortools_mip_analytics(self.solver)
+        
+        count_data = None
+        if count_solutions is not None:
+            num_solutions, status_str = 0, final_status_str
+            while status_str in ["Optimal", "Feasible"]:
+                num_solutions += 1
+                if num_solutions >= count_solutions:
+                    break
+                self._exclude_current_solution()
+                status_str, rounds = self._solve_with_cuts(max_time, start_time)
+                iteration += rounds
+            count_data = self._count_summary(num_solutions, status_str == "Infeasible")
 
         end_time = time.perf_counter()
         
         # 3. Collect results.
-        solution_dict = ortools_mip_analytics(self.solver)
         solution_dict.update({
             'build_time': build_time,
             'solve_time': end_time - start_time,
             'status': final_status_str,
-            'iterations': iteration 
+            'iterations': iteration,
+            'num_cuts': sum(stats['cuts'] for stats in self._iteration_stats),
+            'iteration_stats': self._iteration_stats
         })
+        if profile_build:
+            solution_dict['build_profile'] = profiler.report(build_time)
         
-        solution_grid = Grid.empty()
-        if final_status_str in ["Optimal", "Feasible"]:
-            solution_grid = self.get_solution()
-            
         solution_dict['solution_grid'] = solution_grid
+        if count_data is not None:
+            solution_dict.update(count_data)
         
-        return PuzzleResult(
-            puzzle_type=self.puzzle_type,
-            puzzle_data=vars(self).copy(),
-            solution_data=solution_dict
-        )
\ No newline at end of file
+        return self._make_result(solution_dict, slim)
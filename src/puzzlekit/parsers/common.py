@@ -573,8 +573,8 @@ def standard_grid_parser_nonogram(data: str) -> Dict[str, Any]:
             return None
         grid_row = lines[1 + int(n): ] 
         grid_col = lines[1: 1 + int(n)]
-        grid_row = list(map(lambda x : x.split(" "), grid_row))
-        grid_col = list(map(lambda x : x.split(" "), grid_col))
+        grid_row = list(map(lambda x : x.split(), grid_row))
+        grid_col = list(map(lambda x : x.split(), grid_col))
         grid = [["-" for _ in range(int(n))] for _ in range(int(m))]
 
         return {
@@ -0,0 +1,150 @@
+from typing import Any, Dict, List, Optional, Tuple
+from ortools.sat.python import cp_model as cp
+from puzzlekit.core.grid import Grid
+from puzzlekit.core.solver import PuzzleSolver
+
+Cell = Tuple[int, int]
+
+
+class PuzzleSession:
+    """
+    An interactive solving session around one built model.
+
+    The model is built once. Cells the player fills in become assumptions, so
+    assigning or retracting a cell never touches the model. Every solve is
+    warm-started from the previous solution with AddHint. This makes consistency
+    checks and hints much cheaper than a rebuild per request.
+
+    Usage:
+        session = PuzzleSession(puzzlekit.solver("sudoku", data))
+        session.assign(0, 2, "9")
+        session.check()   # False if the fill contradicts the clues
+        session.hint()    # e.g. (1, 1, '4'): a cell whose value is now forced
+
+    The solver must be a CP-SAT solver using the standard `solve()` and must map cells
+    to literals via `PuzzleSolver.cell_literal`. Hints are given for the cells that have
+    a literal, except clue cells (numbers of the input grid that the solution keeps).
+    """
+    def __init__(self, solver: PuzzleSolver, max_time: Optional[float] = None,
+                 seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None):
+        if type(solver).solve is not PuzzleSolver.solve:
+            raise TypeError(f"{type(solver).__name__} builds its model inside solve(); sessions are not supported.")
+        solver._add_constr()
+        if not isinstance(getattr(solver, "model", None), cp.CpModel):
+            raise TypeError(f"{type(solver).__name__} is not a CP-SAT solver; sessions are not supported.")
+        solver._configure_cpsat_solver(max_time, None, seed, sat_params)
+        self.solver = solver
+        self.model: cp.CpModel = solver.model
+        self.fixed: Dict[Cell, str] = {}
+        self.conflicts: List[Cell] = []
+        self._literals: Dict[Tuple[int, int, str], Any] = {}
+        self._solution: Optional[Grid] = None
+        self._input_matrix = solver.grid.matrix
+
+    def literal(self, r: int, c: int, value: str) -> Any:
+        key = (r, c, value)
+        if key not in self._literals:
+            self._literals[key] = self.solver.cell_literal(r, c, value)
+        return self._literals[key]
+
+    def assign(self, r: int, c: int, value: str):
+        """Fix cell (r, c) to `value` (as it appears in solution grids)."""
+        self.literal(r, c, value)
+        self.fixed[r, c] = value
+        self._solution = None
+
+    def retract(self, r: int, c: int):
+        """Undo the assignment of cell (r, c), if any."""
+        if self.fixed.pop((r, c), None) is not None:
+            self._solution = None
+
+    def _solve(self, extra: List[Any] = ()) -> bool:
+        """Solve under the current assignments (plus `extra` literals). True if feasible."""
+        literals = {(r, c): self.literal(r, c, v) for (r, c), v in self.fixed.items()}
+        self.model.ClearAssumptions()
+        self.model.AddAssumptions(list(literals.values()) + list(extra))
+        status = self.solver.solver.Solve(self.model)
+        if status in (cp.OPTIMAL, cp.FEASIBLE):
+            # Warm start the next solve from this solution.
+            response = self.solver.solver.ResponseProto()
+            self.model.ClearHints()
+            hint = self.model.Proto().solution_hint
+            hint.vars.extend(range(len(response.solution)))
+            hint.values.extend(response.solution)
+            self.conflicts = []
+            return True
+        if status == cp.INFEASIBLE:
+            # The core holds literal indices. It comes back empty when presolve alone
+            # proves infeasibility; then all assignments are reported.
+            core = set(self.solver.solver.SufficientAssumptionsForInfeasibility())
+            self.conflicts = [cell for cell, literal in literals.items() if not core or literal.Index() in core]
+            return False
+        raise TimeoutError("The session solve hit its time limit before deciding.")
+
+    def check(self) -> bool:
+        """
+        Whether the current fill can still be completed to a solution. If not,
+        `conflicts` lists assigned cells that together cause the contradiction.
+        """
+        if self._solution is not None:
+            return True
+        if not self._solve():
+            return False
+        self._solution = self.solver.get_solution()
+        return True
+
+    def solution(self) -> Optional[Grid]:
+        """A solution that extends the current fill, or None if there is none."""
+        return self._solution if self.check() else None
+
+    def deductions(self) -> Dict[Cell, str]:
+        """
+        All open cells (see the class docstring) whose value is the same in every solution extending the fill.
+
+        Starting from one solution, each round asks for a solution that differs from it
+        on at least one remaining candidate cell and drops the cells that changed. When
+        no such solution exists, the remaining candidates are forced.
+        """
+        if not self.check():
+            return {}
+        reference = self._solution
+        candidates = []
+        for r, row in enumerate(reference.matrix):
+            for c, value in enumerate(row):
+                # Clue cells show the same number in the input and the solution.
+                if (r, c) in self.fixed or (value.isdigit() and self._input_matrix[r][c] == value):
+                    continue
+                try:
+                    self.literal(r, c, value)
+                except NotImplementedError:
+                    continue
+                candidates.append((r, c))
+        # The round clauses go into a scratch copy of the model, so the session's model
+        # does not grow with every call.
+        base, self.model = self.model, self.model.Clone()
+        try:
+            while candidates:
+                self.model.AddBoolOr(
+                    [self.literal(r, c, reference.value(r, c)).Not() for r, c in candidates]
+                )
+                if not self._solve():
+                    break
+                other = self.solver.get_solution()
+                remaining = [(r, c) for r, c in candidates if other.value(r, c) == reference.value(r, c)]
+                if len(remaining) == len(candidates):
+                    raise RuntimeError(
+                        f"{type(self.solver).__name__}.cell_literal does not match its solution grid."
+                    )
+                candidates = remaining
+        finally:
+            self.model = base
+        self.conflicts = []
+        return {(r, c): reference.value(r, c) for r, c in candidates}
+
+    def hint(self) -> Optional[Tuple[int, int, str]]:
+        """The first forced open cell in row-major order, as (r, c, value); None if none is."""
+        forced = self.deductions()
+        if not forced:
+            return None
+        (r, c) = min(forced)
+        return r, c, forced[r, c]
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class ABCEndViewSolver(PuzzleSolver):
@@ -109,7 +110,7 @@ class ABCEndViewSolver(PuzzleSolver):
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(0, self.val, f'x_{i}_{j}')
+                self.x[i, j] = new_int_var(self.model, 0, self.val, "x_{}_{}", i, j)
                 
                 # prefill
                 curr_char = self.grid.value(i, j)
@@ -122,7 +123,7 @@ class ABCEndViewSolver(PuzzleSolver):
             for v in range(1, self.val + 1):
                 row_bools = []
                 for c in range(self.num_cols):
-                    b = self.model.NewBoolVar(f'row_{r}_{c}_eq_{v}')
+                    b = new_bool_var(self.model, "row_{}_{}_eq_{}", r, c, v)
                     self.model.Add(self.x[r, c] == v).OnlyEnforceIf(b)
                     self.model.Add(self.x[r, c] != v).OnlyEnforceIf(b.Not())
                     row_bools.append(b)
@@ -132,7 +133,7 @@ class ABCEndViewSolver(PuzzleSolver):
             for v in range(1, self.val + 1):
                 col_bools = []
                 for r in range(self.num_rows):
-                    b = self.model.NewBoolVar(f'col_{r}_{c}_eq_{v}')
+                    b = new_bool_var(self.model, "col_{}_{}_eq_{}", r, c, v)
                     self.model.Add(self.x[r, c] == v).OnlyEnforceIf(b)
                     self.model.Add(self.x[r, c] != v).OnlyEnforceIf(b.Not())
                     col_bools.append(b)
@@ -1,9 +1,11 @@
-from typing import Any, List, Dict
+from typing import Any, Callable, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
+from puzzlekit.core.presolve import CellState, at_least_one, at_most_one, exactly
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class AkariSolver(PuzzleSolver):
@@ -76,10 +78,6 @@ class AkariSolver(PuzzleSolver):
         self.model = cp.CpModel()
         self.solver = cp.CpSolver()
         
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
-        
         self._black_cells = set()
         self._number_cells = dict()
         for i in range(self.num_rows):
@@ -88,11 +86,58 @@ class AkariSolver(PuzzleSolver):
                     self._black_cells.add((i, j))
                 elif self.grid.value(i, j).isdigit():
                     self._number_cells[i, j] = int(self.grid.value(i, j))
+        
+        fixed = self._presolve({cell: 0 for cell in self._black_cells | set(self._number_cells)})
+        for i in range(self.num_rows):
+            for j in range(self.num_cols):
+                if (i, j) in fixed:
+                    self.x[i, j] = self.model.NewConstant(fixed[i, j])
+                else:
+                    self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
 
         self._add_number_constr()
         self._add_light_constr()
         self._add_bulb_constr()
     
+    def _presolve_rules(self) -> List[Callable]:
+        end_pos = {(i, j) for i in range(self.num_rows) for j in range(self.num_cols)
+                   if self.grid.value(i, j) == "x" or self.grid.value(i, j).isdigit()}
+        numbers = [
+            ([(pos.r, pos.c) for pos in self.grid.get_neighbors(Position(i, j), "orthogonal")], int(self.grid.value(i, j)))
+            for (i, j) in end_pos if self.grid.value(i, j).isdigit()
+        ]
+        # Maximal runs of open cells, as in _add_light_constr: at most one bulb each.
+        runs = []
+        for lines in ([[(i, j) for j in range(self.num_cols)] for i in range(self.num_rows)],
+                      [[(i, j) for i in range(self.num_rows)] for j in range(self.num_cols)]):
+            for line in lines:
+                run = []
+                for (i, j) in line:
+                    if self.grid.value(i, j) == "-":
+                        run.append((i, j))
+                    else:
+                        runs.append(run)
+                        run = []
+                runs.append(run)
+        runs = [run for run in runs if len(run) > 1]
+        # Every open cell is lit: by a bulb on it or in its line of sight.
+        sights = [
+            [(i, j)] + [(pos.r, pos.c) for pos in self.grid.get_line_of_sight(Position(i, j), "orthogonal", end_pos)]
+            for i in range(self.num_rows) for j in range(self.num_cols) if self.grid.value(i, j) == "-"
+        ]
+
+        def saturated_numbers(state: CellState):
+            for cells, count in numbers:
+                exactly(state, cells, count)
+
+        def bulbs(state: CellState):
+            for run in runs:
+                at_most_one(state, run)
+            for sight in sights:
+                at_least_one(state, sight)
+
+        return [saturated_numbers, bulbs]
+
     def _add_number_constr(self):
         for (i, j) in self._black_cells:
             self.model.Add(self.x[i, j] == 0)
@@ -136,6 +181,11 @@ class AkariSolver(PuzzleSolver):
                     line_of_sight.add(Position(i, j))
                     self.model.Add(sum(self.x[pos.r, pos.c] for pos in line_of_sight) >= 1)
     
+    def cell_literal(self, r: int, c: int, value: str):
+        if self.grid.value(r, c) != "-" or value not in ("o", "-"):
+            raise NotImplementedError(f"Akari open cells are 'o' or '-', got '{value}' at ({r}, {c}).")
+        return self.x[r, c] if value == "o" else self.x[r, c].Not()
+    
     def get_solution(self):
         sol_grid = copy.deepcopy(self.grid.matrix)
         for i in range(self.num_rows):
@@ -4,9 +4,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class AqreSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -56,7 +56,7 @@ class AqreSolver(PuzzleSolver):
             for j in range(self.num_cols):
                 pos = Position(i, j)
                 # True(1) = Black/Shaded, False(0) = White/Unshaded
-                self.is_black[pos] = self.model.NewBoolVar(f"black_{pos}")
+                self.is_black[pos] = new_bool_var(self.model, "black_{}", pos)
 
         # 2. Region Constraints
         # A number in a region indicates how many cells in this region must be blackened.
@@ -5,7 +5,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import BATTLESHIP_STYLE_TEMPLATE_INPUT_DESC, SHADE_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 @dataclass
@@ -194,7 +195,7 @@ class BattleshipSolver(PuzzleSolver):
         
         # Create boolean var for each candidate ship
         for ship in candidates:
-            ship.var = self.model.NewBoolVar(f"ship_{ship.id}_len{ship.length}")
+            ship.var = new_bool_var(self.model, "ship_{}_len{}", ship.id, ship.length)
             
         # Helper: Map (r,c) to list of candidates covering it
         cell_to_ships = {}
@@ -233,7 +234,7 @@ class BattleshipSolver(PuzzleSolver):
         self.grid_vars = {} # (r,c) -> 0/1 Is Occupied
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                is_occupied = self.model.NewBoolVar(f"cell_{r}_{c}")
+                is_occupied = new_bool_var(self.model, "cell_{}_{}", r, c)
                 self.grid_vars[r, c] = is_occupied
                 
                 possibilities = cell_to_ships[r, c]
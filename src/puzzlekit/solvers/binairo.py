@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class BinairoSolver(PuzzleSolver):
@@ -79,7 +80,7 @@ class BinairoSolver(PuzzleSolver):
     def _add_num_constr(self):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(f"x[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
                 if self.grid.value(i, j) == "1":
                     self.model.Add(self.x[i, j] == 0)
                 elif self.grid.value(i, j) == "2":
@@ -120,12 +121,17 @@ class BinairoSolver(PuzzleSolver):
                 diffs = []
                 for k in range(vec_len):
                     #  diff_var = 1 if vec_i[k] != vec_j[k] else 0
-                    diff_var = self.model.NewBoolVar(f'diff_{i}_{j}_{k}')
+                    diff_var = new_bool_var(self.model, "diff_{}_{}_{}", i, j, k)
                     self.model.AddAbsEquality(diff_var, vector_list[i][k] - vector_list[j][k])
                     diffs.append(diff_var)
                 self.model.Add(sum(diffs) >= 1)
                 # use xor to constr all diff of each position is at least 1...
     
+    def cell_literal(self, r: int, c: int, value: str):
+        if value not in ("1", "2"):
+            raise NotImplementedError(f"Binairo cells are '1' or '2', got '{value}'.")
+        return self.x[r, c] if value == "2" else self.x[r, c].Not()
+    
     def get_solution(self):
         sol_grid = copy.deepcopy(self.grid.matrix)
         for i in range(self.num_rows):
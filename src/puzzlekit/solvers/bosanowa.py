@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class BosanowaSolver(PuzzleSolver):
@@ -77,7 +78,7 @@ class BosanowaSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 if self.grid.value(i, j) != ".":
-                    self.x[i, j] = self.model.NewIntVar(1, 60, f"x[{i},{j}]")
+                    self.x[i, j] = new_int_var(self.model, 1, 60, "x[{},{}]", i, j)
                     # variables
                 if self.grid.value(i, j).isdigit():
                     self.model.Add(self.x[i, j] == int(self.grid.value(i, j)))
@@ -90,8 +91,8 @@ class BosanowaSolver(PuzzleSolver):
                     curr_neighbors = []
                     for nbr in neighbors:
                         if self.grid.value(nbr.r, nbr.c) != ".":
-                            self.abs_aux[i, j, nbr.r, nbr.c, 0] = self.model.NewIntVar(-100, 100, f'aux[{i},{j},{nbr.r},{nbr.c},0]')
-                            self.abs_aux[i, j, nbr.r, nbr.c, 1] = self.model.NewIntVar(0, 100, f'aux[{i},{j},{nbr.r},{nbr.c},1]')
+                            self.abs_aux[i, j, nbr.r, nbr.c, 0] = new_int_var(self.model, -100, 100, "aux[{},{},{},{},0]", i, j, nbr.r, nbr.c)
+                            self.abs_aux[i, j, nbr.r, nbr.c, 1] = new_int_var(self.model, 0, 100, "aux[{},{},{},{},1]", i, j, nbr.r, nbr.c)
                             self.model.Add(self.abs_aux[i, j, nbr.r, nbr.c, 0] == self.x[i, j] - self.x[nbr.r, nbr.c])
                             self.model.AddAbsEquality(self.abs_aux[i, j, nbr.r, nbr.c, 1], self.abs_aux[i, j, nbr.r, nbr.c, 0])
                             curr_neighbors.append(self.abs_aux[i, j, nbr.r, nbr.c, 1])
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class BricksSolver(PuzzleSolver):
@@ -77,7 +78,7 @@ class BricksSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 # Using 1-based domain [1, N] to match puzzle logic directly
-                self.x[i, j] = self.model.NewIntVar(1, self.num_cols, f"x[{i},{j}]")
+                self.x[i, j] = new_int_var(self.model, 1, self.num_cols, "x[{},{}]", i, j)
                 
                 # Pre-fill constraints
                 if self.grid.value(i, j) != '-':
@@ -106,8 +107,8 @@ class BricksSolver(PuzzleSolver):
                     v2 = self.x[r, c+1]
                     
                     # Add Parity Constraint
-                    mod1 = self.model.NewIntVar(0, 1, f"mod_{r}_{c}")
-                    mod2 = self.model.NewIntVar(0, 1, f"mod_{r}_{c+1}")
+                    mod1 = new_int_var(self.model, 0, 1, "mod_{}_{}", r, c)
+                    mod2 = new_int_var(self.model, 0, 1, "mod_{}_{}", r, c+1)
                     
                     self.model.AddModuloEquality(mod1, v1, 2)
                     self.model.AddModuloEquality(mod2, v2, 2)
@@ -120,8 +121,8 @@ class BricksSolver(PuzzleSolver):
                 v_last = self.x[r, self.num_cols - 1]
                 v_first = self.x[r, 0]
                 
-                m_last = self.model.NewIntVar(0, 1, f"mod_{r}_last")
-                m_first = self.model.NewIntVar(0, 1, f"mod_{r}_first")
+                m_last = new_int_var(self.model, 0, 1, "mod_{}_last", r)
+                m_first = new_int_var(self.model, 0, 1, "mod_{}_first", r)
                 
                 self.model.AddModuloEquality(m_last, v_last, 2)
                 self.model.AddModuloEquality(m_first, v_first, 2)
@@ -133,8 +134,8 @@ class BricksSolver(PuzzleSolver):
                     v1 = self.x[r, c]
                     v2 = self.x[r, c+1]
                     
-                    mod1 = self.model.NewIntVar(0, 1, f"mod_{r}_{c}")
-                    mod2 = self.model.NewIntVar(0, 1, f"mod_{r}_{c+1}")
+                    mod1 = new_int_var(self.model, 0, 1, "mod_{}_{}", r, c)
+                    mod2 = new_int_var(self.model, 0, 1, "mod_{}_{}", r, c+1)
                     
                     self.model.AddModuloEquality(mod1, v1, 2)
                     self.model.AddModuloEquality(mod2, v2, 2)
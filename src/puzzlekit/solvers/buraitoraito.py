@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class BuraitoraitoSolver(PuzzleSolver):
@@ -76,7 +77,7 @@ class BuraitoraitoSolver(PuzzleSolver):
         self.black_cells = set()
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
                 if self.grid.value(i, j) != "-":
                     self.model.Add(self.x[i, j] == 0)
                     self.black_cells.add((i, j))
@@ -91,6 +92,11 @@ class BuraitoraitoSolver(PuzzleSolver):
                     line_of_sight = self.grid.get_line_of_sight(Position(i, j), "orthogonal", end = self.black_cells)
                     self.model.Add(sum(self.x[pos.r, pos.c] for pos in line_of_sight) == int(self.grid.value(i, j)))
     
+    def cell_literal(self, r: int, c: int, value: str):
+        if value not in ("*", self.grid.value(r, c)):
+            raise NotImplementedError(f"Buraitoraito cells are '*' or their input value, got '{value}' at ({r}, {c}).")
+        return self.x[r, c] if value == "*" else self.x[r, c].Not()
+    
     def get_solution(self):
         sol_grid = copy.deepcopy(self.grid.matrix)
         for i in range(self.num_rows):
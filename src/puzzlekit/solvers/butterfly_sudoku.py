@@ -3,8 +3,10 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import SUDOKU_TEMPLATE_OUTPUT_DESC
+from puzzlekit.core.model_template import get_model_template
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class ButterflySudokuSolver(PuzzleSolver):
@@ -78,18 +80,25 @@ class ButterflySudokuSolver(PuzzleSolver):
         self._check_allowed_chars(self.grid.matrix, {'-', "1", "2", "3", "4", "5", "6", "7", "8", "9"})
         
     def _add_constr(self):
+        self.solver = cp.CpSolver()
+        # The skeleton only depends on the shape; clues are fixed on a copy of it.
+        template = get_model_template((type(self), self.num_rows, self.num_cols), self._build_template)
+        self.model, self.x = template.instantiate()
+        for (i, j), var in self.x.items():
+            if self.grid.value(i, j).isdigit():
+                self.model.Add(var == int(self.grid.value(i, j)))
+
+    def _build_template(self):
         self.x = dict()
         self.model = cp.CpModel()
-        self.solver = cp.CpSolver()
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(1, 9, name = f"x[{i}, {j}]")
-                if self.grid.value(i, j).isdigit():
-                    self.model.Add(self.x[i, j] == int(self.grid.value(i, j)))
+                self.x[i, j] = new_int_var(self.model, 1, 9, "x[{}, {}]", i, j)
         
         self._add_offset_standard_constr()
-    
+        return self.model, self.x
+
     def _add_offset_standard_constr(self):
         for offsets in self.pivot:
             o_r, o_c = offsets[0], offsets[1]
@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class CanalViewSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -52,7 +52,7 @@ class CanalViewSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for c in range(self.num_cols):
                 pos = Position(r, c)
-                self.is_black[pos] = self.model.NewBoolVar(f"black_{pos}")
+                self.is_black[pos] = new_bool_var(self.model, "black_{}", pos)
 
         # 2. Clue Constraints & Visibility logic
         for r in range(self.num_rows):
@@ -86,7 +86,7 @@ class CanalViewSolver(PuzzleSolver):
                             
                             # Create a variable 's_k' which is true IFF 
                             # the k-th cell is black AND the (k-1)-th chain was valid.
-                            current_chain_var = self.model.NewBoolVar(f"chain_{pos}_{dr}_{dc}_{k}")
+                            current_chain_var = new_bool_var(self.model, "chain_{}_{}_{}_{}", pos, dr, dc, k)
                             
                             if prev_chain_var is None:
                                 # First cell in direction: chain is valid if this cell is black
@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple, Optional
 from puzzlekit.core.solver import PuzzleSolver  
 from puzzlekit.core.grid import Grid  
 from puzzlekit.core.position import Position  
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected  
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp  
-from typeguard import typechecked  
+from puzzlekit.utils.typecheck import typechecked  
 import re  
   
 class CastleWallSolver(PuzzleSolver):  
@@ -76,9 +76,9 @@ class CastleWallSolver(PuzzleSolver):
                 p = Position(r, c)  
                 all_nodes.append(p)  
                 if c < self.num_cols - 1:  
-                    self.arc_vars[(p, Position(r, c + 1))] = self.model.NewBoolVar(f"H_{r}_{c}")  
+                    self.arc_vars[(p, Position(r, c + 1))] = new_bool_var(self.model, "H_{}_{}", r, c)  
                 if r < self.num_rows - 1:  
-                    self.arc_vars[(p, Position(r + 1, c))] = self.model.NewBoolVar(f"V_{r}_{c}")  
+                    self.arc_vars[(p, Position(r + 1, c))] = new_bool_var(self.model, "V_{}_{}", r, c)  
   
         self.node_active = add_circuit_constraint_from_undirected(  
             self.model, all_nodes, self.arc_vars  
@@ -102,7 +102,7 @@ class CastleWallSolver(PuzzleSolver):
             return  
   
         self.faces = [  
-            [self.model.NewBoolVar(f"inside_{i}_{j}") for j in range(self.face_cols)]  
+            [new_bool_var(self.model, "inside_{}_{}", i, j) for j in range(self.face_cols)]  
             for i in range(self.face_rows)  
         ]  
   
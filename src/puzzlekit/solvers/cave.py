@@ -2,10 +2,10 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from puzzlekit.core.docs_template import SHADE_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class CaveSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -77,7 +77,7 @@ class CaveSolver(PuzzleSolver):
         self.x = {}
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(f"x[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
         
         # 2. Number constraints (Force Inside)
         self.numbered_positions = []
@@ -125,7 +125,7 @@ class CaveSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for c in range(self.num_cols):
                 # is_white = NOT x
-                self.is_white[Position(r, c)] = self.model.NewBoolVar(f"white_{r}_{c}")
+                self.is_white[Position(r, c)] = new_bool_var(self.model, "white_{}_{}", r, c)
                 self.model.Add(self.is_white[Position(r, c)] != self.x[r, c])
         
         # Build Adjacency for Outside Graph
@@ -151,7 +151,7 @@ class CaveSolver(PuzzleSolver):
         active_nodes_out = self.is_white.copy()
         
         # Add Boundary Node variable (Always True)
-        boundary_active_var = self.model.NewBoolVar("boundary_active")
+        boundary_active_var = new_bool_var(self.model, "boundary_active")
         self.model.Add(boundary_active_var == 1)
         active_nodes_out[BOUNDARY_NODE] = boundary_active_var
         
@@ -204,7 +204,7 @@ class CaveSolver(PuzzleSolver):
                     # can_see_step_k is True IFF (x[current] is Inside AND can_see_step_{k-1})
                     # Base case: can_see_step_1 is True IFF x[next_1] is Inside
                     
-                    can_see_k = self.model.NewBoolVar(f"vis_{r}_{c}_dir{dr}{dc}_step{steps}")
+                    can_see_k = new_bool_var(self.model, "vis_{}_{}_dir{}{}_step{}", r, c, dr, dc, steps)
                     
                     current_cell_inside = self.x[cr, cc]
                     
@@ -5,7 +5,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 
 class CojunSolver(PuzzleSolver):
@@ -67,7 +68,7 @@ class CojunSolver(PuzzleSolver):
                 
                 var_name = f"x[{r},{c}]"
                 # Domain: 1 to region_size (inclusive)
-                self.x[r, c] = self.model.NewIntVar(1, region_size, var_name)
+                self.x[r, c] = new_int_var(self.model, 1, region_size, "{}", var_name)
                 
                 # Pre-filled number constraint
                 if char.isdigit():
@@ -4,8 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import SHADE_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class CreekSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -83,7 +83,7 @@ class CreekSolver(PuzzleSolver):
         self.x = {}
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(f"x[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
         self._add_num_constr()
         self._add_connectivity_constr()
         
@@ -4,10 +4,10 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC, LOOP_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class DetourSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -75,11 +75,11 @@ class DetourSolver(PuzzleSolver):
 
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(
             self.model, 
@@ -103,7 +103,7 @@ class DetourSolver(PuzzleSolver):
                 
                 vertical_edges = [e for e in [edge_up, edge_down] if e is not None]
                 # record vertical edges
-                self.x[i, j] = self.model.NewBoolVar(f"Turn[{i}, {j}]")
+                self.x[i, j] = new_bool_var(self.model, "Turn[{}, {}]", i, j)
                 if not vertical_edges:
                     self.model.Add(self.x[i, j] == 0)
                 else:
@@ -5,7 +5,8 @@ from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class DiffNeighborsSolver(PuzzleSolver):
@@ -77,7 +78,7 @@ class DiffNeighborsSolver(PuzzleSolver):
         self.model = cp.CpModel()
         self.solver = cp.CpSolver()
         for k, cells in self.region_grid.regions.items():
-            self.x[k] = self.model.NewIntVar(1, 4, name = f"x[{k}]")
+            self.x[k] = new_int_var(self.model, 1, 4, "x[{}]", k)
         
         self._add_neighbor_constr()
                 
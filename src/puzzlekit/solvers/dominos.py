@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import GENERAL_GRID_TEMPLATE_INPUT_DESC, GENERAL_GRID_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class DominosSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -64,7 +65,7 @@ class DominosSolver(PuzzleSolver):
         for i in range(self.num_rows):
             # for (0,0), (1,0) domino
             for j in range(self.num_cols - 1):
-                self.x[0, i, j] = self.model.NewBoolVar(f"x[0,{i},{j}]")
+                self.x[0, i, j] = new_bool_var(self.model, "x[0,{},{}]", i, j)
                 a_, b_ = int(self.grid.value(i, j)), int(self.grid.value(i, j + 1))
                 if a_ > b_:
                     a_, b_ = b_, a_ 
@@ -79,7 +80,7 @@ class DominosSolver(PuzzleSolver):
         for i in range(self.num_rows - 1):
             # for (0,0), (0, 1) domino
             for j in range(self.num_cols):
-                self.x[1, i, j] = self.model.NewBoolVar(f"x[1,{i},{j}]")
+                self.x[1, i, j] = new_bool_var(self.model, "x[1,{},{}]", i, j)
                 a_, b_ = int(self.grid.value(i, j)), int(self.grid.value(i + 1, j))
                 if a_ > b_:
                     a_, b_ = b_, a_ 
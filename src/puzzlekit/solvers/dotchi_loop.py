@@ -4,9 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC, LOOP_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected 
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class DotchiLoopSolver(PuzzleSolver):
@@ -88,11 +88,11 @@ class DotchiLoopSolver(PuzzleSolver):
                 # Right neighbor
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 # Bottom neighbor
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         # Constraint: Form a single closed loop (or empty set, but we have required nodes so non-empty)
         self.node_active = add_circuit_constraint_from_undirected(
@@ -118,7 +118,7 @@ class DotchiLoopSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 pos = Position(i, j)
-                self.is_turn[pos] = self.model.NewBoolVar(f"is_turn_{i}_{j}")
+                self.is_turn[pos] = new_bool_var(self.model, "is_turn_{}_{}", i, j)
 
                 # Get adjacent edge variables
                 edge_up = self._get_edge_var(pos, pos.up)
@@ -188,7 +188,7 @@ class DotchiLoopSolver(PuzzleSolver):
             # Create a boolean variable for the mode of this region
             # True = All White Circles Turn
             # False = All White Circles Straight
-            region_mode_is_turn = self.model.NewBoolVar(f"region_{r_id}_turn_mode")
+            region_mode_is_turn = new_bool_var(self.model, "region_{}_turn_mode", r_id)
             
             for w_pos in white_points:
                 # Link specific white circle behavior to region mode
@@ -3,11 +3,11 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from puzzlekit.utils.puzzle_math import get_allowed_direction_chars
 from puzzlekit.core.docs_template import GENERAL_REGION_GRID_TEMPLATE_INPUT_DESC, LOOP_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class DoubleBackSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -81,11 +81,11 @@ class DoubleBackSolver(PuzzleSolver):
 
                 if j < self.num_cols:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
                 if i < self.num_rows:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(
             self.model, 
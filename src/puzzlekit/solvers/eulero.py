@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.utils.puzzle_math import convert_str_to_int
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 class EuleroSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -75,8 +76,8 @@ class EuleroSolver(PuzzleSolver):
         self.solver = cp.CpSolver()
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[0, i, j] = self.model.NewIntVar(1, self.num_rows, f"x[0,{i},{j}]")
-                self.x[1, i, j] = self.model.NewIntVar(1, self.num_rows, f"x[1,{i},{j}]")
+                self.x[0, i, j] = new_int_var(self.model, 1, self.num_rows, "x[0,{},{}]", i, j)
+                self.x[1, i, j] = new_int_var(self.model, 1, self.num_rows, "x[1,{},{}]", i, j)
         
         self._add_all_different_constr()
         self._add_unique_constr()
@@ -107,7 +108,7 @@ class EuleroSolver(PuzzleSolver):
         uniqueness = []
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.y[i, j] = self.model.NewIntVar((self.num_rows + 2), (self.num_rows + 1) * (self.num_cols + 1), f"y[{i},{j}]")
+                self.y[i, j] = new_int_var(self.model, self.num_rows + 2, (self.num_rows + 1) * (self.num_cols + 1), "y[{},{}]", i, j)
                 self.model.Add(self.y[i, j] == self.x[0, i, j] * (self.num_rows + 1) + self.x[1, i, j])
                 uniqueness.append(self.y[i, j])
         self.model.AddAllDifferent(uniqueness)
@@ -2,10 +2,10 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class FobidoshiSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -75,7 +75,7 @@ class FobidoshiSolver(PuzzleSolver):
         self.solver = cp.CpSolver()
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
                 if self.grid.value(i, j) == "o":
                     self.model.Add(self.x[i, j] == 1)
                 elif self.grid.value(i, j) == "x":
@@ -3,8 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class FuzuliSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -101,7 +102,7 @@ class FuzuliSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for c in range(self.num_cols):
                 # Domain is 0 to k, where 0 represents an empty cell
-                self.x[r, c] = self.model.NewIntVar(0, self.k, f'x_{r}_{c}')
+                self.x[r, c] = new_int_var(self.model, 0, self.k, "x_{}_{}", r, c)
                 
                 # Pre-assign fixed values from input
                 if (r, c) in self.fixed_values:
@@ -110,7 +111,7 @@ class FuzuliSolver(PuzzleSolver):
                 # Create boolean indicators for specific numbers (used for uniqueness constraints)
                 # indicator[v] is true <==> x[r,c] == v
                 for v in range(1, self.k + 1):
-                    bool_var = self.model.NewBoolVar(f'b_{r}_{c}_{v}')
+                    bool_var = new_bool_var(self.model, "b_{}_{}_{}", r, c, v)
                     self.b_val[r, c, v] = bool_var
                     
                     # Link integer variable x to boolean variable
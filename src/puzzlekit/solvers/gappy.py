@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.docs_template import SHADE_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class GappySolver(PuzzleSolver):
@@ -88,7 +89,7 @@ class GappySolver(PuzzleSolver):
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
         
         self._add_num_constr()
         
@@ -99,7 +100,7 @@ class GappySolver(PuzzleSolver):
                 continue 
             interval_len = int(self.rows[i]) + 2
             for j in range(self.num_cols - interval_len + 1):
-                self.y[i, j] = self.model.NewBoolVar(name = f"y[{i},{j}]")
+                self.y[i, j] = new_bool_var(self.model, "y[{},{}]", i, j)
         
         for j in range(self.num_cols):
             if self.cols[j] == "-":
@@ -107,7 +108,7 @@ class GappySolver(PuzzleSolver):
                 continue 
             interval_len = int(self.cols[j]) + 2
             for i in range(self.num_rows - interval_len + 1):
-                self.z[i, j] = self.model.NewBoolVar(name = f"z[{i},{j}]")
+                self.z[i, j] = new_bool_var(self.model, "z[{},{}]", i, j)
         
         for i in range(self.num_rows - 1):
             for j in range(self.num_cols - 1):
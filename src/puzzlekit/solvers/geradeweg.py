@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple, Optional
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var, new_int_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 
 class GeradewegSolver(PuzzleSolver):
@@ -71,12 +71,12 @@ class GeradewegSolver(PuzzleSolver):
                 # Horizontal edge to the right
                 if c < self.num_cols - 1:
                     right = Position(r, c + 1)
-                    self.arc_vars[(curr, right)] = self.model.NewBoolVar(f"edge_h_{r}_{c}")
+                    self.arc_vars[(curr, right)] = new_bool_var(self.model, "edge_h_{}_{}", r, c)
                 
                 # Vertical edge downward
                 if r < self.num_rows - 1:
                     down = Position(r + 1, c)
-                    self.arc_vars[(curr, down)] = self.model.NewBoolVar(f"edge_v_{r}_{c}")
+                    self.arc_vars[(curr, down)] = new_bool_var(self.model, "edge_v_{}_{}", r, c)
 
     def _get_edge_var(self, p1: Position, p2: Position) -> Optional[cp.IntVar]:
         """Helper to retrieve edge variable between two adjacent positions."""
@@ -141,7 +141,7 @@ class GeradewegSolver(PuzzleSolver):
                     has_n = self._edge_exists(pos, pos.up)
                     has_s = self._edge_exists(pos, pos.down)
                     
-                    straight_cond = self.model.NewBoolVar(f"straight_{r}_{c}_{dr}_{dc}_{step}")
+                    straight_cond = new_bool_var(self.model, "straight_{}_{}_{}_{}_{}", r, c, dr, dc, step)
                     # Straight: has_w AND has_e AND NOT has_n AND NOT has_s
                     self.model.AddBoolAnd([has_w, has_e, has_n.Not(), has_s.Not()]).OnlyEnforceIf(straight_cond)
                     self.model.AddBoolOr([has_w.Not(), has_e.Not(), has_n, has_s]).OnlyEnforceIf(straight_cond.Not())
@@ -152,13 +152,13 @@ class GeradewegSolver(PuzzleSolver):
                     has_w = self._edge_exists(pos, pos.left)
                     has_e = self._edge_exists(pos, pos.right)
                     
-                    straight_cond = self.model.NewBoolVar(f"straight_{r}_{c}_{dr}_{dc}_{step}")
+                    straight_cond = new_bool_var(self.model, "straight_{}_{}_{}_{}_{}", r, c, dr, dc, step)
                     # Straight: has_n AND has_s AND NOT has_w AND NOT has_e
                     self.model.AddBoolAnd([has_n, has_s, has_w.Not(), has_e.Not()]).OnlyEnforceIf(straight_cond)
                     self.model.AddBoolOr([has_n.Not(), has_s.Not(), has_w, has_e]).OnlyEnforceIf(straight_cond.Not())
                 
                 # Step continues iff: previous continued AND straight AND edge exists
-                step_active = self.model.NewBoolVar(f"step_{r}_{c}_{dr}_{dc}_{step}")
+                step_active = new_bool_var(self.model, "step_{}_{}_{}_{}_{}", r, c, dr, dc, step)
                 self.model.AddBoolAnd([prev_step_active, straight_cond, edge_var]).OnlyEnforceIf(step_active)
                 self.model.AddBoolOr([
                     prev_step_active.Not(), 
@@ -174,7 +174,7 @@ class GeradewegSolver(PuzzleSolver):
         if not steps:
             return self.model.NewConstant(0)
         else:
-            arm_len = self.model.NewIntVar(0, len(steps), f"arm_len_{r}_{c}_{dr}_{dc}")
+            arm_len = new_int_var(self.model, 0, len(steps), "arm_len_{}_{}_{}_{}", r, c, dr, dc)
             self.model.Add(arm_len == sum(steps))
             return arm_len
 
@@ -212,26 +212,26 @@ class GeradewegSolver(PuzzleSolver):
                 
                 # Case analysis based on edge configuration (exactly 2 edges per clue cell)
                 # Case 1: Vertical straight (north-south)
-                is_vert_straight = self.model.NewBoolVar(f"vert_str_{r}_{c}")
+                is_vert_straight = new_bool_var(self.model, "vert_str_{}_{}", r, c)
                 self.model.AddBoolAnd([has_n, has_s, has_w.Not(), has_e.Not()]).OnlyEnforceIf(is_vert_straight)
                 self.model.AddBoolOr([has_n.Not(), has_s.Not(), has_w, has_e]).OnlyEnforceIf(is_vert_straight.Not())
-                total_vert = self.model.NewIntVar(0, 2 * (self.num_rows + self.num_cols), f"total_v_{r}_{c}")
+                total_vert = new_int_var(self.model, 0, 2 * (self.num_rows + self.num_cols), "total_v_{}_{}", r, c)
                 self.model.Add(total_vert == len_n + len_s)
                 if clue_value != -1:
                     self.model.Add(total_vert == clue_value).OnlyEnforceIf(is_vert_straight)
                 
                 # Case 2: Horizontal straight (west-east)
-                is_horiz_straight = self.model.NewBoolVar(f"horiz_str_{r}_{c}")
+                is_horiz_straight = new_bool_var(self.model, "horiz_str_{}_{}", r, c)
                 self.model.AddBoolAnd([has_w, has_e, has_n.Not(), has_s.Not()]).OnlyEnforceIf(is_horiz_straight)
                 self.model.AddBoolOr([has_w.Not(), has_e.Not(), has_n, has_s]).OnlyEnforceIf(is_horiz_straight.Not())
-                total_horiz = self.model.NewIntVar(0, 2 * (self.num_rows + self.num_cols), f"total_h_{r}_{c}")
+                total_horiz = new_int_var(self.model, 0, 2 * (self.num_rows + self.num_cols), "total_h_{}_{}", r, c)
                 self.model.Add(total_horiz == len_w + len_e)
                 if clue_value != -1:
                     self.model.Add(total_horiz == clue_value).OnlyEnforceIf(is_horiz_straight)
                 
                 # Case 3: Turning configurations (4 possibilities)
                 # NE turn: north + east
-                is_ne_turn = self.model.NewBoolVar(f"turn_ne_{r}_{c}")
+                is_ne_turn = new_bool_var(self.model, "turn_ne_{}_{}", r, c)
                 self.model.AddBoolAnd([has_n, has_e, has_s.Not(), has_w.Not()]).OnlyEnforceIf(is_ne_turn)
                 self.model.AddBoolOr([has_n.Not(), has_e.Not(), has_s, has_w]).OnlyEnforceIf(is_ne_turn.Not())
                 if clue_value != -1:
@@ -240,7 +240,7 @@ class GeradewegSolver(PuzzleSolver):
                 else:
                     self.model.Add(len_n == len_w).OnlyEnforceIf(is_ne_turn)
                 # NW turn: north + west
-                is_nw_turn = self.model.NewBoolVar(f"turn_nw_{r}_{c}")
+                is_nw_turn = new_bool_var(self.model, "turn_nw_{}_{}", r, c)
                 self.model.AddBoolAnd([has_n, has_w, has_s.Not(), has_e.Not()]).OnlyEnforceIf(is_nw_turn)
                 self.model.AddBoolOr([has_n.Not(), has_w.Not(), has_s, has_e]).OnlyEnforceIf(is_nw_turn.Not())
                 if clue_value != -1:
@@ -250,7 +250,7 @@ class GeradewegSolver(PuzzleSolver):
                     self.model.Add(len_w == len_n).OnlyEnforceIf(is_nw_turn)
                 
                 # SE turn: south + east
-                is_se_turn = self.model.NewBoolVar(f"turn_se_{r}_{c}")
+                is_se_turn = new_bool_var(self.model, "turn_se_{}_{}", r, c)
                 self.model.AddBoolAnd([has_s, has_e, has_n.Not(), has_w.Not()]).OnlyEnforceIf(is_se_turn)
                 self.model.AddBoolOr([has_s.Not(), has_e.Not(), has_n, has_w]).OnlyEnforceIf(is_se_turn.Not())
                 if clue_value != -1:
@@ -260,7 +260,7 @@ class GeradewegSolver(PuzzleSolver):
                     self.model.Add(len_e == len_s).OnlyEnforceIf(is_se_turn)
                 
                 # SW turn: south + west
-                is_sw_turn = self.model.NewBoolVar(f"turn_sw_{r}_{c}")
+                is_sw_turn = new_bool_var(self.model, "turn_sw_{}_{}", r, c)
                 self.model.AddBoolAnd([has_s, has_w, has_n.Not(), has_e.Not()]).OnlyEnforceIf(is_sw_turn)
                 self.model.AddBoolOr([has_s.Not(), has_w.Not(), has_n, has_e]).OnlyEnforceIf(is_sw_turn.Not())
                 if clue_value != -1:
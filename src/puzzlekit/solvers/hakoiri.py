@@ -3,9 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint 
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class HakoiriSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -75,11 +75,11 @@ class HakoiriSolver(PuzzleSolver):
             for j in range(self.num_cols):
                 pos = Position(i, j)
                 
-                self.is_occupied[pos] = self.model.NewBoolVar(f"occupied_{i}_{j}")
+                self.is_occupied[pos] = new_bool_var(self.model, "occupied_{}_{}", i, j)
                 
                 vars_in_cell = []
                 for s in self.symbols:
-                    self.x[i, j, s] = self.model.NewBoolVar(name = f"x[{i}, {j}, {s}]")
+                    self.x[i, j, s] = new_bool_var(self.model, "x[{}, {}, {}]", i, j, s)
                     vars_in_cell.append(self.x[i, j, s])
                 
                 self.model.Add(sum(vars_in_cell) <= 1)
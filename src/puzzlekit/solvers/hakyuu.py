@@ -4,8 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class HakyuuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "hakyuu",
@@ -90,7 +91,7 @@ class HakyuuSolver(PuzzleSolver):
                 region_id = self.region_grid.value(r, c)
                 size = self.region_sizes[region_id]
                 
-                self.x[r, c] = self.model.NewIntVar(1, size, f'x_{r}_{c}')
+                self.x[r, c] = new_int_var(self.model, 1, size, "x_{}_{}", r, c)
                 
                 cell_val = self.grid.value(r, c)
                 if cell_val.isdigit():
@@ -111,7 +112,7 @@ class HakyuuSolver(PuzzleSolver):
                     region_id = self.region_grid.value(r, c)
                     if self.region_sizes[region_id] >= v:
                         relevant_cols.append(c)
-                        b = self.model.NewBoolVar(f'row_{r}_{c}_eq_{v}')
+                        b = new_bool_var(self.model, "row_{}_{}_eq_{}", r, c, v)
                         self.model.Add(self.x[r, c] == v).OnlyEnforceIf(b)
                         self.model.Add(self.x[r, c] != v).OnlyEnforceIf(b.Not())
                         indicators[c] = b
@@ -133,7 +134,7 @@ class HakyuuSolver(PuzzleSolver):
                 for r in range(self.num_rows):
                     region_id = self.region_grid.value(r, c)
                     if self.region_sizes[region_id] >= v:
-                        b = self.model.NewBoolVar(f'col_{r}_{c}_eq_{v}')
+                        b = new_bool_var(self.model, "col_{}_{}_eq_{}", r, c, v)
                         self.model.Add(self.x[r, c] == v).OnlyEnforceIf(b)
                         self.model.Add(self.x[r, c] != v).OnlyEnforceIf(b.Not())
                         indicators[r] = b
@@ -1,20 +1,24 @@
-from typing import Any, List, Dict, Set, Tuple, FrozenSet
+from typing import Any, Callable, List, Dict, Set, Tuple, FrozenSet, Optional
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
+from puzzlekit.core.presolve import CellState, at_least_one, exactly
 from puzzlekit.core.result import PuzzleResult
-from puzzlekit.utils.ortools_utils import ortools_cpsat_analytics
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.core.build_profiler import BuildProfiler
+from puzzlekit.utils.ortools_utils import ortools_cpsat_analytics, new_bool_var
+from puzzlekit.utils.ortools_utils import LazyConnectivity
 from ortools.sat.python import cp_model as cp
 from collections import deque
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 import time
 
 # A tailored solver for heyawake puzzle. 25% faster than original.
 
 class HeyawakeSolver(PuzzleSolver):
+    # Set to True to encode connectivity up front instead of by lazy cuts (for benchmarks).
+    eager_connectivity: bool = False
     metadata : Dict[str, Any] = {
         "name": "heyawake",
         "aliases": [],
@@ -83,10 +87,14 @@ class HeyawakeSolver(PuzzleSolver):
         
     def _add_constr(self):
         self.x = dict()
+        fixed = self._presolve()
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 # 1 = Shaded (Black), 0 = Unshaded (White)
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
+                if (i, j) in fixed:
+                    self.x[i, j] = self.model.NewConstant(fixed[i, j])
+                else:
+                    self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
         
         self.boundary_cells = self._get_boundary_cells()
         self._add_region_num_constr()
@@ -95,6 +103,38 @@ class HeyawakeSolver(PuzzleSolver):
         self._add_connected_at_least_constr()
         # REMOVED: self._add_connectivity_constr() 
     
+    def _presolve_rules(self) -> List[Callable]:
+        counts = []
+        for region_id, cells in self.region_grid.regions.items():
+            numbers = [int(self.grid.value(cell)) for cell in cells if self.grid.value(cell).isdigit()]
+            if numbers:
+                counts.append(([(pos.r, pos.c) for pos in cells], numbers[0]))
+        neighbors = {
+            (i, j): [(nbr.r, nbr.c) for nbr in self.grid.get_neighbors(Position(i, j), "orthogonal")]
+            for i in range(self.num_rows) for j in range(self.num_cols)
+        }
+        stripes = self._stripes()
+
+        def regions(state: CellState):
+            for cells, count in counts:
+                exactly(state, cells, count)
+            for cells in stripes:
+                at_least_one(state, cells)
+
+        def forced_white(state: CellState):
+            for (i, j), nbrs in neighbors.items():
+                value = state.get(i, j)
+                if value == 1:
+                    # Shaded cells are never adjacent.
+                    state.set_all(nbrs, 0)
+                elif value == 0 and not state.count(nbrs, 0):
+                    # An unshaded cell needs an unshaded neighbor: if only one can be, it is.
+                    unknown = state.unknown(nbrs)
+                    if len(unknown) == 1:
+                        state.set(*unknown[0], 0)
+
+        return [regions, forced_white]
+
     def _add_connected_at_least_constr(self):  
         """  
         Basic connectivity hint:
@@ -125,50 +165,30 @@ class HeyawakeSolver(PuzzleSolver):
                 # Rule 2: Number indicates amount of shaded cells
                 self.model.Add(sum(self.x[pos.r, pos.c] for pos in cells) == int(curr_val))
         
-    def _add_stripe_constr(self):
-        # 3. No line of unshaded cells goes through 2+ borders
-        # Unshaded = 0. So we count contigous 0s.
-        # This is equivalent to: "No sequence of White cells crosses 2 borders"
-        # Since logic is inverted (checking whites), let's stick to your original logic
-        # OR simplify: usually Heyawake rule applies to BLACK cells not crossing borders?
-        # Wait, standard rule: "Painted cells may not be adjacent" (Rule 1).
-        # Rule 3 in your text: "horizontal or vertical line of UN-shaded cells".
-        # Let's keep your original implementation logic assuming it was correct for the variant.
-        
-        # 1. Row constraints
+    def _stripes(self) -> List[List[Tuple[int, int]]]:
+        """
+        Runs of cells that cross two region borders in a row or column. Each must
+        hold a shaded cell, since no line of unshaded cells crosses 2+ borders.
+        """
+        stripes = []
+        # 1. Rows
         for r in range(self.num_rows):
-            border_cols = []
-            for c in range(self.num_cols - 1):
-                if self.region_grid.value(r, c) != self.region_grid.value(r, c + 1):
-                    border_cols.append(c)
-            
-            if len(border_cols) >= 2:
-                for k in range(len(border_cols) - 1):
-                    c1 = border_cols[k]
-                    c2 = border_cols[k + 1]
-                    # Original: sum(cells) <= len - 1 => Not all are 1?
-                    # If cells are WHITE (0), preventing run of whites means we need at least one BLACK (1).
-                    # Target: At least one X in the range crossing 2 borders.
-                    # Range is from c1 to c2+1.
-                    # sum(x) >= 1
-                    cells = [self.x[r, col] for col in range(c1, c2 + 2)]
-                    # If x=1 is black, sum(x) >= 1 means "at least one black cell in this strip"
-                    # This effectively breaks the "line of unshaded cells".
-                    self.model.Add(sum(cells) >= 1)
-
-        # 2. Column constraints
+            border_cols = [c for c in range(self.num_cols - 1) if self.region_grid.value(r, c) != self.region_grid.value(r, c + 1)]
+            for c1, c2 in zip(border_cols, border_cols[1:]):
+                # The strip runs from the cell before the first border to the cell after the second.
+                stripes.append([(r, col) for col in range(c1, c2 + 2)])
+        # 2. Columns
         for c in range(self.num_cols):
-            border_rows = []
-            for r in range(self.num_rows - 1):
-                if self.region_grid.value(r, c) != self.region_grid.value(r + 1, c):
-                    border_rows.append(r)
-            
-            if len(border_rows) >= 2:
-                for k in range(len(border_rows) - 1):
-                    r1 = border_rows[k]
-                    r2 = border_rows[k + 1]
-                    cells = [self.x[row, c] for row in range(r1, r2 + 2)]
-                    self.model.Add(sum(cells) >= 1)
+            border_rows = [r for r in range(self.num_rows - 1) if self.region_grid.value(r, c) != self.region_grid.value(r + 1, c)]
+            for r1, r2 in zip(border_rows, border_rows[1:]):
+                stripes.append([(row, c) for row in range(r1, r2 + 2)])
+        return stripes
+
+    def _add_stripe_constr(self):
+        # 3. No line of unshaded cells goes through 2+ borders:
+        # at least one shaded (x = 1) cell in each such strip.
+        for cells in self._stripes():
+            self.model.Add(sum(self.x[cell] for cell in cells) >= 1)
             
     def _add_adjacent_constr(self):
         # 1. Shaded cells cannot be adjacent
@@ -189,47 +209,6 @@ class HeyawakeSolver(PuzzleSolver):
                     print("-", end=" ")
             print()
     
-    def _check_connectivity(self) -> List[Set[Tuple[int, int]]]:
-        """
-        BFS to find connected components of WHITE cells (x=0).
-        Returns a list of components, where each component is a Set of (r,c).
-        """
-    
-        white_cells = set()
-        for r in range(self.num_rows):
-            for c in range(self.num_cols):
-                if self.solver.Value(self.x[r, c]) == 0:
-                    white_cells.add((r, c))
-        
-        if not white_cells:
-            return [] # No white cells? Rare but fully connected technically.
-
-        components = []
-        visited = set()
-
-        for start_pos in white_cells:
-            if start_pos in visited:
-                continue
-            
-            # Start BFS
-            curr_comp = set()
-            stack = [start_pos]
-            visited.add(start_pos)
-            curr_comp.add(start_pos)
-            
-            while stack:
-                r, c = stack.pop()
-                for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nr, nc = r + dr, c + dc
-                    if (nr, nc) in white_cells and (nr, nc) not in visited:
-                        visited.add((nr, nc))
-                        curr_comp.add((nr, nc))
-                        stack.append((nr, nc))
-            
-            components.append(curr_comp)
-            
-        return components
-    
     def _find_loop_from_component(self, comp: FrozenSet[Position]) -> Set[Position]:
         
         if len(comp) < 4:  # 少于4个格子不可能形成对角线环
@@ -459,138 +438,101 @@ class HeyawakeSolver(PuzzleSolver):
         
         return cycle_edges
         
+    def _add_lazy_connectivity(self):
+        """Unshaded cells stay connected: cuts are added lazily (see LazyConnectivity)."""
+        is_white = {}
+        adjacency_map = {}
+        for i in range(self.num_rows):
+            for j in range(self.num_cols):
+                is_white[i, j] = self.x[i, j].Not()
+                adjacency_map[i, j] = [(nbr.r, nbr.c) for nbr in self.grid.get_neighbors(Position(i, j), "orthogonal")]
+        self.connectivity = LazyConnectivity(
+            self.model, is_white, adjacency_map,
+            separate_extra=self._add_black_chain_cuts,
+            eager=self.eager_connectivity
+        )
+    
+    def _build_search(self):
+        self.model = cp.CpModel()
+        self.solver = cp.CpSolver()
+        self._add_constr()
+        self._add_lazy_connectivity()
+    
+    def _search(self, max_time: Optional[float]) -> int:
+        return self.connectivity.solve(self.solver, max_time)
+    
+    def _add_black_chain_cuts(self) -> int:
+        """
+        Cuts from diagonal chains of shaded cells that wall off part of the grid:
+        a chain touching the border twice, or a closed loop, cannot be all shaded.
+        """
+        num_cuts = 0
+        for comp in self._get_black_diagonal_components():
+            if len(comp) <= 2:
+                continue
+            if len(comp & self.boundary_cells) >= 2:
+                self.model.Add(sum(self.x[pos.r, pos.c] for pos in comp) <= len(comp) - 1)
+                num_cuts += 1
+            loop = self._find_loop_from_component(comp)
+            if loop:
+                self.model.Add(sum(self.x[pos.r, pos.c] for pos in loop) <= len(loop) - 1)
+                num_cuts += 1
+        return num_cuts
+
     # Override the solve method to implement Iterative Constraint Generation
-    def solve(self) -> PuzzleResult:
+    def solve(self, max_time: Optional[float] = None, num_workers: Optional[int] = None,
+              seed: Optional[int] = None, sat_params: Optional[Dict[str, Any]] = None,
+              slim: bool = False, profile_build: bool = False,
+              count_solutions: Optional[int] = None) -> PuzzleResult:
+        if count_solutions is not None and count_solutions < 1:
+            raise ValueError(f"count_solutions must be >= 1, got {count_solutions}")
         tic = time.perf_counter()
         
-        # 1. Init Model
+        # 1. Init Model: everything but the connectivity of white cells, which is
+        # enforced lazily by cuts (see LazyConnectivity).
         self.model = cp.CpModel()
-        self.solver = cp.CpSolver() # We might need to recreate solver or assume it handles incremental properly if we use callbacks.
-        # However, standard CP-SAT usage usually suggests adding constraints to model and calling Solve() again.
-        # Since v9.0+, incremental solving on the SAME solver object is deprecated/removed in favor of stateless Solve(model).
-        # We just pass the model (which accumulates constraints) to `self.solver.Solve(self.model)` repeatedly.
+        self.solver = cp.CpSolver()
+        with BuildProfiler(self, enabled=profile_build) as profiler:
+            self._add_constr() # Add base constraints
+        base_build_time = time.perf_counter() - tic
+        self._configure_cpsat_solver(max_time, num_workers, seed, sat_params)
         
-        self._add_constr() # Add base constraints
+        self._add_lazy_connectivity()
         
-        iteration = 0
         solution_dict = {}
-        add_new = False
+        num_solutions = 0
         while True:
-            iteration += 1
-            # print(f"Iteration {iteration}...")
-            # print(f"Iteration {iteration}...")
-            status = self.solver.Solve(self.model)
-            if iteration > 50 and not add_new:
-                print("DUMPING NEW CONSTRAINT!")
-                add_new = True
-                adjacency_map = {}
-                self.is_white = {}
-                for i in range(self.num_rows):
-                    for j in range(self.num_cols):
-                        pos = Position(i, j)
-                        self.is_white[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
-                        self.model.Add(self.x[i, j] + self.is_white[i, j] == 1)
-                        neighbors = self.grid.get_neighbors(pos, "orthogonal")
-                        adjacency_map[i, j] = set((nbr.r, nbr.c) for nbr in neighbors)
-
-                add_connected_subgraph_constraint(
-                    self.model,
-                    self.is_white,
-                    adjacency_map
-                )
-
-            # Check feasibility
+            remaining = None if max_time is None else max_time - (time.perf_counter() - tic)
+            # The time limit is a budget shared by all rounds.
+            status = self._search(remaining)
             if status not in [cp.OPTIMAL, cp.FEASIBLE]:
                 # Infeasible or Unknown
-                solution_dict = ortools_cpsat_analytics(self.model, self.solver)
-                solution_dict['status'] = {cp.INFEASIBLE: "Infeasible", cp.UNKNOWN: "Unknown", cp.MODEL_INVALID: "Invalid"}.get(status, "Unknown")
+                if num_solutions == 0:
+                    solution_dict = ortools_cpsat_analytics(self.model, self.solver)
+                    solution_dict['status'] = {cp.INFEASIBLE: "Infeasible", cp.UNKNOWN: "Unknown", cp.MODEL_INVALID: "Invalid"}.get(status, "Unknown")
                 break
-            
-            # 2. Check Connectivity
-            black_components = self._get_black_diagonal_components()
-            for comp in black_components:
-                # Rule1. check border overlap
-                if len(comp) <= 2:
-                    continue
-                if len(comp & self.boundary_cells) >= 2:
-                    # have 2 boundary cells in the component
-                    # at least one cell in the component must be white
-                    # print(comp)
-                    # print(f"ADDed! {iteration}")
-                    self.model.Add(sum(self.x[pos.r, pos.c] for pos in comp) <= len(comp) - 1)
-                
-                # Rule2. Check loop in the component
-                # if len(comp) < 4:
-                #     continue
-                # for comp in black_components:
-                loop = self._find_loop_from_component(comp)
-                if loop:
-#                 cuts_added = True
-#                 # print(f"ADD!2")
-#                 # print([[pos.r, pos.c] for pos in loop])
-                    self.model.Add(sum(self.x[pos.r, pos.c] for pos in loop) <= len(loop) - 1)
-                    # break
-                
-            
-            
-            # Case B: Disconnected -> Add Constraints (Cuts)
-            # Strategy: For each isolated component (except maybe the largest one), 
-            # find its boundary (Black cells). At least one of those Black cells MUST be White.
-            components = self._check_connectivity()
-            # Case A: Simply connected (1 component) -> Success
-            if len(components) <= 1:
-                # Done!
+            num_solutions += 1
+            if num_solutions == 1:
                 solution_dict = ortools_cpsat_analytics(self.model, self.solver)
                 solution_dict['build_time'] = time.perf_counter() - tic # Approx total time
                 solution_dict['solution_grid'] = self.get_solution()
                 solution_dict['status'] = "Optimal"
-                solution_dict['iterations'] = iteration
+                solution_dict['iterations'] = self.connectivity.rounds
+            if count_solutions is None or num_solutions >= count_solutions:
                 break
-            # Sort components by size (process smallest first usually better)
-            components.sort(key=len)
-            
-            # # We cut ALL components except the largest one (assuming the largest is the "main" body)
-            # # Actually, cutting all of them is fine too, but usually one is the 'ocean'.
-            # # Let's iterate through all components that are NOT touching the 'main' body.
-            # # But we don't know which is main. Simple heuristic: cut the smaller ones.
-            # # Adding cuts for components[0 ... -2] (all except biggest)
-            for comp in components[:-1]:
-                
-                # Find "Boundary Wall": Black cells adjacent to this component
-                boundary_wall = set()
-                for (r, c) in comp:
-                    for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                        nr, nc = r + dr, c + dc
-                        # Check bounds
-                        if 0 <= nr < self.num_rows and 0 <= nc < self.num_cols:
-                            # If it's NOT in the component, it must be Black (based on extraction logic)
-                            # Verify validity just in case
-                            if (nr, nc) not in comp:
-                                boundary_wall.add((nr, nc))
-                
-                if not boundary_wall:
-                    # If an island has NO boundary wall (e.g. valid puzzle completely partitioned by edges?),
-                    # this usually shouldn't happen in valid Heyawake unless the puzzle is broken into disjoint islands by design (impossible by rule 4).
-                    # Or it means the puzzle is logically infeasible (e.g. checkerboard pattern filling board).
-                    # We can force Model Infeasible.
-                    self.model.AddBoolOr([False])
-                    break
-                
-                # Construct Cut: NOT (All Boundary Cells are Black)
-                # Black = 1. So NOT (Sum(boundary) == Len(boundary))
-                # <=> Sum(boundary) <= Len(boundary) - 1
-                # <=> At least one cell in boundary is 0 (White)
-                wall_vars = [self.x[r, c] for (r, c) in boundary_wall]
-                self.model.Add(sum(wall_vars) <= len(wall_vars) - 1)
+            # Counting: exclude this grid and keep going on the same model.
+            self._exclude_current_solution()
         
         toc = time.perf_counter()
         solution_dict['total_time'] = toc - tic
-        
-        return PuzzleResult(
-            puzzle_type = self.puzzle_type,
-            puzzle_data = vars(self).copy(),
-            solution_data = solution_dict
-        )
+        solution_dict['num_cuts'] = self.connectivity.num_cuts
+        solution_dict['eager_connectivity'] = self.connectivity.eager
+        if count_solutions is not None:
+            solution_dict.update(self._count_summary(num_solutions, status == cp.INFEASIBLE))
+        if profile_build:
+            solution_dict['build_profile'] = profiler.report(base_build_time)
+        
+        return self._make_result(solution_dict, slim)
 
     def get_solution(self):
         sol_grid = copy.deepcopy(self.grid.matrix)
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class HidokuSolver(PuzzleSolver):
@@ -66,7 +67,7 @@ class HidokuSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 # Domain is [0, max_val-1]
-                var = self.model.NewIntVar(0, total_cells - 1, f"cell_{i}_{j}")
+                var = new_int_var(self.model, 0, total_cells - 1, "cell_{}_{}", i, j)
                 self.x[i, j] = var
                 x_flat_vars.append(var)
                 
@@ -85,7 +86,7 @@ class HidokuSolver(PuzzleSolver):
         # k ranges from 0 to total_cells-1 (representing numbers 1 to total_cells)
         self.pos = []
         for k in range(total_cells):
-            self.pos.append(self.model.NewIntVar(0, total_cells - 1, f"pos_of_val_{k}"))
+            self.pos.append(new_int_var(self.model, 0, total_cells - 1, "pos_of_val_{}", k))
             
         # 4. Link Grid and Position using AddInverse
         # If x_flat_vars[index] == value, then pos[value] == index.
@@ -103,27 +104,36 @@ class HidokuSolver(PuzzleSolver):
             # row = index // num_cols
             # col = index % num_cols
             
-            curr_row = self.model.NewIntVar(0, self.num_rows - 1, f"row_{k}")
-            curr_col = self.model.NewIntVar(0, self.num_cols - 1, f"col_{k}")
+            curr_row = new_int_var(self.model, 0, self.num_rows - 1, "row_{}", k)
+            curr_col = new_int_var(self.model, 0, self.num_cols - 1, "col_{}", k)
             self.model.AddDivisionEquality(curr_row, curr_pos, self.num_cols)
             self.model.AddModuloEquality(curr_col, curr_pos, self.num_cols)
             
-            next_row = self.model.NewIntVar(0, self.num_rows - 1, f"row_{k+1}")
-            next_col = self.model.NewIntVar(0, self.num_cols - 1, f"col_{k+1}")
+            next_row = new_int_var(self.model, 0, self.num_rows - 1, "row_{}", k+1)
+            next_col = new_int_var(self.model, 0, self.num_cols - 1, "col_{}", k+1)
             self.model.AddDivisionEquality(next_row, next_pos, self.num_cols)
             self.model.AddModuloEquality(next_col, next_pos, self.num_cols)
             
             # Constraint: Chebyshev distance <= 1
             # |curr_row - next_row| <= 1
-            diff_row = self.model.NewIntVar(0, self.num_rows, f"diff_row_{k}")
+            diff_row = new_int_var(self.model, 0, self.num_rows, "diff_row_{}", k)
             self.model.AddAbsEquality(diff_row, curr_row - next_row)
             self.model.Add(diff_row <= 1)
             
             # |curr_col - next_col| <= 1
-            diff_col = self.model.NewIntVar(0, self.num_cols, f"diff_col_{k}")
+            diff_col = new_int_var(self.model, 0, self.num_cols, "diff_col_{}", k)
             self.model.AddAbsEquality(diff_col, curr_col - next_col)
             self.model.Add(diff_col <= 1)
 
+    def cell_literal(self, r: int, c: int, value: str):
+        if not str(value).isdigit():
+            raise NotImplementedError(f"Hidoku cells are numbers, got '{value}'.")
+        # x holds the 0-based value.
+        literal = new_bool_var(self.model, "cell_{}_{}_is_{}", r, c, value)
+        self.model.Add(self.x[r, c] == int(value) - 1).OnlyEnforceIf(literal)
+        self.model.Add(self.x[r, c] != int(value) - 1).OnlyEnforceIf(literal.Not())
+        return literal
+
     def get_solution(self):
         sol_grid = copy.deepcopy(self.grid.matrix)
         
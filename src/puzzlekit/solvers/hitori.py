@@ -1,9 +1,10 @@
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any
 from puzzlekit.core.solver import IterativePuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connectivity_cut_node_based
-from typeguard import typechecked
+from puzzlekit.core.presolve import CellState
+from puzzlekit.utils.ortools_utils import ConnectivityCutPool
+from puzzlekit.utils.typecheck import typechecked
 
 class HitoriSolver(IterativePuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -45,18 +46,77 @@ class HitoriSolver(IterativePuzzleSolver):
         self._check_grid_dims(self.num_rows, self.num_cols, self.grid.matrix)
         self._check_allowed_chars(self.grid.matrix, {'-'}, validator=lambda x: x.isdigit() and int(x) >= 0)
 
+    def _presolve_rules(self) -> List[Callable]:
+        # Rows and columns as (cells, numbers).
+        lines = [[(i, j) for j in range(self.num_cols)] for i in range(self.num_rows)]
+        lines += [[(i, j) for i in range(self.num_rows)] for j in range(self.num_cols)]
+        lines = [(cells, [self.grid.value(i, j) for i, j in cells]) for cells in lines]
+        adjacent = {}
+        duplicates = {}
+        for cells, numbers in lines:
+            for k, cell in enumerate(cells):
+                adjacent.setdefault(cell, []).extend(cells[m] for m in (k - 1, k + 1) if 0 <= m < len(cells))
+                duplicates.setdefault(cell, []).extend(
+                    other for other, number in zip(cells, numbers) if number == numbers[k] and other != cell
+                )
+        done = set()
+
+        def patterns(state: CellState):
+            # The patterns only depend on the numbers: one pass is enough.
+            if done:
+                return
+            for cells, numbers in lines:
+                for k in range(len(cells) - 1):
+                    if k + 2 < len(cells) and numbers[k] == numbers[k + 2]:
+                        # Sandwich A B A: shading B would leave both A unshaded.
+                        state.set(*cells[k + 1], 0)
+                        if numbers[k + 1] == numbers[k]:
+                            # Triple A A A: the middle one stays, so both ends are shaded.
+                            state.set(*cells[k], 1)
+                            state.set(*cells[k + 2], 1)
+                    if numbers[k] == numbers[k + 1]:
+                        # Pair A A: one of them stays unshaded, so every other A is shaded.
+                        for cell, number in zip(cells, numbers):
+                            if number == numbers[k] and cell not in (cells[k], cells[k + 1]):
+                                state.set(*cell, 1)
+
+        def neighbors(state: CellState):
+            # Around a shaded cell all is unshaded; an unshaded number shades its duplicates.
+            # Each fixed cell is expanded once.
+            while True:
+                pending = [cell for cell in state.fixed() if cell not in done]
+                if not pending:
+                    return
+                for cell in pending:
+                    done.add(cell)
+                    if state.get(*cell) == 1:
+                        state.set_all(adjacent[cell], 0)
+                    else:
+                        state.set_all(duplicates[cell], 1)
+
+        return [patterns, neighbors]
+
     def _setup_initial_model(self):
+        # Presolved cells: constraints they already satisfy are left out.
+        self._fixed_white = {Position(i, j): 1 - value for (i, j), value in self._presolve().items()}
         # 1. create variables
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 pos = Position(i, j)
                 self.is_white[pos] = self.solver.BoolVar(f"white_{pos}")
+                if pos in self._fixed_white:
+                    self.is_white[pos].SetBounds(self._fixed_white[pos], self._fixed_white[pos])
+        self.cut_pool = ConnectivityCutPool(
+            self.solver, self.is_white, lambda p: list(self.grid.get_neighbors(p, "orthogonal"))
+        )
     
         # 2. Shaded cells cannot be horizontally or vertically adjacent.
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 curr = Position(i, j)
                 for neighbor in self.grid.get_neighbors(curr, "orthogonal"):
+                    if self._fixed_white.get(curr) == 1 or self._fixed_white.get(neighbor) == 1:
+                        continue
                     self.solver.Add(self.is_white[curr] + self.is_white[neighbor] >= 1)
         
         # 3. A row or column may not contain two unshaded cells with identical numbers.
@@ -77,6 +137,7 @@ class HitoriSolver(IterativePuzzleSolver):
                 val = self.grid.value(r, c)
                 val_map.setdefault(val, []).append(Position(r, c))
             for val, positions in val_map.items():
+                positions = [pos for pos in positions if self._fixed_white.get(pos) != 0]
                 if len(positions) > 1:
                     self.solver.Add(sum(self.is_white[pos] for pos in positions) <= 1)
         
@@ -87,11 +148,14 @@ class HitoriSolver(IterativePuzzleSolver):
                 val = self.grid.value(r, c)
                 val_map.setdefault(val, []).append(Position(r, c))
             for val, positions in val_map.items():
+                positions = [pos for pos in positions if self._fixed_white.get(pos) != 0]
                 if len(positions) > 1:
                     self.solver.Add(sum(self.is_white[pos] for pos in positions) <= 1)
 
     def _check_and_add_cuts(self) -> bool:
         """
+        Add connectivity cuts for the current MIP solution. Returns the number of
+        constraints added; 0 only when the white cells are connected.
         """
         # 1. Get specific number (0 or 1)
         current_values = {}
@@ -99,16 +163,16 @@ class HitoriSolver(IterativePuzzleSolver):
             # get integer
             current_values[pos] = 1 if var.solution_value() > 0.5 else 0
             
-        # 2. function call
-        # lambda function to detect neighbors
-        cuts_added = add_connectivity_cut_node_based(
-            solver=self.solver,
-            active_vars=self.is_white,
-            current_values=current_values,
-            neighbors_fn=lambda p: list(self.grid.get_neighbors(p, "orthogonal"))
-        )
-        
-        return cuts_added
+        # 2. separate violated connectivity cuts (the pool skips cuts added in earlier rounds)
+        num_new = self.cut_pool.separate(current_values)
+        if num_new == 0 and self.cut_pool.num_components > 1:
+            # Disconnected, yet every violated cut is pooled (the MIP slipped past one
+            # within its tolerance): exclude this assignment itself.
+            self.solver.Add(sum(
+                1 - var if current_values[pos] else var for pos, var in self.is_white.items()
+            ) >= 1)
+            return 1
+        return num_new
 
     def get_solution(self):
         sol_grid = [["" for _ in range(self.num_cols)] for _ in range(self.num_rows)]
@@ -5,7 +5,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class JuosanSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -80,7 +81,7 @@ class JuosanSolver(PuzzleSolver):
         self.is_vertical = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.is_vertical[r, c] = self.model.NewBoolVar(f"v[{r},{c}]")
+                self.is_vertical[r, c] = new_bool_var(self.model, "v[{},{}]", r, c)
 
         # 2. Parallel Run Length Constraints (Rule 1)
         
@@ -121,12 +122,12 @@ class JuosanSolver(PuzzleSolver):
             sum_v = sum(cell_vars)
             
             # Condition A: Sum(Vertical) == Target
-            cond_v = self.model.NewBoolVar(f"region_{rid}_is_v_count")
+            cond_v = new_bool_var(self.model, "region_{}_is_v_count", rid)
             self.model.Add(sum_v == target).OnlyEnforceIf(cond_v)
             
             # Condition B: Sum(Horizontal) == Target
             # Sum(Horizontal) = Total - Sum(Vertical)
-            cond_h = self.model.NewBoolVar(f"region_{rid}_is_h_count")
+            cond_h = new_bool_var(self.model, "region_{}_is_h_count", rid)
             self.model.Add(total_cells - sum_v == target).OnlyEnforceIf(cond_h)
             
             # Rule: Either A or B must be true
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 class KakkuruSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -58,7 +59,7 @@ class KakkuruSolver(PuzzleSolver):
                 if val == '-':
                     upper_bound = min(row_white_counts[r], col_white_counts[c])
                     
-                    self.x[r, c] = self.model.NewIntVar(1, upper_bound, f"x[{r},{c}]")
+                    self.x[r, c] = new_int_var(self.model, 1, upper_bound, "x[{},{}]", r, c)
                 else:
                     self.black_cells[r, c] = int(val)
 
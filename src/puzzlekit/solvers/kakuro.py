@@ -3,8 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class KakuroSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "kakuro",
@@ -75,7 +76,7 @@ class KakuroSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 if self.grid.value(i, j) == "0":
-                    self.x[i, j] = self.model.NewIntVar(1, 9, f'x[{i}, {j}]')
+                    self.x[i, j] = new_int_var(self.model, 1, 9, "x[{}, {}]", i, j)
         
         self._add_sum_constr()
     
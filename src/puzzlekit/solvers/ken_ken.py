@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import re
 
 class KenKenSolver(PuzzleSolver):
@@ -78,7 +79,7 @@ class KenKenSolver(PuzzleSolver):
         self.x = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewIntVar(1, N, f"x[{r},{c}]")
+                self.x[r, c] = new_int_var(self.model, 1, N, "x[{},{}]", r, c)
 
         # 2. Latin Square Constraints (AllDifferent Rows/Cols)
         for r in range(self.num_rows):
@@ -170,7 +171,7 @@ class KenKenSolver(PuzzleSolver):
             else:
                 # |A - B| = Target  <=>  A - B = T  OR  B - A = T
                 # We use AddAbsEquality: Target = |v0 - v1|
-                diff = self.model.NewIntVar(-10000, 10000, "diff") # large enough domain
+                diff = new_int_var(self.model, -10000, 10000, "diff") # large enough domain
                 self.model.Add(diff == variables[0] - variables[1])
                 self.model.AddAbsEquality(target, diff)
                 
@@ -179,8 +180,8 @@ class KenKenSolver(PuzzleSolver):
             if size == 2:
                 # A / B = Target OR B / A = Target
                 # Since we deal with integers: A = B * Target OR B = A * Target
-                div1 = self.model.NewBoolVar(f"div1_{rid}")
-                div2 = self.model.NewBoolVar(f"div2_{rid}")
+                div1 = new_bool_var(self.model, "div1_{}", rid)
+                div2 = new_bool_var(self.model, "div2_{}", rid)
                 
                 self.model.Add(variables[0] == variables[1] * target).OnlyEnforceIf(div1)
                 self.model.Add(variables[1] == variables[0] * target).OnlyEnforceIf(div2)
@@ -197,43 +198,43 @@ class KenKenSolver(PuzzleSolver):
                 possible_ops = []
                 
                 # Check Sum
-                is_sum = self.model.NewBoolVar(f"is_sum_{rid}")
+                is_sum = new_bool_var(self.model, "is_sum_{}", rid)
                 self.model.Add(sum(variables) == target).OnlyEnforceIf(is_sum)
                 possible_ops.append(is_sum)
                 
                 # Check Product
                 # Multi equality cannot be reified directly with OnlyEnforceIf easily in all versions.
                 # Workaround: Create product variable, constrain it, then conditional equality.
-                prod_var = self.model.NewIntVar(0, 999999, "prod_var") # Safe upper bound?
+                prod_var = new_int_var(self.model, 0, 999999, "prod_var") # Safe upper bound?
                 # Actually target can be large, but product of 1..N is bounded.
                 # Just using target as hint. OR-Tools handles large domains well.
                 self.model.AddMultiplicationEquality(prod_var, variables)
                 
-                is_prod = self.model.NewBoolVar("is_prod")
+                is_prod = new_bool_var(self.model, "is_prod")
                 self.model.Add(prod_var == target).OnlyEnforceIf(is_prod)
                 possible_ops.append(is_prod)
                 
                 # Specifics for Size 2
                 if size == 2:
                     # Subtraction
-                    is_sub = self.model.NewBoolVar("is_sub")
+                    is_sub = new_bool_var(self.model, "is_sub")
                     # |a-b|=t
-                    diff_var = self.model.NewIntVar(-10000, 10000, "diff_var")
+                    diff_var = new_int_var(self.model, -10000, 10000, "diff_var")
                     self.model.Add(diff_var == variables[0] - variables[1])
                     # AbsEquality cannot be reified.
                     # Manual Abs Reification: 
                     # abs_diff == target IFF is_sub
                     # abs_diff = |diff_var|
-                    abs_diff = self.model.NewIntVar(0, 10000, "abs_diff")
+                    abs_diff = new_int_var(self.model, 0, 10000, "abs_diff")
                     self.model.AddAbsEquality(abs_diff, diff_var)
                     self.model.Add(abs_diff == target).OnlyEnforceIf(is_sub)
                     possible_ops.append(is_sub)
                     
                     # Division
-                    is_div = self.model.NewBoolVar("is_div")
+                    is_div = new_bool_var(self.model, "is_div")
                     # (v0 == v1*t) OR (v1 == v0*t) IFF is_div
-                    d1 = self.model.NewBoolVar("d1")
-                    d2 = self.model.NewBoolVar("d2")
+                    d1 = new_bool_var(self.model, "d1")
+                    d2 = new_bool_var(self.model, "d2")
                     self.model.Add(variables[0] == variables[1] * target).OnlyEnforceIf(d1)
                     self.model.Add(variables[1] == variables[0] * target).OnlyEnforceIf(d2)
                     
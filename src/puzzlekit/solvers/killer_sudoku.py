@@ -4,9 +4,10 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC, SUDOKU_TEMPLATE_OUTPUT_DESC
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_int_var
 import copy
 import math
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class KillerSudokuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "killer_sudoku",
@@ -72,7 +73,7 @@ class KillerSudokuSolver(PuzzleSolver):
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(1, self.num_rows, name = f"x[{i}, {j}]")
+                self.x[i, j] = new_int_var(self.model, 1, self.num_rows, "x[{}, {}]", i, j)
                 # if self.grid.value(i, j).isdigit():
                 #     self.model.Add(self.x[i, j] == int(self.grid.value(i, j)))
         
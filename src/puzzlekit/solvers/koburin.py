@@ -2,9 +2,9 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class KoburinSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -70,10 +70,10 @@ class KoburinSolver(PuzzleSolver):
                 u = Position(i, j)
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(self.model, all_nodes, self.arc_vars)
 
@@ -85,7 +85,7 @@ class KoburinSolver(PuzzleSolver):
     def _add_koburin_constraints(self):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.black_vars[Position(i, j)] = self.model.NewBoolVar(f"black_{i}_{j}")
+                self.black_vars[Position(i, j)] = new_bool_var(self.model, "black_{}_{}", i, j)
 
         # B. 遍历网格应用规则
         for i in range(self.num_rows):
@@ -2,9 +2,9 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class KuromasuSolver(PuzzleSolver):
@@ -67,7 +67,7 @@ class KuromasuSolver(PuzzleSolver):
         # Pre-scan
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x[{r},{c}]")
+                self.x[r, c] = new_bool_var(self.model, "x[{},{}]", r, c)
                 val = self.grid.value(r, c)
                 if val.isdigit():
                     self.model.Add(self.x[r, c] == 1)
@@ -124,7 +124,7 @@ class KuromasuSolver(PuzzleSolver):
                 cr, cc = r + dr, c + dc
                 
                 while 0 <= cr < self.num_rows and 0 <= cc < self.num_cols:
-                    can_see_k = self.model.NewBoolVar(f"vis_{r}_{c}_d{dr}{dc}_k{steps}")
+                    can_see_k = new_bool_var(self.model, "vis_{}_{}_d{}{}_k{}", r, c, dr, dc, steps)
                     is_white = self.x[cr, cc]
                     
                     if steps == 0:
@@ -2,9 +2,9 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint 
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class KuroshutoSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -69,8 +69,8 @@ class KuroshutoSolver(PuzzleSolver):
     def _add_black_constr(self):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(f"x[{i},{j}]")
-                self.is_white[i, j] = self.model.NewBoolVar(f"is_white[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
+                self.is_white[i, j] = new_bool_var(self.model, "is_white[{},{}]", i, j)
                 self.model.Add(self.is_white[i, j] + self.x[i, j] == 1)
         
         for i in range(self.num_rows):
@@ -102,8 +102,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid  
 from puzzlekit.core.position import Position  
 from ortools.sat.python import cp_model as cp  
-from typeguard import typechecked  
-import math  
+from puzzlekit.utils.ortools_utils import add_contiguous_area_constraint, new_bool_var
+from puzzlekit.utils.typecheck import typechecked  
   
   
 class KurottoSolver(PuzzleSolver):  
@@ -153,7 +153,7 @@ class KurottoSolver(PuzzleSolver):
           
         # Shading variables  
         self.shaded = {  
-            pos: self.model.NewBoolVar(f"s_{pos.r}_{pos.c}")   
+            pos: new_bool_var(self.model, "s_{}_{}", pos.r, pos.c)   
             for pos in self.all_positions  
         }  
           
@@ -176,52 +176,23 @@ class KurottoSolver(PuzzleSolver):
                     self._add_flood_fill_constraint(pos, number + 1)  
   
     def _add_flood_fill_constraint(self, start: Position, target_area: int):  
-        """Optimized flood fill using reduced iterations."""  
-        # Use fewer iterations with better propagation  
-        # max_iter = min(target_area, int(math.sqrt(self.num_rows * self.num_cols)) + 2)  
-        max_iter = target_area
-          
-        prefix = f"{start.r}_{start.c}"  
-          
-        reachable = {}  
-        for pos in self.all_positions:  
-            reachable[pos] = self.model.NewBoolVar(f"r0_{prefix}_{pos.r}_{pos.c}")  
-            self.model.Add(reachable[pos] == (1 if pos == start else 0))  
-          
-        for step in range(max_iter):  
-            new_reachable = {}  
-            for pos in self.all_positions:  
-                new_reachable[pos] = self.model.NewBoolVar(f"r{step+1}_{prefix}_{pos.r}_{pos.c}")  
-                  
-                if pos == start:  
-                    self.model.Add(new_reachable[pos] == 1)  
-                    continue  
-                  
-                neighbors = list(self.grid.get_neighbors(pos))  
-                  
-                # Simplified constraint building  
-                # new_reachable[pos] = reachable[pos] OR (shaded[pos] AND OR(reachable[nbr]))  
-                  
-                or_terms = [reachable[pos]]  
-                  
-                if neighbors:  
-                    # Create: shaded[pos] AND any_neighbor_reachable  
-                    any_nbr_reach = self.model.NewBoolVar(f"anr{step}_{prefix}_{pos.r}_{pos.c}")  
-                    self.model.AddBoolOr([reachable[n] for n in neighbors]).OnlyEnforceIf(any_nbr_reach)  
-                    self.model.AddBoolAnd([reachable[n].Not() for n in neighbors]).OnlyEnforceIf(any_nbr_reach.Not())  
-                      
-                    expand = self.model.NewBoolVar(f"ex{step}_{prefix}_{pos.r}_{pos.c}")  
-                    self.model.AddBoolAnd([self.shaded[pos], any_nbr_reach]).OnlyEnforceIf(expand)  
-                    self.model.AddBoolOr([self.shaded[pos].Not(), any_nbr_reach.Not()]).OnlyEnforceIf(expand.Not())  
-                      
-                    or_terms.append(expand)  
-                  
-                self.model.AddBoolOr(or_terms).OnlyEnforceIf(new_reachable[pos])  
-                self.model.AddBoolAnd([t.Not() for t in or_terms]).OnlyEnforceIf(new_reachable[pos].Not())  
-              
-            reachable = new_reachable  
+        """The shaded blocks touching `start`, plus the circle itself, cover `target_area` cells."""  
+        def is_good(pos):  
+            if pos == start:  
+                return 1  
+            val = self.grid.value(pos)  
+            if val == 'o' or val.isdigit():  
+                return 0  # Circles are never shaded  
+            return self.shaded[pos]  
           
-        self.model.Add(sum(reachable[pos] for pos in self.all_positions) == target_area)  
+        add_contiguous_area_constraint(  
+            self.model,  
+            self.grid,  
+            start,  
+            is_good,  
+            target_area,  
+            prefix=f"num_{start.r}_{start.c}"  
+        )  
   
     def get_solution(self):  
         output_matrix = [["-" for _ in range(self.num_cols)] for _ in range(self.num_rows)]  
@@ -3,8 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class LinesweeperSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -64,11 +64,11 @@ class LinesweeperSolver(PuzzleSolver):
 
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(
             self.model, 
@@ -4,9 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC, LITS_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var, new_int_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class LITSSolver(PuzzleSolver):
@@ -108,7 +108,7 @@ class LITSSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for c in range(self.num_cols):
                 
-                self.x[r, c] = self.model.NewBoolVar(f"x[{r},{c}]")
+                self.x[r, c] = new_bool_var(self.model, "x[{},{}]", r, c)
                 if self.grid.value(r, c) == "@":
                     self.black_block_cells.add((r, c))
                     self.model.Add(self.x[r, c] == 0)
@@ -130,7 +130,7 @@ class LITSSolver(PuzzleSolver):
             if region_val == "@":
                 continue
             region_cells_set = set([(p.r, p.c) for p in cells])
-            self.region_shape_vars[region_val] = self.model.NewIntVar(0, 3, f"region_shape_{region_val}")
+            self.region_shape_vars[region_val] = new_int_var(self.model, 0, 3, "region_shape_{}", region_val)
             
             # Identify valid candidates for this region
             region_candidates = [] # List[ (BoolVar, ShapeName) ]
@@ -165,7 +165,7 @@ class LITSSolver(PuzzleSolver):
                             
                             if valid_placement:
                                 # Create a Candidate Variable
-                                cand_var = self.model.NewBoolVar(f"cand_{region_val}_{shape_name}_{r}_{c}")
+                                cand_var = new_bool_var(self.model, "cand_{}_{}_{}_{}", region_val, shape_name, r, c)
                                 region_candidates.append((cand_var, shape_idx, potential_cells))
             
             if not region_candidates:
@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class MagneticSolver(PuzzleSolver):
@@ -96,11 +97,11 @@ class MagneticSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 
-                self.x[i, j, 1] = self.model.NewBoolVar(f"x[{i},{j},0]")
+                self.x[i, j, 1] = new_bool_var(self.model, "x[{},{},0]", i, j)
                 # Positive
-                self.x[i, j, 2] = self.model.NewBoolVar(f"x[{i},{j},1]")
+                self.x[i, j, 2] = new_bool_var(self.model, "x[{},{},1]", i, j)
                 # Negative
-                self.x[i, j, 3] = self.model.NewBoolVar(f"x[{i},{j},2]")
+                self.x[i, j, 3] = new_bool_var(self.model, "x[{},{},2]", i, j)
                 # Neutral
                 self.model.AddExactlyOne([self.x[i, j, 1], self.x[i, j, 2], self.x[i, j, 3]])
                 
@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 class MakaroSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -103,7 +104,7 @@ class MakaroSolver(PuzzleSolver):
                 else:
                     # White cell
                     r_size = region_sizes[rid]
-                    self.x[r, c] = self.model.NewIntVar(1, r_size, var_name)
+                    self.x[r, c] = new_int_var(self.model, 1, r_size, "{}", var_name)
                     
                     # Pre-filled number constraint
                     if char.isdigit():
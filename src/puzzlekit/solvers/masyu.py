@@ -2,10 +2,10 @@ from typing import Any, Dict, Tuple, List
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class MasyuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "masyu",
@@ -69,10 +69,10 @@ class MasyuSolver(PuzzleSolver):
                 u = Position(i, j)
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(
             self.model, 
@@ -105,7 +105,7 @@ class MasyuSolver(PuzzleSolver):
                 edge_down = self.arc_vars[pos, pos.down] if 0 <= i < self.num_rows - 1 else None
                 vertical_edges = [e for e in [edge_up, edge_down] if e is not None]
                 
-                self.is_turn[pos] = self.model.NewBoolVar(f"is_turn_{i}_{j}")
+                self.is_turn[pos] = new_bool_var(self.model, "is_turn_{}_{}", i, j)
                 
                 if not vertical_edges:
                     # Extreme condition: Only one row.
@@ -156,8 +156,8 @@ class MasyuSolver(PuzzleSolver):
                     
                     # 2. check if its horizontal or vertical
 
-                    is_vertical = self.model.NewBoolVar(f"w_vert_{pos}")
-                    is_horizontal = self.model.NewBoolVar(f"w_hori_{pos}")
+                    is_vertical = new_bool_var(self.model, "w_vert_{}", pos)
+                    is_horizontal = new_bool_var(self.model, "w_hori_{}", pos)
                     
                     self.model.AddBoolOr([is_vertical, is_horizontal])
                     self.model.AddImplication(is_vertical, is_horizontal.Not())
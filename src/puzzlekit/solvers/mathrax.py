@@ -2,7 +2,8 @@ from typing import Any, List, Dict, Set, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import re
 
 class MathraxSolver(PuzzleSolver):
@@ -65,7 +66,7 @@ class MathraxSolver(PuzzleSolver):
         self.x = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), f"x[{r},{c}]")
+                self.x[r, c] = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "x[{},{}]", r, c)
                 
                 # Pre-filled values
                 val = self.grid.value(r, c)
@@ -131,8 +132,8 @@ class MathraxSolver(PuzzleSolver):
                         elif op == '-':
                             # Difference: |v1 - v2| == target 
                             # <=> (v1 - v2 == t) OR (v2 - v1 == t)
-                            diff1 = self.model.NewBoolVar(f"diff1_{r}_{c}")
-                            diff2 = self.model.NewBoolVar(f"diff2_{r}_{c}")
+                            diff1 = new_bool_var(self.model, "diff1_{}_{}", r, c)
+                            diff2 = new_bool_var(self.model, "diff2_{}_{}", r, c)
                             self.model.Add(v1 - v2 == target).OnlyEnforceIf(diff1)
                             self.model.Add(v2 - v1 == target).OnlyEnforceIf(diff2)
                             self.model.AddBoolOr([diff1, diff2])
@@ -141,8 +142,8 @@ class MathraxSolver(PuzzleSolver):
                         elif op == '/' or op == '÷':
                             # Division: v1/v2 == target OR v2/v1 == target
                             # Since we are in integers, this means v1 = v2 * target OR v2 = v1 * target
-                            div1 = self.model.NewBoolVar(f"div1_{r}_{c}")
-                            div2 = self.model.NewBoolVar(f"div2_{r}_{c}")
+                            div1 = new_bool_var(self.model, "div1_{}_{}", r, c)
+                            div2 = new_bool_var(self.model, "div2_{}_{}", r, c)
                             self.model.Add(v1 == v2 * target).OnlyEnforceIf(div1)
                             self.model.Add(v2 == v1 * target).OnlyEnforceIf(div2)
                             self.model.AddBoolOr([div1, div2])
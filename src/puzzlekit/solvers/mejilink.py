@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver  
 from puzzlekit.core.grid import Grid  
 from puzzlekit.core.position import Position  
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected  
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp  
-from typeguard import typechecked  
+from puzzlekit.utils.typecheck import typechecked  
   
 class MejilinkSolver(PuzzleSolver):  
     metadata : Dict[str, Any] = {
@@ -156,7 +156,7 @@ class MejilinkSolver(PuzzleSolver):
                     edge_set.add(self._edge_key(Position(r, c+1), Position(r+1, c+1)))  
   
         for u, v in edge_set:  
-            self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")  
+            self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)  
   
         self.node_active = add_circuit_constraint_from_undirected(  
             self.model, all_nodes, self.arc_vars  
@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple, Optional
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class MidLoopSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -73,10 +73,10 @@ class MidLoopSolver(PuzzleSolver):
                 u = Position(i, j)
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(self.model, all_nodes, self.arc_vars)
 
@@ -100,7 +100,7 @@ class MidLoopSolver(PuzzleSolver):
                 break
             
             edge = self._get_edge_var(Position(curr_r, curr_c), Position(next_r, next_c))
-            segment_active = self.model.NewBoolVar(f"seg_{r}_{c}_{dr}_{dc}_{len(length_components)}")
+            segment_active = new_bool_var(self.model, "seg_{}_{}_{}_{}_{}", r, c, dr, dc, len(length_components))
             
             # segment_active = prev_active AND edge
             # If previous segment (or root) was active, AND there is an edge in this direction, count it.
@@ -3,9 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 from collections import defaultdict
 
 class MoonSunSolver(PuzzleSolver):
@@ -100,12 +100,12 @@ class MoonSunSolver(PuzzleSolver):
                 # Horizontal edges
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
                 # Vertical edges
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         
         self.node_active = add_circuit_constraint_from_undirected(
@@ -124,7 +124,7 @@ class MoonSunSolver(PuzzleSolver):
                 unique_regions.add(self.region_grid.value(r, c))
         
         for rid in unique_regions:
-            self.is_moon_region[rid] = self.model.NewBoolVar(f"region_{rid}_is_moon")
+            self.is_moon_region[rid] = new_bool_var(self.model, "region_{}_is_moon", rid)
 
         for rid, cells in self.region_grid.regions.items():
             moon_count = sum(1 for cell in cells if self.grid.value(cell) == 'x')
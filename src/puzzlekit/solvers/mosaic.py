@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 class MosaicSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "mosaic",
@@ -72,7 +73,7 @@ class MosaicSolver(PuzzleSolver):
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name = f"x[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
                 
         self._add_num_constr()
     
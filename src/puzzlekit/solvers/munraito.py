@@ -3,8 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class MunraitoSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "munraito",
@@ -72,13 +73,13 @@ class MunraitoSolver(PuzzleSolver):
     def _init_vars(self):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.stars[i, j] = self.model.NewBoolVar(f's_{i}_{j}')
-                self.clouds[i, j] = self.model.NewBoolVar(f'c_{i}_{j}')
+                self.stars[i, j] = new_bool_var(self.model, "s_{}_{}", i, j)
+                self.clouds[i, j] = new_bool_var(self.model, "c_{}_{}", i, j)
 
-                self.beam_lr[i, j] = self.model.NewBoolVar(f'blr_{i}_{j}')
-                self.beam_rl[i, j] = self.model.NewBoolVar(f'brl_{i}_{j}')
-                self.beam_ud[i, j] = self.model.NewBoolVar(f'bud_{i}_{j}')
-                self.beam_du[i, j] = self.model.NewBoolVar(f'bdu_{i}_{j}')
+                self.beam_lr[i, j] = new_bool_var(self.model, "blr_{}_{}", i, j)
+                self.beam_rl[i, j] = new_bool_var(self.model, "brl_{}_{}", i, j)
+                self.beam_ud[i, j] = new_bool_var(self.model, "bud_{}_{}", i, j)
+                self.beam_du[i, j] = new_bool_var(self.model, "bdu_{}_{}", i, j)
 
                 cell_val = self.grid.value(i, j)
 
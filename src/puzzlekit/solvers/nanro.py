@@ -4,9 +4,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var, new_int_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class NanroSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -62,13 +62,13 @@ class NanroSolver(PuzzleSolver):
         
         # Create region value variables (1 to region_size)
         for rid, size in region_sizes.items():
-            self.region_value[rid] = self.model.NewIntVar(1, size, f"region_val_{rid}")
+            self.region_value[rid] = new_int_var(self.model, 1, size, "region_val_{}", rid)
         
         # Create cell fill variables
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 pos = Position(i, j)
-                self.is_filled[pos] = self.model.NewBoolVar(f"filled_{pos}")
+                self.is_filled[pos] = new_bool_var(self.model, "filled_{}", pos)
         
         # 2. Region Clue Constraints (from grid input)
         region_clues = {}  # region_id -> required value
@@ -113,7 +113,7 @@ class NanroSolver(PuzzleSolver):
                     if rid1 != rid2:  # Different regions
                         # If both filled, their region values must differ
                         # Use indicator variable to enforce: is_filled[pos] + is_filled[nbr] <= 1 OR values differ
-                        indicator = self.model.NewBoolVar(f"diff_{pos}_{nbr}")
+                        indicator = new_bool_var(self.model, "diff_{}_{}", pos, nbr)
                         
                         # Case 1: region_value[rid1] > region_value[rid2]
                         self.model.Add(
@@ -130,7 +130,7 @@ class NanroSolver(PuzzleSolver):
                     nbr = Position(i + 1, j)
                     rid2 = self.region_grid.value(i + 1, j)
                     if rid1 != rid2:  # Different regions
-                        indicator = self.model.NewBoolVar(f"diff_{pos}_{nbr}")
+                        indicator = new_bool_var(self.model, "diff_{}_{}", pos, nbr)
                         
                         self.model.Add(
                             self.region_value[rid1] - self.region_value[rid2] >= 1
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class NawabariSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -131,7 +132,7 @@ class NawabariSolver(PuzzleSolver):
                             
                             if valid_content:
                                 # Create candidate variable
-                                cand_var = self.model.NewBoolVar(f"rect_{num_idx}_{r}_{c}_{h}_{w}")
+                                cand_var = new_bool_var(self.model, "rect_{}_{}_{}_{}_{}", num_idx, r, c, h, w)
                                 self.candidates.append({
                                     'var': cand_var,
                                     'r': r, 'c': c, 'h': h, 'w': w,
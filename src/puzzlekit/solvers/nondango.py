@@ -4,8 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class NondangoSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "nondango",
@@ -59,7 +60,7 @@ class NondangoSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 if self.grid.value(i, j) == "x":
-                    self.x[i, j] = self.model.NewBoolVar(name = f"x[{i}, {j}]")
+                    self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
         
         self._add_regions_constr()
         self._add_consecutive_constr()
@@ -1,9 +1,13 @@
-from typing import Any, List, Dict
+from typing import Any, Callable, List, Dict, Tuple
+import numpy as np
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
+from puzzlekit.core.presolve import CellState, PresolveConflict, UNKNOWN
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
+
 
 class NonogramSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -55,16 +59,28 @@ class NonogramSolver(PuzzleSolver):
         """
     }
 
+    ENCODINGS = ("automaton", "blocks")
+
     @typechecked
-    def __init__(self, num_rows: int, num_cols: int, rows: List[List[str]], cols: List[List[str]], grid: List[List[str]] = list()):
+    def __init__(self, num_rows: int, num_cols: int, rows: List[List[str]], cols: List[List[str]], grid: List[List[str]] = list(),
+                 encoding: str = "automaton"):
+        """
+        `encoding` selects the line model: "automaton" (default) constrains each row and
+        column's cells with AddAutomaton over the regular language of its clue; "blocks"
+        places each block by an integer start variable, with reified coverage per cell.
+        """
         self.num_rows: int = num_rows
         self.num_cols: int  = num_cols
         self.grid: Grid[str] = Grid(grid) if grid else Grid([["-" for _ in range(self.num_cols)] for _ in range(self.num_rows)])
-        self.rows: List[List[Any]] = rows
-        self.cols: List[List[Any]] = cols
+        # validate_input converts the clues to int: work on copies, not the caller's lists.
+        self.rows: List[List[Any]] = [list(line) for line in rows]
+        self.cols: List[List[Any]] = [list(line) for line in cols]
+        self.encoding: str = encoding
         self.validate_input()
     
     def validate_input(self):
+        if self.encoding not in self.ENCODINGS:
+            raise ValueError(f"encoding must be one of {self.ENCODINGS}, got '{self.encoding}'")
         self._check_grid_dims(self.num_rows, self.num_cols, self.grid.matrix)
         self._check_allowed_chars(self.grid.matrix, {'-', "x", "o"})
         for i in range(self.num_rows):
@@ -91,7 +107,7 @@ class NonogramSolver(PuzzleSolver):
         In CP-SAT, we must explictly create a boolean variable that represents this truth.
         """
         # Create the boolean variable indicating if item_var is in range
-        is_in_range = self.model.NewBoolVar(f'in_range_{item_var}_{lower_bound}_{upper_bound}')
+        is_in_range = new_bool_var(self.model, "in_range_{}_{}_{}", item_var, lower_bound, upper_bound)
         
         # Implementation via implication:
         # 1. if is_in_range is true => item_var >= lower AND item_var <= upper
@@ -100,8 +116,8 @@ class NonogramSolver(PuzzleSolver):
         
         # 2. if is_in_range is false => item_var < lower OR item_var > upper
         # We need auxiliary bools for the "OR" condition in the negation
-        check_low = self.model.NewBoolVar(f'check_low_{item_var}')
-        check_high = self.model.NewBoolVar(f'check_high_{item_var}')
+        check_low = new_bool_var(self.model, "check_low_{}", item_var)
+        check_high = new_bool_var(self.model, "check_high_{}", item_var)
         
         self.model.Add(item_var < lower_bound).OnlyEnforceIf(check_low)
         self.model.Add(item_var >= lower_bound).OnlyEnforceIf(check_low.Not())
@@ -139,8 +155,7 @@ class NonogramSolver(PuzzleSolver):
                 
                 # Note: In OR-Tools we must define bounds immediately.
                 # A loose bound is [0, other_dim_len], but we use the optimized ones from the Z3 logic.
-                new_var = self.model.NewIntVar(min_start, max_start + span_len + 1 + total_clue_len, 
-                                               f"{identifier}_{line_num}_{span_num}")
+                new_var = new_int_var(self.model, min_start, max_start + span_len + 1 + total_clue_len, "{}_{}_{}", identifier, line_num, span_num)
                 
                 self._cp_vars.append(new_var)
 
@@ -163,6 +178,179 @@ class NonogramSolver(PuzzleSolver):
             result_vars.append(new_vars)
         return result_vars
 
+    @staticmethod
+    def _line_automaton(clues: List[int]) -> Tuple[List[Tuple[int, int, int]], List[int]]:
+        """
+        DFA of the cell values (1 = filled) of a line with these block lengths, as
+        (transitions, final states) for AddAutomaton; the start state is 0.
+
+        State s means the first s symbols of the pattern 1^c1 0 1^c2 0 ... 1^ck 0 have
+        been read. State 0 and the states right after a 0 loop on further 0s.
+        """
+        pattern = []
+        for k, length in enumerate(clues):
+            if k > 0:
+                pattern.append(0)
+            pattern += [1] * length
+        pattern.append(0)
+        transitions = []
+        for state in range(len(pattern) + 1):
+            in_gap = state == 0 or pattern[state - 1] == 0
+            if in_gap:
+                transitions.append((state, 0, state))
+            if state < len(pattern) and not (in_gap and pattern[state] == 0):
+                transitions.append((state, pattern[state], state + 1))
+        final_states = [len(pattern) - 1, len(pattern)]
+        return transitions, final_states
+
+    @staticmethod
+    def _placements(padded: np.ndarray, lengths: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """
+        Left-to-right placement DP over a batch of lines, each padded with one empty cell
+        at both ends. Line l has blocks lengths[l, :counts[l]].
+
+        reach[b, l, i] says the first i cells of line l can hold exactly its blocks 0..b-1,
+        each followed by an empty cell, with all other cells empty. starts[b][l, s] says
+        block b fits at s (no empty cell under it, none filled right after it) with
+        blocks 0..b-1 before it (starts has a spare last column, always False).
+        """
+        num_lines, n = padded.shape
+        # Gathers use flat takes: array.take(index + offsets) is array[l, index[l, j]]
+        # for arrays of width n + 1, much cheaper than fancy indexing.
+        offsets = np.arange(0, num_lines * (n + 1), n + 1)[:, None]
+        filled_cum = np.zeros((num_lines, n + 1), dtype=np.int32)
+        np.cumsum(padded == 1, axis=1, out=filled_cum[:, 1:])
+        empty_cum = np.zeros((num_lines, n + 1), dtype=np.int32)
+        np.cumsum(padded == 0, axis=1, out=empty_cum[:, 1:])
+        index = np.arange(n + 1)
+        reach = [filled_cum == 0]
+        starts = []
+        for b in range(lengths.shape[1]):
+            length = lengths[:, b:b + 1]
+            end = index + length
+            fits = (index >= 1) & (end <= n - 1) & (b < counts)[:, None]
+            end = np.minimum(end, n - 1) + offsets
+            start = (fits & reach[-1] & (filled_cum.take(end + 1) == filled_cum.take(end))
+                     & (empty_cum.take(end) == empty_cum))
+            starts.append(start)
+            # After the block and its trailing empty cell, extend over cells that can be empty.
+            origin = index - length - 1
+            source = (origin >= 0) & start.take(np.maximum(origin, 0) + offsets)
+            last = np.maximum.accumulate(np.where(source, index, -1), axis=1)
+            reach.append((last >= 0) & (filled_cum.take(np.maximum(last, 0) + offsets) == filled_cum))
+        return np.stack(reach), starts
+
+    @classmethod
+    def _solve_lines(cls, values: np.ndarray, lengths: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Line logic for a batch of lines of equal length (1 filled, 0 empty, UNKNOWN).
+
+        Returns the lines with every cell fixed that takes the same value in all placements
+        of the line's blocks that agree with its known cells; raises PresolveConflict if a
+        line has no such placement. The forward and backward passes of `_placements` are
+        the left-most/right-most overlap rule made exact: a block can sit at a position
+        iff both passes allow it there.
+        """
+        num_lines, n = values.shape[0], values.shape[1] + 2
+        lengths = lengths[:, :max(1, int(counts.max()))]
+        padded = np.pad(values, ((0, 0), (1, 1)))
+        lines = np.arange(num_lines)
+        offsets = lines[:, None] * (n + 1)
+        order = counts[:, None] - 1 - np.arange(lengths.shape[1])
+        reversed_lengths = np.where(order >= 0, np.take_along_axis(lengths, np.maximum(order, 0), axis=1), 0)
+        # One pass over the lines and their mirror images gives both directions.
+        reach, starts = cls._placements(
+            np.concatenate((padded, padded[:, ::-1])),
+            np.concatenate((lengths, reversed_lengths)),
+            np.concatenate((counts, counts))
+        )
+        forward = reach[:, :num_lines]
+        backward = reach[:, num_lines:, ::-1]
+        starts = [start[:num_lines] for start in starts]
+        if not forward[counts, lines, n].all():
+            raise PresolveConflict("no placement of the clues fits a line")
+
+        def suffix(b: int) -> np.ndarray:
+            # suffix(b)[l, i]: cells i.. of line l can hold exactly its blocks b..
+            remaining = counts - b
+            return backward[np.maximum(remaining, 0), lines] & (remaining >= 0)[:, None]
+
+        can_be_empty = np.zeros((num_lines, n), dtype=bool)
+        can_be_filled = np.zeros((num_lines, n), dtype=bool)
+        placed_cum = np.zeros((num_lines, n + 1), dtype=np.int32)
+        after = suffix(0)
+        for b in range(lengths.shape[1] + 1):
+            can_be_empty |= forward[b][:, 1:] & after[:, :n]
+            if b == lengths.shape[1]:
+                break
+            length = lengths[:, b:b + 1]
+            after = suffix(b + 1)
+            placed = starts[b][:, :n] & after.take(np.minimum(np.arange(n) + length, n) + offsets)
+            # Cell i is covered iff block b is placed at a start in (i - length, i].
+            np.cumsum(placed, axis=1, out=placed_cum[:, 1:])
+            window = np.maximum(np.arange(1, n + 1) - length, 0)
+            can_be_filled |= placed_cum[:, 1:] > placed_cum.take(window + offsets)
+        result = np.where(can_be_empty & can_be_filled, UNKNOWN, can_be_filled).astype(np.int8)
+        return result[:, 1:-1]
+
+    def _line_clues(self) -> List[List[int]]:
+        """Block lengths of each row, then each column ('-' or 0 marks an empty line)."""
+        return [[length for length in line_clues if isinstance(length, int) and length > 0]
+                for line_clues in self.rows + self.cols]
+
+    def _presolve_rules(self) -> List[Callable]:
+        clues = self._line_clues()
+        width = max(1, max(len(line_clues) for line_clues in clues))
+        lengths = np.array([line_clues + [0] * (width - len(line_clues)) for line_clues in clues], dtype=np.int64)
+        counts = np.array([len(line_clues) for line_clues in clues], dtype=np.int64)
+        row_lines = np.arange(self.num_rows)
+        col_lines = np.arange(self.num_rows, self.num_rows + self.num_cols)
+
+        # Cell values the lines were last solved from.
+        solved_from = np.full((self.num_rows, self.num_cols), UNKNOWN - 1, dtype=np.int8)
+
+        def line_logic(state: CellState):
+            # Solve the changed rows, then the changed columns, in batches, until neither
+            # changes: only lines that crossed a newly fixed cell are solved again.
+            changed = state.values != solved_from
+            dirty_rows = changed.any(axis=1)
+            dirty_cols = changed.any(axis=0)
+            while dirty_rows.any() or dirty_cols.any():
+                for by_row in (True, False):
+                    grid = state.values if by_row else state.values.T
+                    dirty = dirty_rows if by_row else dirty_cols
+                    selected = np.nonzero(dirty)[0]
+                    dirty[:] = False
+                    if not len(selected):
+                        continue
+                    line_index = (row_lines if by_row else col_lines)[selected]
+                    before = grid[selected]
+                    after = self._solve_lines(before, lengths[line_index], counts[line_index])
+                    for k, i in zip(*np.nonzero((before == UNKNOWN) & (after != UNKNOWN))):
+                        line, i = int(selected[k]), int(i)
+                        r, c = (line, i) if by_row else (i, line)
+                        state.set(r, c, int(after[k, i]))
+                        (dirty_cols if by_row else dirty_rows)[i] = True
+            solved_from[:] = state.values
+
+        return [line_logic]
+
+    def _add_automaton_constr(self, fixed: Dict[Tuple[int, int], int]):
+        for r in range(self.num_rows):
+            for c in range(self.num_cols):
+                if (r, c) in fixed:
+                    self.board_vars[r][c] = self.model.NewConstant(fixed[r, c])
+                else:
+                    self.board_vars[r][c] = new_bool_var(self.model, "cell_{}_{}", r, c)
+        lines = [[(r, c) for c in range(self.num_cols)] for r in range(self.num_rows)]
+        lines += [[(r, c) for r in range(self.num_rows)] for c in range(self.num_cols)]
+        for cells, clues in zip(lines, self._line_clues()):
+            # Presolve checked fully fixed lines against their clues.
+            if all(cell in fixed for cell in cells):
+                continue
+            transitions, final_states = self._line_automaton(clues)
+            self.model.AddAutomaton([self.board_vars[r][c] for r, c in cells], 0, final_states, transitions)
+
     def _add_constr(self):
         # Initialize OR-Tools Model and Solver
         self.model = cp.CpModel()
@@ -173,7 +361,20 @@ class NonogramSolver(PuzzleSolver):
         self._cp_vars = []
         # Matrix to store boolean variables representing the final state of each cell
         self.board_vars = [[None for _ in range(self.num_cols)] for _ in range(self.num_rows)]
+        # Line logic pins every determined cell; often it solves the whole puzzle.
+        fixed = self._presolve()
+        solved = len(fixed) == self.num_rows * self.num_cols
+        if self._presolve_stats is not None:
+            self._presolve_stats['solved'] = solved
+        if self.encoding == "automaton" or solved:
+            # A solved board is all constants, whatever the encoding.
+            self._add_automaton_constr(fixed)
+        else:
+            self._add_block_constr()
+            for (r, c), value in fixed.items():
+                self.model.Add(self.board_vars[r][c] == value)
 
+    def _add_block_constr(self):
         # 1. Create start position variables for rows and columns
         # row_vars[i][k] is start index of k-th block in row i
         row_block_vars = self._constraints_one_dim(self.rows, self.num_cols, 'r')
@@ -188,7 +389,7 @@ class NonogramSolver(PuzzleSolver):
                 
                 # Create a main boolean variable for cell (r,c). 
                 # True = Filled ('x' or 'o'), False = Empty.
-                is_filled = self.model.NewBoolVar(f"cell_{r}_{c}")
+                is_filled = new_bool_var(self.model, "cell_{}_{}", r, c)
                 self.board_vars[r][c] = is_filled
                 
                 # --- Row Logic ---
@@ -210,7 +411,7 @@ class NonogramSolver(PuzzleSolver):
                     row_block_coverage_bools.append(covers)
                 
                 # Define: Row says "Taken" if AT LEAST ONE block covers this cell
-                row_says_taken = self.model.NewBoolVar(f"row_taken_{r}_{c}")
+                row_says_taken = new_bool_var(self.model, "row_taken_{}_{}", r, c)
                 if row_block_coverage_bools:
                     self.model.AddBoolOr(row_block_coverage_bools).OnlyEnforceIf(row_says_taken)
                     self.model.AddBoolAnd([b.Not() for b in row_block_coverage_bools]).OnlyEnforceIf(row_says_taken.Not())
@@ -232,7 +433,7 @@ class NonogramSolver(PuzzleSolver):
                     col_block_coverage_bools.append(covers)
 
                 # Define: Col says "Taken" if AT LEAST ONE block covers this cell
-                col_says_taken = self.model.NewBoolVar(f"col_taken_{r}_{c}")
+                col_says_taken = new_bool_var(self.model, "col_taken_{}_{}", r, c)
                 if col_block_coverage_bools:
                     self.model.AddBoolOr(col_block_coverage_bools).OnlyEnforceIf(col_says_taken)
                     self.model.AddBoolAnd([b.Not() for b in col_block_coverage_bools]).OnlyEnforceIf(col_says_taken.Not())
@@ -2,10 +2,10 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class NumberCrossSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -58,7 +58,7 @@ class NumberCrossSolver(PuzzleSolver):
         self.x = {} # Boolean: Is cell (r, c) part of the snake?
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(f"x[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "x[{},{}]", i, j)
         self._add_row_col_constr()
     
     def _add_row_col_constr(self):
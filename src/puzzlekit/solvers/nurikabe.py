@@ -1,10 +1,11 @@
-from typing import Any, List, Dict, Set, Tuple
+from typing import Any, Callable, List, Dict, Set, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.core.presolve import UNKNOWN, CellState
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import time
 
 class NurikabeSolver(PuzzleSolver):
@@ -70,94 +71,57 @@ x x x x x x x - - x
         self._check_grid_dims(self.num_rows, self.num_cols, self.grid.matrix)
         self._check_allowed_chars(self.grid.matrix, {'-'}, validator=lambda x: x.isdigit() and int(x) >= 1)
 
-    def _lightweight_preprocessing(self) -> Dict[Position, int]:
+    def _presolve_rules(self) -> List[Callable]:
         """
-        Run lightweight deterministic inference BEFORE CP-SAT to fix cells.
-        Returns dict of {position: color} where color=1 for black, 0 for white.
+        Lightweight deterministic inference, run before CP-SAT to fix cells
+        (1 = black, 0 = white). Numbered cells are given as white.
         """
-        fixed = {}
-        changed = True
-        grid_state = {}  # -1=unknown, 0=white, 1=black
-        
-        # Initialize state
-        for r in range(self.num_rows):
-            for c in range(self.num_cols):
-                pos = Position(r, c)
-                val = self.grid.value(r, c)
-                if val.isdigit():
-                    grid_state[pos] = 0  # Numbered cells are white
-                    fixed[pos] = 0
-                else:
-                    grid_state[pos] = -1  # Unknown
-        
-        # Helper: get region size including unknowns that MUST be white
-        def get_must_white_region(start: Position) -> Tuple[Set[Position], Set[Position]]:
-            """Returns (white_cells, unknown_neighbors) for region containing start."""
-            if grid_state[start] != 0:
-                return set(), set()
-            
+        neighbors = {
+            (r, c): [(nb.r, nb.c) for nb in self.grid.get_neighbors(Position(r, c), "orthogonal")]
+            for r in range(self.num_rows) for c in range(self.num_cols)
+        }
+        hints = [((pos.r, pos.c), size) for pos, size in self.hints.items()]
+        blocks = [
+            [(r, c), (r, c + 1), (r + 1, c), (r + 1, c + 1)]
+            for r in range(self.num_rows - 1) for c in range(self.num_cols - 1)
+        ]
+
+        def must_white_region(state: CellState, start: Tuple[int, int]) -> Tuple[Set, Set]:
+            """Returns (white_cells, unknown_neighbors) for the white region containing start."""
             white_cells = {start}
             unknown_neighbors = set()
             queue = [start]
-            visited = {start}
-            
             while queue:
-                pos = queue.pop(0)
-                for nb in self.grid.get_neighbors(pos, "orthogonal"):
-                    if nb in visited:
+                pos = queue.pop()
+                for nb in neighbors[pos]:
+                    if nb in white_cells or nb in unknown_neighbors:
                         continue
-                    visited.add(nb)
-                    if grid_state.get(nb, -1) == 0:
+                    value = state.get(*nb)
+                    if value == 0:
                         white_cells.add(nb)
                         queue.append(nb)
-                    elif grid_state.get(nb, -1) == -1:
+                    elif value == UNKNOWN:
                         unknown_neighbors.add(nb)
             return white_cells, unknown_neighbors
-        
-        # Iterative inference
-        while changed:
-            changed = False
-            
-            # Rule 1: Complete islands → surround with black
-            for hint_pos, size in self.hints.items():
-                if grid_state[hint_pos] != 0:
-                    continue
-                white_cells, unknown_neighbors = get_must_white_region(hint_pos)
-                if len(white_cells) == size and unknown_neighbors:
-                    for nb in unknown_neighbors:
-                        if grid_state.get(nb, -1) == -1:
-                            grid_state[nb] = 1
-                            fixed[nb] = 1
-                            changed = True
-            
-            # Rule 2: Single liberty → must be white
-            for hint_pos, size in self.hints.items():
-                if grid_state[hint_pos] != 0:
-                    continue
-                white_cells, unknown_neighbors = get_must_white_region(hint_pos)
-                if len(white_cells) < size and len(unknown_neighbors) == 1:
-                    nb = next(iter(unknown_neighbors))
-                    if grid_state.get(nb, -1) == -1:
-                        grid_state[nb] = 0
-                        fixed[nb] = 0
-                        changed = True
-            
+
+        def islands(state: CellState):
+            for hint_pos, size in hints:
+                white_cells, unknown_neighbors = must_white_region(state, hint_pos)
+                if len(white_cells) == size:
+                    # Rule 1: Complete islands → surround with black
+                    state.set_all(unknown_neighbors, 1)
+                elif len(white_cells) < size and len(unknown_neighbors) == 1:
+                    # Rule 2: Single liberty → must be white
+                    state.set(*unknown_neighbors.pop(), 0)
+
+        def pools(state: CellState):
             # Rule 3: 2x2 pool prevention (3 black + 1 unknown → unknown must be white)
-            for r in range(self.num_rows - 1):
-                for c in range(self.num_cols - 1):
-                    cells = [
-                        Position(r, c), Position(r, c+1),
-                        Position(r+1, c), Position(r+1, c+1)
-                    ]
-                    blacks = sum(1 for p in cells if grid_state.get(p, -1) == 1)
-                    unknowns = [p for p in cells if grid_state.get(p, -1) == -1]
-                    if blacks == 3 and len(unknowns) == 1:
-                        p = unknowns[0]
-                        grid_state[p] = 0
-                        fixed[p] = 0
-                        changed = True
-        
-        return fixed
+            for cells in blocks:
+                unknown = state.unknown(cells)
+                if len(unknown) == 1 and state.count(cells, 1) == 3:
+                    state.set(*unknown[0], 0)
+
+        return [islands, pools]
 
     def _add_constr(self):
         self.model = cp.CpModel()
@@ -168,7 +132,10 @@ x x x x x x x - - x
         # ==========================================
         # 0. Preprocessing
         # ==========================================
-        fixed_cells = self._lightweight_preprocessing()
+        fixed_cells = {
+            Position(r, c): value
+            for (r, c), value in self._presolve({(pos.r, pos.c): 0 for pos in self.hints}).items()
+        }
         
         # ==========================================
         # 1. Variables
@@ -180,7 +147,7 @@ x x x x x x x - - x
                 if pos in fixed_cells:
                     self.is_black[pos] = self.model.NewConstant(fixed_cells[pos])
                 else:
-                    self.is_black[pos] = self.model.NewBoolVar(f"black_{r}_{c}")
+                    self.is_black[pos] = new_bool_var(self.model, "black_{}_{}", r, c)
         
         # ==========================================
         # 2. Hint cells must be white
@@ -220,73 +187,17 @@ x x x x x x x - - x
                 island_membership[hint_pos].append(membership_const)
                 continue
             
-            # Flood-fill variables
-            flood = {}
-            for t in range(size + 1):
-                for r in range(self.num_rows):
-                    for c in range(self.num_cols):
-                        pos = Position(r, c)
-                        flood[(t, pos)] = self.model.NewBoolVar(
-                            f"flood_{hint_pos.r}_{hint_pos.c}_{t}_{r}_{c}"
-                        )
-            
-            # Initial state (t=0)
-            for r in range(self.num_rows):
-                for c in range(self.num_cols):
-                    pos = Position(r, c)
-                    if pos == hint_pos:
-                        self.model.Add(flood[(0, pos)] == 1)
-                    else:
-                        self.model.Add(flood[(0, pos)] == 0)
-            
-            # Iterative expansion
-            for t in range(size):
-                for r in range(self.num_rows):
-                    for c in range(self.num_cols):
-                        pos = Position(r, c)
-                        option1 = flood[(t, pos)]
-                        neighbors = self.grid.get_neighbors(pos, 'orthogonal')
-                        neighbor_reached = [flood[(t, nb)] for nb in neighbors]
-                        
-                        if neighbor_reached:
-                            has_reachable_neighbor = self.model.NewBoolVar(
-                                f"has_reachable_{hint_pos.r}_{hint_pos.c}_{t}_{r}_{c}"
-                            )
-                            self.model.AddBoolOr(neighbor_reached).OnlyEnforceIf(has_reachable_neighbor)
-                            self.model.AddBoolAnd([v.Not() for v in neighbor_reached]).OnlyEnforceIf(has_reachable_neighbor.Not())
-                            
-                            is_white = self.is_black[pos].Not()
-                            
-                            option2 = self.model.NewBoolVar(
-                                f"option2_{hint_pos.r}_{hint_pos.c}_{t}_{r}_{c}"
-                            )
-                            self.model.AddBoolAnd([has_reachable_neighbor, is_white]).OnlyEnforceIf(option2)
-                            self.model.AddBoolOr([has_reachable_neighbor.Not(), is_white.Not()]).OnlyEnforceIf(option2.Not())
-                            
-                            self.model.AddBoolOr([option1, option2]).OnlyEnforceIf(flood[(t+1, pos)])
-                            self.model.AddImplication(flood[(t+1, pos)].Not(), option1.Not())
-                            self.model.AddImplication(flood[(t+1, pos)].Not(), option2.Not())
-                        else:
-                            self.model.Add(flood[(t+1, pos)] == option1)
-            
-            # Size constraint
-            all_positions = [Position(r, c) for r in range(self.num_rows) for c in range(self.num_cols)]
-            flood_sum = [flood[(size, pos)] for pos in all_positions]
-            self.model.Add(cp.LinearExpr.Sum(flood_sum) == size)
-            
-            # Reachable cells must be white
-            for pos in all_positions:
-                self.model.AddImplication(flood[(size, pos)], self.is_black[pos].Not())
-            
-            for pos in all_positions:
-                island_membership[pos].append(flood[(size, pos)])
+            reached = self._add_island_constr(hint_pos, size, fixed_cells)
+            for pos, var in reached.items():
+                island_membership[pos].append(var)
         
         # ==========================================
         # 4.5 ★ Each cell can only belong to one island ★
         # ==========================================
+        # Every white cell is reached by exactly one island, so a cell no hint can
+        # reach is black.
         for pos, membership_vars in island_membership.items():
-            if len(membership_vars) > 1:
-                self.model.Add(cp.LinearExpr.Sum(membership_vars) <= 1)
+            self.model.Add(cp.LinearExpr.Sum(membership_vars) + self.is_black[pos] == 1)
         
         # ==========================================
         # 5. Total black cells constraint
@@ -301,6 +212,85 @@ x x x x x x x - - x
         self._add_black_connectivity_constraint()
         
         
+    def _island_distances(self, hint_pos: Position, size: int, fixed_cells: Dict[Position, int]) -> Dict[Position, int]:
+        """
+        BFS distances from `hint_pos` to the cells its island could contain.
+        
+        An island of `size` cells only reaches cells at most `size - 1` steps away.
+        Cells fixed black, other hints and cells next to other hints (which would
+        merge two islands) are never part of it and are not walked through.
+        """
+        blocked = {pos for pos, color in fixed_cells.items() if color == 1}
+        for other in self.hints:
+            if other != hint_pos:
+                blocked.add(other)
+                blocked.update(self.grid.get_neighbors(other, "orthogonal"))
+        
+        dist = {hint_pos: 0}
+        frontier = [hint_pos]
+        for d in range(1, size):
+            next_frontier = []
+            for pos in frontier:
+                for nb in self.grid.get_neighbors(pos, "orthogonal"):
+                    if nb not in dist and nb not in blocked:
+                        dist[nb] = d
+                        next_frontier.append(nb)
+            frontier = next_frontier
+        return dist
+
+    def _add_island_constr(self, hint_pos: Position, size: int, fixed_cells: Dict[Position, int]) -> Dict[Position, cp.IntVar]:
+        """
+        Flood fill from `hint_pos` over white cells: after `size - 1` steps exactly
+        `size` cells are reached and no other white cell borders them.
+        `flood[(t, pos)]` only exists for cells within `t` steps of the hint; every
+        other cell is unreachable at step `t`.
+        Returns the final reach literal of every cell the island may contain.
+        """
+        dist = self._island_distances(hint_pos, size, fixed_cells)
+        reached = self.model.NewConstant(1)
+        flood = {(t, hint_pos): reached for t in range(size)}
+        
+        for t in range(size - 1):
+            for pos, d in dist.items():
+                if pos == hint_pos or d > t + 1:
+                    continue
+                cur = new_bool_var(self.model, "flood_{}_{}_{}_{}_{}", hint_pos.r, hint_pos.c, t+1, pos.r, pos.c)
+                flood[(t+1, pos)] = cur
+                prev = flood.get((t, pos))
+                neighbor_reached = [
+                    flood[(t, nb)] for nb in self.grid.get_neighbors(pos, "orthogonal")
+                    if (t, nb) in flood
+                ]
+                is_white = self.is_black[pos].Not()
+                
+                # cur <=> prev or (is_white and any(neighbor_reached))
+                keep = [prev] if prev is not None else []
+                if prev is not None:
+                    self.model.AddImplication(prev, cur)
+                for nb_var in neighbor_reached:
+                    self.model.AddBoolOr([nb_var.Not(), is_white.Not(), cur])
+                self.model.AddBoolOr(keep + [is_white]).OnlyEnforceIf(cur)
+                self.model.AddBoolOr(keep + neighbor_reached).OnlyEnforceIf(cur)
+        
+        final = {pos: flood[(size - 1, pos)] for pos in dist}
+        
+        # Size constraint
+        self.model.Add(cp.LinearExpr.Sum(list(final.values())) == size)
+        
+        # Reachable cells must be white
+        for pos, var in final.items():
+            self.model.AddImplication(var, self.is_black[pos].Not())
+
+        # The island is closed: a white neighbor of a reached cell is reached too
+        # (outside the reach, it must be black).
+        for pos, var in final.items():
+            for nb in self.grid.get_neighbors(pos, "orthogonal"):
+                if nb in final:
+                    self.model.AddBoolOr([var.Not(), self.is_black[nb], final[nb]])
+                else:
+                    self.model.AddImplication(var, self.is_black[nb])
+        return final
+
     def _add_black_connectivity_constraint(self):
         """Add constraint that all black cells form a single connected region."""
         # Build adjacency map for black connectivity
@@ -321,6 +311,12 @@ x x x x x x x - - x
             )
         # If total_black == 0, no black cells exist (trivially connected)
 
+    def cell_literal(self, r: int, c: int, value: str):
+        if value not in ("x", "-"):
+            raise NotImplementedError(f"Nurikabe cells are 'x' or '-', got '{value}'.")
+        is_black = self.is_black[Position(r, c)]
+        return is_black if value == "x" else is_black.Not()
+
     def get_solution(self):
         
         sol_grid = [['-' for _ in range(self.num_cols)] for _ in range(self.num_rows)]
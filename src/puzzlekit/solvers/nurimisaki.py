@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class NurimisakiSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -53,7 +53,7 @@ class NurimisakiSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for c in range(self.num_cols):
                 pos = Position(r, c)
-                self.is_white[pos] = self.model.NewBoolVar(f"w_{r}_{c}")
+                self.is_white[pos] = new_bool_var(self.model, "w_{}_{}", r, c)
                 self.adj_map[pos] = []
                 
         # 2. Build Adjacency Map for Connectivity
@@ -143,7 +143,7 @@ class NurimisakiSolver(PuzzleSolver):
             # 1. The previous segment was active (continuous from origin)
             # 2. The current cell is White
             
-            current_active = self.model.NewBoolVar(f"view_{r}_{c}_to_{dr}_{dc}_at_{curr_r}_{curr_c}")
+            current_active = new_bool_var(self.model, "view_{}_{}_to_{}_{}_at_{}_{}", r, c, dr, dc, curr_r, curr_c)
             self.model.AddBoolAnd([prev_active, is_w]).OnlyEnforceIf(current_active)
             self.model.AddBoolOr([prev_active.Not(), is_w.Not()]).OnlyEnforceIf(current_active.Not())
             
@@ -4,9 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import CLUE_REGION_TEMPLATE_INPUT_DESC, LITS_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height 
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class PaintAreaSolver(PuzzleSolver):
@@ -82,7 +82,7 @@ class PaintAreaSolver(PuzzleSolver):
         self.x = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x[{r},{c}]")
+                self.x[r, c] = new_bool_var(self.model, "x[{},{}]", r, c)
 
         # 2. Region Consistency (Rule 1)
         # "A tile is either completely shaded or unshaded" implies consistency within the region definition
@@ -92,7 +92,7 @@ class PaintAreaSolver(PuzzleSolver):
         
         for region_id, cells in self.region_grid.regions.items():
             # Create a representative variable for this region
-            r_var = self.model.NewBoolVar(f"region_active_{region_id}")
+            r_var = new_bool_var(self.model, "region_active_{}", region_id)
             self.region_active_vars[region_id] = r_var
             
             # Bind all cells in this region to the region variable
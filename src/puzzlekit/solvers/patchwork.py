@@ -4,6 +4,7 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var
 import copy
 
 class PatchworkSolver(PuzzleSolver):
@@ -81,7 +82,7 @@ class PatchworkSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 for k in range(1, self.region_size + 1):
-                    self.x[i, j, k] = self.model.NewBoolVar(f"x[{i}_{j}_{k}]")
+                    self.x[i, j, k] = new_bool_var(self.model, "x[{}_{}_{}]", i, j, k)
                 
                 self.model.Add(sum(self.x[i, j, k] for k in range(1, self.region_size + 1)) == 1)
                 if self.grid.value(i, j).isdigit():
@@ -2,8 +2,9 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var_from_domain
 from puzzlekit.utils.puzzle_math import get_allowed_direction_chars
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class PfeilzahlenSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -116,9 +117,8 @@ class PfeilzahlenSolver(PuzzleSolver):
                         allowed = [6, 7, 8] # SW, W, NW
                     
                     # 创建变量
-                    self.x[r, c] = self.model.NewIntVarFromDomain(
-                        cp.Domain.FromValues(allowed), 
-                        name=f"x[{r},{c}]"
+                    self.x[r, c] = new_int_var_from_domain(
+                        self.model, cp.Domain.FromValues(allowed), "x[{},{}]", r, c
                     )
 
     def _add_number_constraints(self):
@@ -143,7 +143,7 @@ class PfeilzahlenSolver(PuzzleSolver):
                             required_arrow_dir = self.OPPOSITE_DIR[direction_code]
                             
                             # Reification: is_pointing <==> (border_var == required)
-                            is_pointing = self.model.NewBoolVar(f"p_{i}_{j}_from_{curr_r}_{curr_c}")
+                            is_pointing = new_bool_var(self.model, "p_{}_{}_from_{}_{}", i, j, curr_r, curr_c)
                             self.model.Add(border_var == required_arrow_dir).OnlyEnforceIf(is_pointing)
                             self.model.Add(border_var != required_arrow_dir).OnlyEnforceIf(is_pointing.Not())
                             
@@ -2,7 +2,8 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class PillsSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -77,7 +78,7 @@ class PillsSolver(PuzzleSolver):
         
         for i in range(self.num_rows):
             for j in range(self.num_cols - 2):
-                self.x[0, i, j] = self.model.NewBoolVar(f"x[0,{i},{j}]")
+                self.x[0, i, j] = new_bool_var(self.model, "x[0,{},{}]", i, j)
                 self.y[i, j].append(self.x[0, i, j])
                 self.y[i, j + 1].append(self.x[0, i, j])
                 self.y[i, j + 2].append(self.x[0, i, j])
@@ -88,7 +89,7 @@ class PillsSolver(PuzzleSolver):
                     self.z[curr_sum].append(self.x[0, i, j])
         for i in range(self.num_rows - 2):
             for j in range(self.num_cols):
-                self.x[1, i, j] = self.model.NewBoolVar(f"x[1,{i},{j}]")
+                self.x[1, i, j] = new_bool_var(self.model, "x[1,{},{}]", i, j)
                 self.y[i, j].append(self.x[1, i, j])
                 self.y[i + 1, j].append(self.x[1, i, j])
                 self.y[i + 2, j].append(self.x[1, i, j])
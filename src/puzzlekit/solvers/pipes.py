@@ -3,9 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height
-
+from puzzlekit.utils.typecheck import typechecked
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, new_bool_var
 class PipesSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "Pipes",
@@ -55,10 +54,10 @@ class PipesSolver(PuzzleSolver):
         self.e = {}
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.n[i, j] = self.model.NewBoolVar(f"n_{i}_{j}")
-                self.s[i, j] = self.model.NewBoolVar(f"s_{i}_{j}")
-                self.w[i, j] = self.model.NewBoolVar(f"w_{i}_{j}")
-                self.e[i, j] = self.model.NewBoolVar(f"e_{i}_{j}")
+                self.n[i, j] = new_bool_var(self.model, "n_{}_{}", i, j)
+                self.s[i, j] = new_bool_var(self.model, "s_{}_{}", i, j)
+                self.w[i, j] = new_bool_var(self.model, "w_{}_{}", i, j)
+                self.e[i, j] = new_bool_var(self.model, "e_{}_{}", i, j)
 
         # 2. Precompute degree per type
         deg_map = {1: 1, 3: 2, 5: 2, 7: 3, 15: 4}
@@ -108,7 +107,7 @@ class PipesSolver(PuzzleSolver):
                 # We create a selector var for each pattern, then link to directions
                 pattern_vars = []
                 for idx, (nn, ss, ww, ee) in enumerate(valid_dirs):
-                    p = self.model.NewBoolVar(f"pat_{i}_{j}_{idx}")
+                    p = new_bool_var(self.model, "pat_{}_{}_{}", i, j, idx)
                     pattern_vars.append(p)
                     # Link: if p=1, then directions must match
                     self.model.Add(self.n[i, j] == nn).OnlyEnforceIf(p)
@@ -148,7 +147,7 @@ class PipesSolver(PuzzleSolver):
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 # Use a dummy BoolVar = 1 (always active)
-                act = self.model.NewBoolVar(f"act_{i}_{j}")
+                act = new_bool_var(self.model, "act_{}_{}", i, j)
                 self.model.Add(act == 1)
                 active_nodes[(i, j)] = act
 
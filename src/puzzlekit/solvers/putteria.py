@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class PutteriaSolver(PuzzleSolver):
@@ -72,8 +73,8 @@ class PutteriaSolver(PuzzleSolver):
         
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x[{r},{c}]")
-                self.val[r, c] = self.model.NewIntVar(0, max_size, f"val[{r},{c}]")
+                self.x[r, c] = new_bool_var(self.model, "x[{},{}]", r, c)
+                self.val[r, c] = new_int_var(self.model, 0, max_size, "val[{},{}]", r, c)
                 
                 r_id = self.region_grid.value(r, c)
                 r_size = region_sizes[r_id]
@@ -125,7 +126,7 @@ class PutteriaSolver(PuzzleSolver):
             row_shadow_vars = []
             for c in range(self.num_cols):
 
-                shadow = self.model.NewIntVar(0, safety_offset + self.num_cols, f"row_shadow_{r}_{c}")
+                shadow = new_int_var(self.model, 0, safety_offset + self.num_cols, "row_shadow_{}_{}", r, c)
                 self.model.Add(shadow == self.val[r, c]).OnlyEnforceIf(self.x[r, c])
 
                 self.model.Add(shadow == safety_offset + c).OnlyEnforceIf(self.x[r, c].Not())
@@ -138,7 +139,7 @@ class PutteriaSolver(PuzzleSolver):
         for c in range(self.num_cols):
             col_shadow_vars = []
             for r in range(self.num_rows):
-                shadow = self.model.NewIntVar(0, safety_offset + self.num_rows, f"col_shadow_{r}_{c}")
+                shadow = new_int_var(self.model, 0, safety_offset + self.num_rows, "col_shadow_{}_{}", r, c)
                 
                 # Case A: Active
                 self.model.Add(shadow == self.val[r, c]).OnlyEnforceIf(self.x[r, c])
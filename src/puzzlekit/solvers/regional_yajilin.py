@@ -5,9 +5,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import LOOP_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class RegionalYajilinSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -81,12 +81,12 @@ class RegionalYajilinSolver(PuzzleSolver):
                 # Right Edge
                 if c + 1 < self.num_cols:
                     v = Position(r, c + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 
                 # Down Edge
                 if r + 1 < self.num_rows:
                     v = Position(r + 1, c)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
         self.node_active = add_circuit_constraint_from_undirected(
             self.model,
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 class RenbanSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -65,7 +66,7 @@ class RenbanSolver(PuzzleSolver):
         # 1. Create variables
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(1, max_val, name=f"x[{i},{j}]")
+                self.x[i, j] = new_int_var(self.model, 1, max_val, "x[{},{}]", i, j)
         
         # 2. Add Hint constraints
         for i in range(self.num_rows):
@@ -104,8 +105,8 @@ class RenbanSolver(PuzzleSolver):
                 self.model.AddAllDifferent(region_vars)
                 
                 # 2. Consecutiveness
-                min_v = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), f"min_reg_{region_id}")
-                max_v = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), f"max_reg_{region_id}")
+                min_v = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "min_reg_{}", region_id)
+                max_v = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "max_reg_{}", region_id)
                 
                 self.model.AddMinEquality(min_v, region_vars)
                 self.model.AddMaxEquality(max_v, region_vars)
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.utils.puzzle_math import get_factor_pairs
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class ShikakuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -102,7 +103,7 @@ class ShikakuSolver(PuzzleSolver):
                 if len(curr_feasible_position) > 0:
                     for info in curr_feasible_position:
                         x1, y1, x_, y_ = info[0], info[1], info[2], info[3]
-                        self.x[x1, y1, x_, y_] = self.model.NewBoolVar(f"x[{x1},{y1},{x_},{y_}]")
+                        self.x[x1, y1, x_, y_] = new_bool_var(self.model, "x[{},{},{},{}]", x1, y1, x_, y_)
                         for k1 in range(x_):
                             for k2 in range(y_):
                                 self.cells[x1 + k1, y1 + k2].append(self.x[x1, y1, x_, y_])
@@ -4,9 +4,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, add_connected_subgraph_constraint, new_bool_var, new_int_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class ShimaguniSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -53,7 +53,7 @@ class ShimaguniSolver(PuzzleSolver):
         self.black = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.black[r, c] = self.model.NewBoolVar(f"black_{r}_{c}")
+                self.black[r, c] = new_bool_var(self.model, "black_{}_{}", r, c)
         
         region_cells = defaultdict(list)
         pos_to_region = {}
@@ -74,7 +74,7 @@ class ShimaguniSolver(PuzzleSolver):
         
         for region_id, cells in region_cells.items():
             # print(region_id, cells)
-            count_var = self.model.NewIntVar(0, len(cells) + 2, f"count_{region_id}")
+            count_var = new_int_var(self.model, 0, len(cells) + 2, "count_{}", region_id)
             region_black_count[region_id] = count_var
             if region_id in region_clues:
                 self.model.Add(count_var == region_clues[region_id])
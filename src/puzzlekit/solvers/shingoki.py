@@ -2,9 +2,9 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class ShingokiSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -74,11 +74,11 @@ class ShingokiSolver(PuzzleSolver):
                 # Horizontal Edge
                 if j < self.num_cols - 1:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 # Vertical Edge
                 if i < self.num_rows - 1:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(self.model, all_nodes, self.arc_vars)
 
@@ -99,7 +99,7 @@ class ShingokiSolver(PuzzleSolver):
                 break
             
             edge = self._get_edge_var(Position(curr_r, curr_c), Position(next_r, next_c))
-            segment_active = self.model.NewBoolVar(f"seg_{r}_{c}_{dr}_{dc}_{len(length_components)}")
+            segment_active = new_bool_var(self.model, "seg_{}_{}_{}_{}_{}", r, c, dr, dc, len(length_components))
             self.model.AddBoolAnd([prev_active, edge]).OnlyEnforceIf(segment_active)
             self.model.AddBoolOr([prev_active.Not(), edge.Not()]).OnlyEnforceIf(segment_active.Not())
             
@@ -135,22 +135,22 @@ class ShingokiSolver(PuzzleSolver):
                 len_w = self._create_arm_length_var(i, j, 0, -1)
                 len_e = self._create_arm_length_var(i, j, 0, 1)
                 
-                has_n = self.model.NewBoolVar(f"has_n_{i}_{j}")
+                has_n = new_bool_var(self.model, "has_n_{}_{}", i, j)
                 edge_n = self._get_edge_var(pos, pos.up)
                 if edge_n is not None: self.model.Add(has_n == edge_n)
                 else: self.model.Add(has_n == 0)
 
-                has_s = self.model.NewBoolVar(f"has_s_{i}_{j}")
+                has_s = new_bool_var(self.model, "has_s_{}_{}", i, j)
                 edge_s = self._get_edge_var(pos, pos.down)
                 if edge_s is not None: self.model.Add(has_s == edge_s)
                 else: self.model.Add(has_s == 0)
 
-                has_w = self.model.NewBoolVar(f"has_w_{i}_{j}")
+                has_w = new_bool_var(self.model, "has_w_{}_{}", i, j)
                 edge_w = self._get_edge_var(pos, pos.left)
                 if edge_w is not None: self.model.Add(has_w == edge_w)
                 else: self.model.Add(has_w == 0)
 
-                has_e = self.model.NewBoolVar(f"has_e_{i}_{j}")
+                has_e = new_bool_var(self.model, "has_e_{}_{}", i, j)
                 edge_e = self._get_edge_var(pos, pos.right)
                 if edge_e is not None: self.model.Add(has_e == edge_e)
                 else: self.model.Add(has_e == 0)
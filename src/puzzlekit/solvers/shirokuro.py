@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class ShirokuroSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -99,7 +100,7 @@ class ShirokuroSolver(PuzzleSolver):
 
         # Create boolean variables for each possible connection
         for b, w in possible_connections:
-            var = self.model.NewBoolVar(f"conn_{b.r}_{b.c}_{w.r}_{w.c}")
+            var = new_bool_var(self.model, "conn_{}_{}_{}_{}", b.r, b.c, w.r, w.c)
             self.connection_vars[(b, w)] = var
 
             # Precompute path (all cells including endpoints) for this connection
@@ -2,9 +2,9 @@ from typing import Any, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class ShugakuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -68,9 +68,9 @@ class ShugakuSolver(PuzzleSolver):
         self.is_square: Dict[Position, cp.IntVar] = {}
         
         for pos in self.free_cells:
-            self.is_black[pos] = self.model.NewBoolVar(f"black_{pos.r}_{pos.c}")
-            self.is_circle[pos] = self.model.NewBoolVar(f"circle_{pos.r}_{pos.c}")
-            self.is_square[pos] = self.model.NewBoolVar(f"square_{pos.r}_{pos.c}")
+            self.is_black[pos] = new_bool_var(self.model, "black_{}_{}", pos.r, pos.c)
+            self.is_circle[pos] = new_bool_var(self.model, "circle_{}_{}", pos.r, pos.c)
+            self.is_square[pos] = new_bool_var(self.model, "square_{}_{}", pos.r, pos.c)
             
             # Each free cell is exactly one of: black, circle, or square
             self.model.AddExactlyOne([
@@ -103,7 +103,7 @@ class ShugakuSolver(PuzzleSolver):
                     # Use canonical ordering (smaller position first)
                     key = (pos, neighbor) if (pos.r, pos.c) < (neighbor.r, neighbor.c) else (neighbor, pos)
                     if key not in self.domino:
-                        self.domino[key] = self.model.NewBoolVar(f"domino_{key[0].r}_{key[0].c}_{key[1].r}_{key[1].c}")
+                        self.domino[key] = new_bool_var(self.model, "domino_{}_{}_{}_{}", key[0].r, key[0].c, key[1].r, key[1].c)
 
     def _add_domino_formation_constr(self):
         """
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class SkyscraperSolver(PuzzleSolver):
@@ -80,7 +81,7 @@ class SkyscraperSolver(PuzzleSolver):
         # 1. Define Variables: 0 (Park) to self.val (Max Height)
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(0, self.val, f'x_{i}_{j}')
+                self.x[i, j] = new_int_var(self.model, 0, self.val, "x_{}_{}", i, j)
                 
                 # prefill
                 curr_char = self.grid.value(i, j)
@@ -96,7 +97,7 @@ class SkyscraperSolver(PuzzleSolver):
         for r in range(self.num_rows):
             for v in range(1, self.val + 1):
                 vars_in_row = [self.x[r, c] for c in range(self.num_cols)]
-                bools = [self.model.NewBoolVar(f"r{r}_is_{v}_{c}") for c in range(self.num_cols)]
+                bools = [new_bool_var(self.model, "r{}_is_{}_{}", r, v, c) for c in range(self.num_cols)]
                 for idx, var in enumerate(vars_in_row):
                     self.model.Add(var == v).OnlyEnforceIf(bools[idx])
                     self.model.Add(var != v).OnlyEnforceIf(bools[idx].Not())
@@ -106,7 +107,7 @@ class SkyscraperSolver(PuzzleSolver):
         for c in range(self.num_cols):
             for v in range(1, self.val + 1):
                 vars_in_col = [self.x[r, c] for r in range(self.num_rows)]
-                bools = [self.model.NewBoolVar(f"c{c}_is_{v}_{r}") for r in range(self.num_rows)]
+                bools = [new_bool_var(self.model, "c{}_is_{}_{}", c, v, r) for r in range(self.num_rows)]
                 for idx, var in enumerate(vars_in_col):
                     self.model.Add(var == v).OnlyEnforceIf(bools[idx])
                     self.model.Add(var != v).OnlyEnforceIf(bools[idx].Not())
@@ -122,7 +123,7 @@ class SkyscraperSolver(PuzzleSolver):
                     # Standard uniqueness logic or simple AllDifferent if we assume no 0s in diagonal?
                     # Rule says "each height occurs exactly once". It implies holes are allowed unless N=VAL.
                     # Let's use the robust bool sum method to be safe.
-                    bools = [self.model.NewBoolVar(f"d1_{k}_is_{v}") for k in range(self.num_rows)]
+                    bools = [new_bool_var(self.model, "d1_{}_is_{}", k, v) for k in range(self.num_rows)]
                     for idx, var in enumerate(diag1_vars):
                         self.model.Add(var == v).OnlyEnforceIf(bools[idx])
                         self.model.Add(var != v).OnlyEnforceIf(bools[idx].Not())
@@ -131,7 +132,7 @@ class SkyscraperSolver(PuzzleSolver):
                 # Anti Diagonal (0, N-1) to (N-1, 0)
                 diag2_vars = [self.x[k, self.num_cols - 1 - k] for k in range(self.num_rows)]
                 for v in range(1, self.val + 1):
-                    bools = [self.model.NewBoolVar(f"d2_{k}_is_{v}") for k in range(self.num_rows)]
+                    bools = [new_bool_var(self.model, "d2_{}_is_{}", k, v) for k in range(self.num_rows)]
                     for idx, var in enumerate(diag2_vars):
                         self.model.Add(var == v).OnlyEnforceIf(bools[idx])
                         self.model.Add(var != v).OnlyEnforceIf(bools[idx].Not())
@@ -150,8 +151,8 @@ class SkyscraperSolver(PuzzleSolver):
             # max_so_far[i] = Max(variables[i], max_so_far[i-1])
             
             n = len(variables)
-            max_so_far = [self.model.NewIntVar(0, self.val, f"max_{i}") for i in range(n)]
-            is_visible = [self.model.NewBoolVar(f"vis_{i}") for i in range(n)]
+            max_so_far = [new_int_var(self.model, 0, self.val, "max_{}", i) for i in range(n)]
+            is_visible = [new_bool_var(self.model, "vis_{}", i) for i in range(n)]
             
             # Handling index 0
             self.model.Add(max_so_far[0] == variables[0])
@@ -2,10 +2,10 @@ from typing import Any, Callable, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
 from puzzlekit.core.docs_template import GENERAL_GRID_TEMPLATE_INPUT_DESC, SLITHERLINK_STYLE_TEMPLATE_OUTPUT_DESC
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class SlitherlinkSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "slitherlink",
@@ -84,12 +84,12 @@ class SlitherlinkSolver(PuzzleSolver):
                 # (Right Neighbor)
                 if j < self.num_cols:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
                 
                 # (Down Neighbor)
                 if i < self.num_rows:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
         # ==========================================
         # 2. General circuit constraint (The "Magic" Function)
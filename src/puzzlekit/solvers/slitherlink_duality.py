@@ -2,10 +2,10 @@ from typing import Any, Callable, List, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
 from puzzlekit.core.docs_template import GENERAL_GRID_TEMPLATE_INPUT_DESC, SLITHERLINK_STYLE_TEMPLATE_OUTPUT_DESC
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class SlitherlinkDualitySolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -74,10 +74,10 @@ class SlitherlinkDualitySolver(PuzzleSolver):
                 u = Position(i, j)
                 if j < self.num_cols:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_H_{i}_{j}") # Horizontal
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_H_{}_{}", i, j) # Horizontal
                 if i < self.num_rows:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_V_{i}_{j}") # Vertical
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_V_{}_{}", i, j) # Vertical
 
         # ... (Existing Circuit Constraint) ...
         self.node_active = add_circuit_constraint_from_undirected(
@@ -97,7 +97,7 @@ class SlitherlinkDualitySolver(PuzzleSolver):
         self.cell_inside = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.cell_inside[(r, c)] = self.model.NewBoolVar(f"cell_in_{r}_{c}")
+                self.cell_inside[(r, c)] = new_bool_var(self.model, "cell_in_{}_{}", r, c)
 
         # 2. Link Edges to Cell Parity
         # Relation: Edge_Active <==> (Cell_A_Inside != Cell_B_Inside)
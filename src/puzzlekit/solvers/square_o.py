@@ -2,7 +2,8 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 class SquareOSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "square_o",
@@ -54,7 +55,7 @@ class SquareOSolver(PuzzleSolver):
         # For a grid of R x C cells, there are (R+1) x (C+1) dots.
         for i in range(self.num_rows + 1):
             for j in range(self.num_cols + 1):
-                self.x[i, j] = self.model.NewBoolVar(name=f"dot[{i},{j}]")
+                self.x[i, j] = new_bool_var(self.model, "dot[{},{}]", i, j)
         
         # Add constraints for each cell
         for i in range(self.num_rows):
@@ -1,9 +1,12 @@
-from typing import Any, List, Dict
+from typing import Any, Callable, List, Dict
+import numpy as np
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
+from puzzlekit.core.presolve import CellState, at_most_one, exactly
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class StarbattleSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -56,11 +59,18 @@ class StarbattleSolver(PuzzleSolver):
         self.model = cp.CpModel()
         self.solver = cp.CpSolver()
 
+        fixed = self._presolve({
+            (i, j): 0 for i in range(self.num_rows) for j in range(self.num_cols)
+            if self.region_grid.value(i, j) in "#@"
+        })
         # Create variables
         # x[i, j] = 1 if there is a star, 0 otherwise
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewBoolVar(name=f"x[{i}, {j}]")
+                if (i, j) in fixed:
+                    self.x[i, j] = self.model.NewConstant(fixed[i, j])
+                else:
+                    self.x[i, j] = new_bool_var(self.model, "x[{}, {}]", i, j)
                 if self.region_grid.value(i, j) in "#@":
                     self.model.Add(self.x[i, j] == 0)
 
@@ -68,6 +78,66 @@ class StarbattleSolver(PuzzleSolver):
         self._add_region_constr()
         self._add_adjacency_constr()
 
+    def _presolve_rules(self) -> List[Callable]:
+        rows = [[(i, j) for j in range(self.num_cols)] for i in range(self.num_rows)]
+        cols = [[(i, j) for i in range(self.num_rows)] for j in range(self.num_cols)]
+        regions = [
+            [(pos.r, pos.c) for pos in positions]
+            for region_id, positions in self.region_grid.regions.items() if region_id not in "#@"
+        ]
+        # Two stars are never neighbors, i.e. every 2x2 block holds at most one.
+        blocks = [
+            [(i, j), (i, j + 1), (i + 1, j), (i + 1, j + 1)]
+            for i in range(self.num_rows - 1) for j in range(self.num_cols - 1)
+        ]
+        region_of = np.full((self.num_rows, self.num_cols), -1)
+        for k, cells in enumerate(regions):
+            for i, j in cells:
+                region_of[i, j] = k
+
+        def units(state: CellState):
+            for cells in rows + cols + regions:
+                exactly(state, cells, self.num_stars)
+            for cells in blocks:
+                at_most_one(state, cells)
+
+        def squeeze(state: CellState):
+            # m regions whose open cells lie within m consecutive rows fill those rows:
+            # the other cells of the rows get no star. Likewise when m rows are covered by m
+            # regions, those regions get no star outside the rows. Same for columns.
+            open_cells = (state.values != 0) & (region_of >= 0)
+            for axis in (0, 1):
+                labels = region_of if axis == 0 else region_of.T
+                candidates = open_cells if axis == 0 else open_cells.T
+                n = labels.shape[0]
+                # counts[k, i]: open cells of region k in line i, cumulated over the lines.
+                counts = np.zeros((len(regions), n + 1), dtype=int)
+                rows, cols = np.nonzero(candidates)
+                np.add.at(counts, (labels[rows, cols], rows + 1), 1)
+                counts = np.cumsum(counts, axis=1)
+                total = counts[:, -1]
+                # inside[a, b, k]: open cells of region k in lines a..b-1, for all bands at once.
+                inside = counts.T[None, :, :] - counts.T[:, None, :]
+                num_touching = (inside > 0).sum(axis=2)
+                num_confined = ((inside == total) & (total > 0)).sum(axis=2)
+                size = np.arange(n + 1)[None, :] - np.arange(n + 1)[:, None]
+                band = (size > 0) & (size < n)
+                squeezed = band & (num_confined == size) & (num_touching > size)
+                covered = band & (num_touching == size) & (num_confined < size)
+                for a, b in zip(*np.nonzero(squeezed | covered)):
+                    if squeezed[a, b]:
+                        confined = np.flatnonzero((inside[a, b] == total) & (total > 0))
+                        stray = candidates & ~np.isin(labels, confined)
+                        stray[:a] = False
+                        stray[b:] = False
+                    else:
+                        stray = candidates & np.isin(labels, np.flatnonzero(inside[a, b]))
+                        stray[a:b] = False
+                    for i, j in zip(*np.nonzero(stray)):
+                        state.set(*((int(i), int(j)) if axis == 0 else (int(j), int(i))), 0)
+
+        return [units, squeeze]
+
     def _add_row_col_constr(self):
         # Rows
         for i in range(self.num_rows):
@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 from collections import defaultdict
 
 class StitchesSolver(PuzzleSolver):
@@ -78,7 +79,7 @@ class StitchesSolver(PuzzleSolver):
                     
                     if rid_u != rid_v:
                         # Only cross-region edges are allowed
-                        edge_var = self.model.NewBoolVar(f"edge_{u}_{v}")
+                        edge_var = new_bool_var(self.model, "edge_{}_{}", u, v)
                         self.edges[(u, v)] = edge_var
                         
                         # Record this edge between these two Regions, for subsequent topological constraints
@@ -92,7 +93,7 @@ class StitchesSolver(PuzzleSolver):
                     rid_v = self.regions_grid.value(v)
                     
                     if rid_u != rid_v:
-                        edge_var = self.model.NewBoolVar(f"edge_{u}_{v}")
+                        edge_var = new_bool_var(self.model, "edge_{}_{}", u, v)
                         self.edges[(u, v)] = edge_var
                         
                         key = tuple(sorted((str(rid_u), str(rid_v))))
@@ -129,7 +130,7 @@ class StitchesSolver(PuzzleSolver):
                     next_p = Position(i, j + 1)
                     if (curr, next_p) in self.edges: incident_edges.append(self.edges[(curr, next_p)])
                 
-                self.cell_occupied[curr] = self.model.NewBoolVar(f"occupied_{curr}")
+                self.cell_occupied[curr] = new_bool_var(self.model, "occupied_{}", curr)
                 
                 if not incident_edges:
                     # If all四周都是同一个 region（也就是在 region 内部），不可能有连线
@@ -2,7 +2,8 @@ from typing import Any, List, Set, Dict, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 
 class Str8tSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -92,7 +93,7 @@ class Str8tSolver(PuzzleSolver):
         # Variables are only created for white cells and numbered black cells.
         # Empty black cells do not have a variable.
         for i, j in self._valued_pos:
-            self.x[i, j] = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), name=f"x[{i},{j}]")
+            self.x[i, j] = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "x[{},{}]", i, j)
 
         # 2. Fix hints
         for (i, j), val in self._fixed_values.items():
@@ -156,8 +157,8 @@ class Str8tSolver(PuzzleSolver):
         k = len(vars_list)
         if k > 1:
             # Create auxiliary variables for min and max
-            min_v = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), "")
-            max_v = self.model.NewIntVar(1, max(self.num_rows, self.num_cols), "")
+            min_v = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "")
+            max_v = new_int_var(self.model, 1, max(self.num_rows, self.num_cols), "")
             
             self.model.AddMinEquality(min_v, vars_list)
             self.model.AddMaxEquality(max_v, vars_list)
@@ -4,8 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class SuguruSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -77,7 +78,7 @@ class SuguruSolver(PuzzleSolver):
         for _, cells in self.region_grid.regions.items():
             size_ = len(cells)
             for pos in cells:
-                self.x[pos.r, pos.c] = self.model.NewIntVar(1, size_, f"x[{pos.r}, {pos.c}]" )
+                self.x[pos.r, pos.c] = new_int_var(self.model, 1, size_, "x[{}, {}]", pos.r, pos.c)
             self.model.AddAllDifferent([self.x[pos.r, pos.c] for pos in cells])
         
     def _add_adjacent_constr(self):
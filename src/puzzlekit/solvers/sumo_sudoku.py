@@ -1,10 +1,12 @@
 from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
+from puzzlekit.core.model_template import get_model_template
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_int_var
 from puzzlekit.core.docs_template import SUDOKU_TEMPLATE_OUTPUT_DESC
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class SumoSudokuSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -125,18 +127,25 @@ class SumoSudokuSolver(PuzzleSolver):
         self._check_allowed_chars(self.grid.matrix, {'-'}, validator = lambda x: x.isdigit() and 1 <= int(x) <= 9)
         
     def _add_constr(self):
+        self.solver = cp.CpSolver()
+        # The skeleton only depends on the shape; clues are fixed on a copy of it.
+        template = get_model_template((type(self), self.num_rows, self.num_cols), self._build_template)
+        self.model, self.x = template.instantiate()
+        for (i, j), var in self.x.items():
+            if self.grid.value(i, j).isdigit():
+                self.model.Add(var == int(self.grid.value(i, j)))
+
+    def _build_template(self):
         self.x = dict()
         self.model = cp.CpModel()
-        self.solver = cp.CpSolver()
         
         for i in range(self.num_rows):
             for j in range(self.num_cols):
                 if (i, j) not in self.blank:
-                    self.x[i, j] = self.model.NewIntVar(1, 9, name = f"x[{i}, {j}]")
-                    if self.grid.value(i, j).isdigit():
-                        self.model.Add(self.x[i, j] == int(self.grid.value(i, j)))
+                    self.x[i, j] = new_int_var(self.model, 1, 9, "x[{}, {}]", i, j)
         
         self._add_offset_standard_constr()
+        return self.model, self.x
 
     def _add_offset_standard_constr(self):
         for offsets in self.pivot:
@@ -4,7 +4,8 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.utils.puzzle_math import get_factor_pairs
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 
 class TatamibariSolver(PuzzleSolver):
@@ -131,7 +132,7 @@ class TatamibariSolver(PuzzleSolver):
         self.rect_vars = {}
         for rect in self.candidates.keys():
             r1, c1, r2, c2 = rect
-            var = self.model.NewBoolVar(f"rect_{r1}_{c1}_{r2}_{c2}")
+            var = new_bool_var(self.model, "rect_{}_{}_{}_{}", r1, c1, r2, c2)
             self.rect_vars[rect] = var
         
         # Build mappings: cell -> list of rectangles covering it
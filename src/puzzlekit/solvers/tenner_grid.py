@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class TennerGridSolver(PuzzleSolver):
@@ -59,7 +60,7 @@ class TennerGridSolver(PuzzleSolver):
     def _add_number_constr(self):
         for i in range(self.num_rows - 1):
             for j in range(self.num_cols):
-                self.x[i, j] = self.model.NewIntVar(0, 9, f"x[{i}, {j}]")
+                self.x[i, j] = new_int_var(self.model, 0, 9, "x[{}, {}]", i, j)
         
         for i in range(self.num_rows - 1):
             for j in range(self.num_cols):
@@ -3,8 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class TentSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "tent",
@@ -86,7 +87,7 @@ class TentSolver(PuzzleSolver):
                     neighbors = self.grid.get_neighbors(Position(i, j))
                     for pos in neighbors:
                         if self.grid.value(pos.r, pos.c) == "-":
-                            self.x[i, j, pos.r, pos.c] = self.model.NewBoolVar(f"x[{i},{j},{pos.r},{pos.c}]")
+                            self.x[i, j, pos.r, pos.c] = new_bool_var(self.model, "x[{},{},{},{}]", i, j, pos.r, pos.c)
                             self.y[pos.r, pos.c].append(self.x[i, j, pos.r, pos.c])
                     self.model.Add(sum(self.x[i, j, pos.r, pos.c] for pos in neighbors if self.grid.value(pos.r, pos.c) == "-") == 1)
                     
@@ -4,8 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_int_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class TerraXSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "terra_x",
@@ -67,7 +68,7 @@ class TerraXSolver(PuzzleSolver):
         
     def _add_region_constr(self):
         for region_id, region_cells in self.region_grid.regions.items():
-            self.x[region_id] = self.model.NewIntVar(0, 9, f"x[{region_id}]")
+            self.x[region_id] = new_int_var(self.model, 0, 9, "x[{}]", region_id)
             for pos in region_cells:
                 self.y[(region_id, pos.r, pos.c)] = self.x[region_id]
         
@@ -2,7 +2,8 @@ from typing import Any, Dict, List, Tuple
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var
+from puzzlekit.utils.typecheck import typechecked
 
 class ThermometerSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -88,7 +89,7 @@ class ThermometerSolver(PuzzleSolver):
 
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x_{r}_{c}")
+                self.x[r, c] = new_bool_var(self.model, "x_{}_{}", r, c)
         self._add_sum_constraints()
         self._add_thermo_constraints()
 
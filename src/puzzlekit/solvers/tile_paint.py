@@ -4,8 +4,9 @@ from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
+from puzzlekit.utils.ortools_utils import new_bool_var
 import copy
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class TilePaintSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "tile_paint",
@@ -72,7 +73,7 @@ class TilePaintSolver(PuzzleSolver):
         self.solver = cp.CpSolver()
         
         for k, v in self.region_grid.regions.items():
-            self.x[k] = self.model.NewBoolVar(name = f"x[{k}]")
+            self.x[k] = new_bool_var(self.model, "x[{}]", k)
         
         for i, row in enumerate(self.rows):
             if row in "-.* ":
@@ -3,7 +3,8 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.ortools_utils import new_bool_var, new_int_var
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class TrinairoSolver(PuzzleSolver):
@@ -81,7 +82,7 @@ class TrinairoSolver(PuzzleSolver):
         # 1. Define Variables [1, 3]
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewIntVar(1, 3, f"x[{r},{c}]")
+                self.x[r, c] = new_int_var(self.model, 1, 3, "x[{},{}]", r, c)
                 
                 val_str = self.grid.value(r, c)
                 if val_str == "-":
@@ -117,7 +118,7 @@ class TrinairoSolver(PuzzleSolver):
             row_vars = [self.x[r, c] for c in range(self.num_cols)]
             for val in [1, 2, 3]:
                 # Count occurrences of `val` in this row
-                bools = [self.model.NewBoolVar(f"r{r}_is_{val}_{c}") for c in range(self.num_cols)]
+                bools = [new_bool_var(self.model, "r{}_is_{}_{}", r, val, c) for c in range(self.num_cols)]
                 for idx, var in enumerate(row_vars):
                     self.model.Add(var == val).OnlyEnforceIf(bools[idx])
                     self.model.Add(var != val).OnlyEnforceIf(bools[idx].Not())
@@ -128,7 +129,7 @@ class TrinairoSolver(PuzzleSolver):
         for c in range(self.num_cols):
             col_vars = [self.x[r, c] for r in range(self.num_rows)]
             for val in [1, 2, 3]:
-                bools = [self.model.NewBoolVar(f"c{c}_is_{val}_{r}") for r in range(self.num_rows)]
+                bools = [new_bool_var(self.model, "c{}_is_{}_{}", c, val, r) for r in range(self.num_rows)]
                 for idx, var in enumerate(col_vars):
                     self.model.Add(var == val).OnlyEnforceIf(bools[idx])
                     self.model.Add(var != val).OnlyEnforceIf(bools[idx].Not())
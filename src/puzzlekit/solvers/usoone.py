@@ -4,9 +4,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_by_height, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 
 class UsooneSolver(PuzzleSolver):
@@ -69,7 +69,7 @@ x - - - x - - x
         self.x = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x_{r}_{c}")
+                self.x[r, c] = new_bool_var(self.model, "x_{}_{}", r, c)
         
         # 2. Constraint: Numbers cannot be shaded (Rule 2)
         for r in range(self.num_rows):
@@ -109,7 +109,7 @@ x - - - x - - x
                     s = sum(neighbor_vars)  # Linear expression for neighbor sum
                     
                     # Create correctness variable: eq_var = 1 iff s == d
-                    eq_var = self.model.NewBoolVar(f"eq_{r}_{c}_{region_id}")
+                    eq_var = new_bool_var(self.model, "eq_{}_{}_{}", r, c, region_id)
                     
                     # Handle cases where d is outside valid range [0, 4]
                     if 0 <= d <= 4:
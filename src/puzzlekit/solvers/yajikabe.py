@@ -3,9 +3,9 @@ from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
 from puzzlekit.core.docs_template import YAJILIN_STYLE_TEMPLATE_INPUT_DESC, SHADE_TEMPLATE_OUTPUT_DESC
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 
 class YajikabeSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
@@ -63,7 +63,7 @@ class YajikabeSolver(PuzzleSolver):
         # 1. Create Decision Variables
         for i in range(self.num_rows):
             for j in range(self.num_cols):
-                self.black_vars[Position(i, j)] = self.model.NewBoolVar(f"is_black_{i}_{j}")
+                self.black_vars[Position(i, j)] = new_bool_var(self.model, "is_black_{}_{}", i, j)
 
         # 2. Process Clues and Basic Cell Constraints
         for i in range(self.num_rows):
@@ -2,10 +2,10 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected
+from puzzlekit.utils.ortools_utils import add_circuit_constraint_from_undirected, new_bool_var
 from ortools.sat.python import cp_model as cp
 from puzzlekit.core.docs_template import LOOP_TEMPLATE_OUTPUT_DESC, YAJILIN_STYLE_TEMPLATE_INPUT_DESC
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 class YajilinSolver(PuzzleSolver):
     metadata : Dict[str, Any] = {
         "name": "yajilin",
@@ -79,11 +79,11 @@ class YajilinSolver(PuzzleSolver):
 
                 if j < self.num_cols:
                     v = Position(i, j + 1)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
 
                 if i < self.num_rows:
                     v = Position(i + 1, j)
-                    self.arc_vars[(u, v)] = self.model.NewBoolVar(f"edge_{u}_{v}")
+                    self.arc_vars[(u, v)] = new_bool_var(self.model, "edge_{}_{}", u, v)
         
         self.node_active = add_circuit_constraint_from_undirected(
             self.model, 
@@ -2,9 +2,9 @@ from typing import Any, List, Dict
 from puzzlekit.core.solver import PuzzleSolver
 from puzzlekit.core.grid import Grid
 from puzzlekit.core.position import Position
-from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint
+from puzzlekit.utils.ortools_utils import add_connected_subgraph_constraint, new_bool_var
 from ortools.sat.python import cp_model as cp
-from typeguard import typechecked
+from puzzlekit.utils.typecheck import typechecked
 import copy
 
 class YinYangSolver(PuzzleSolver):
@@ -59,7 +59,7 @@ class YinYangSolver(PuzzleSolver):
         self.x = {}
         for r in range(self.num_rows):
             for c in range(self.num_cols):
-                self.x[r, c] = self.model.NewBoolVar(f"x[{r},{c}]")
+                self.x[r, c] = new_bool_var(self.model, "x[{},{}]", r, c)
                 
                 # Pre-fill constraints
                 chr = self.grid.value(r, c)
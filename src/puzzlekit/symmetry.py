@@ -0,0 +1,239 @@
+import json
+import hashlib
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from puzzlekit.core.grid import Grid
+
+Matrix = List[List[Hashable]]
+
+# Geometric symmetries of a grid: (r, c) in an R x C grid -> (r', c').
+# The ones marked True swap the grid dimensions.
+_TRANSFORMS: Dict[str, Tuple[Callable[[int, int, int, int], Tuple[int, int]], bool]] = {
+    "identity": (lambda r, c, R, C: (r, c), False),
+    "rot90": (lambda r, c, R, C: (c, R - 1 - r), True),
+    "rot180": (lambda r, c, R, C: (R - 1 - r, C - 1 - c), False),
+    "rot270": (lambda r, c, R, C: (C - 1 - c, r), True),
+    "flip_h": (lambda r, c, R, C: (r, C - 1 - c), False),
+    "flip_v": (lambda r, c, R, C: (R - 1 - r, c), False),
+    "transpose": (lambda r, c, R, C: (c, r), True),
+    "anti_transpose": (lambda r, c, R, C: (C - 1 - c, R - 1 - r), True),
+}
+_INVERSE = {"rot90": "rot270", "rot270": "rot90"}
+
+ALL_TRANSFORMS = tuple(_TRANSFORMS)
+
+
+def transform_matrix(matrix: Matrix, transform: str) -> Matrix:
+    """Apply one of the 8 grid symmetries (rotations and reflections) to a matrix."""
+    fn, swaps = _TRANSFORMS[transform]
+    R = len(matrix)
+    C = len(matrix[0]) if R else 0
+    out_rows, out_cols = (C, R) if swaps else (R, C)
+    out = [[None] * out_cols for _ in range(out_rows)]
+    for r, row in enumerate(matrix):
+        for c, value in enumerate(row):
+            nr, nc = fn(r, c, R, C)
+            out[nr][nc] = value
+    return out
+
+
+def inverse_transform(transform: str) -> str:
+    return _INVERSE.get(transform, transform)
+
+
+def _natural_key(symbol: Hashable):
+    return (0, int(symbol), "") if str(symbol).isdigit() else (1, 0, str(symbol))
+
+
+class Relabeling:
+    """
+    A set of symbols whose names carry no meaning, e.g. sudoku digits or region ids.
+
+    Args:
+        fields: Input matrices whose cells share one relabeling.
+        is_label: Which cell values are labels (others, e.g. '-', are left alone).
+        alphabet: Full label set for the instance (e.g. '1'..'9'), so that labels absent
+            from the input still get a name. None: only the labels that occur.
+        in_solution: The solution grid uses the same labels and is relabeled too.
+    """
+    def __init__(
+        self,
+        fields: Sequence[str],
+        is_label: Callable[[Hashable], bool] = lambda x: x != '-',
+        alphabet: Optional[Callable[[Dict[str, Any]], List[Hashable]]] = None,
+        in_solution: bool = False
+    ):
+        self.fields = tuple(fields)
+        self.is_label = is_label
+        self.alphabet = alphabet
+        self.in_solution = in_solution
+
+    def canonical_map(self, params: Dict[str, Any]) -> Dict[Hashable, Hashable]:
+        """Original label -> canonical label, numbering labels by first occurrence (row-major)."""
+        seen: List[Hashable] = []
+        present = set()
+        for field in self.fields:
+            for row in params.get(field) or []:
+                for value in row:
+                    if self.is_label(value) and value not in present:
+                        present.add(value)
+                        seen.append(value)
+        if self.alphabet is None:
+            names = [str(i) for i in range(1, len(seen) + 1)]
+        else:
+            alphabet = sorted(self.alphabet(params), key=_natural_key)
+            seen += [symbol for symbol in alphabet if symbol not in present]
+            names = alphabet
+        return dict(zip(seen, names))
+
+
+class SymmetrySpec:
+    """
+    The symmetries a puzzle type allows: which grid transforms keep an instance valid
+    (and map its solution accordingly), and which symbol sets may be relabeled.
+    `grid_fields` are the matrix-valued input fields that move with the grid.
+    """
+    def __init__(
+        self,
+        grid_fields: Sequence[str] = ("grid",),
+        transforms: Sequence[str] = ALL_TRANSFORMS,
+        relabelings: Sequence[Relabeling] = ()
+    ):
+        self.grid_fields = tuple(grid_fields)
+        self.transforms = tuple(transforms)
+        self.relabelings = tuple(relabelings)
+
+
+def _digits(params: Dict[str, Any]) -> List[str]:
+    return [str(i) for i in range(1, params["num_rows"] + 1)]
+
+
+_SYMMETRIES: Dict[str, SymmetrySpec] = {
+    "sudoku": SymmetrySpec(
+        relabelings=[Relabeling(["grid"], str.isdigit, alphabet=_digits, in_solution=True)]
+    ),
+    "jigsaw_sudoku": SymmetrySpec(
+        grid_fields=("grid", "region_grid"),
+        relabelings=[
+            Relabeling(["grid"], str.isdigit, alphabet=_digits, in_solution=True),
+            Relabeling(["region_grid"]),
+        ]
+    ),
+    "hitori": SymmetrySpec(
+        relabelings=[Relabeling(["grid"])]
+    ),
+    "binairo": SymmetrySpec(
+        relabelings=[Relabeling(["grid"], alphabet=lambda params: ["1", "2"], in_solution=True)]
+    ),
+    "norinori": SymmetrySpec(
+        grid_fields=("grid", "region_grid"),
+        relabelings=[Relabeling(["region_grid"])]
+    ),
+    "lits": SymmetrySpec(
+        grid_fields=("grid", "region_grid"),
+        relabelings=[Relabeling(["region_grid"])]
+    ),
+    "starbattle": SymmetrySpec(
+        grid_fields=("grid", "region_grid"),
+        relabelings=[Relabeling(["region_grid"])]
+    ),
+}
+
+# Types without declared symmetries are only equivalent to themselves.
+_NO_SYMMETRY = SymmetrySpec(transforms=("identity",))
+
+
+def get_symmetry_spec(puzzle_type: str) -> SymmetrySpec:
+    return _SYMMETRIES.get(puzzle_type, _NO_SYMMETRY)
+
+
+def register_symmetry_spec(puzzle_type: str, spec: SymmetrySpec):
+    _SYMMETRIES[puzzle_type] = spec
+
+
+class CanonicalForm:
+    """
+    A parsed instance in canonical form, plus the symmetry that maps it back.
+
+    `params` are the canonical input fields. Solutions move between the two frames
+    with `to_canonical_solution` / `from_canonical_solution`.
+    """
+    def __init__(
+        self,
+        puzzle_type: str,
+        params: Dict[str, Any],
+        transform: str,
+        label_maps: List[Dict[Hashable, Hashable]],
+        spec: SymmetrySpec
+    ):
+        self.puzzle_type = puzzle_type
+        self.params = params
+        self.transform = transform
+        self.label_maps = label_maps
+        self.spec = spec
+
+    @property
+    def key(self) -> str:
+        """Hash shared by all instances equivalent under the type's symmetries."""
+        payload = json.dumps([self.puzzle_type, self.params], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _relabel(self, matrix: Matrix, inverse: bool) -> Matrix:
+        for relabeling, mapping in zip(self.spec.relabelings, self.label_maps):
+            if not relabeling.in_solution:
+                continue
+            if inverse:
+                mapping = {v: k for k, v in mapping.items()}
+            matrix = [[mapping.get(value, value) for value in row] for row in matrix]
+        return matrix
+
+    def to_canonical_solution(self, solution: Grid) -> Grid:
+        if solution.is_empty():
+            return solution
+        return Grid(self._relabel(transform_matrix(solution.matrix, self.transform), inverse=False))
+
+    def from_canonical_solution(self, solution: Grid) -> Grid:
+        if solution.is_empty():
+            return solution
+        matrix = self._relabel(solution.matrix, inverse=True)
+        return Grid(transform_matrix(matrix, inverse_transform(self.transform)))
+
+
+def _apply(spec: SymmetrySpec, params: Dict[str, Any], transform: str) -> Tuple[Dict[str, Any], List[Dict[Hashable, Hashable]]]:
+    out = dict(params)
+    for field in spec.grid_fields:
+        if out.get(field):
+            out[field] = transform_matrix([list(row) for row in out[field]], transform)
+    if _TRANSFORMS[transform][1] and "num_rows" in out and "num_cols" in out:
+        out["num_rows"], out["num_cols"] = out["num_cols"], out["num_rows"]
+    label_maps = []
+    for relabeling in spec.relabelings:
+        mapping = relabeling.canonical_map(out)
+        for field in relabeling.fields:
+            if out.get(field):
+                out[field] = [[mapping.get(value, value) for value in row] for row in out[field]]
+        label_maps.append(mapping)
+    return out, label_maps
+
+
+def canonicalize(puzzle_type: str, params: Dict[str, Any]) -> CanonicalForm:
+    """
+    Map a parsed instance to the canonical representative of its symmetry class.
+
+    Every allowed transform is applied, labels are renumbered by first occurrence,
+    and the lexicographically smallest serialization wins. Equivalent instances
+    (rotated, mirrored, relabeled) therefore get identical `params` and `key`.
+    """
+    spec = get_symmetry_spec(puzzle_type)
+    best = None
+    for transform in spec.transforms:
+        candidate, label_maps = _apply(spec, params, transform)
+        serialized = json.dumps(candidate, sort_keys=True, separators=(",", ":"))
+        if best is None or serialized < best[0]:
+            best = (serialized, candidate, transform, label_maps)
+    _, canonical, transform, label_maps = best
+    return CanonicalForm(puzzle_type, canonical, transform, label_maps, spec)
+
+
+def canonical_key(puzzle_type: str, params: Dict[str, Any]) -> str:
+    """Shortcut for `canonicalize(...).key`, e.g. to dedupe a dataset."""
+    return canonicalize(puzzle_type, params).key
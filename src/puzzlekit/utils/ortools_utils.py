@@ -1,9 +1,39 @@
-from typing import Any, Dict, List, Tuple, Hashable, Callable, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Hashable, Callable, Set
 from collections import deque
+import time
 from ortools.sat.python import cp_model as cp
-from ortools.linear_solver import pywraplp
 from puzzlekit.core.position import Position
 from puzzlekit.core.grid import Grid
+from puzzlekit.config import _SETTINGS
+
+if TYPE_CHECKING:
+    # Loaded lazily at runtime, only MIP-based solvers need it.
+    from ortools.linear_solver import pywraplp
+
+def new_bool_var(model: cp.CpModel, name: str = "", *args) -> cp.IntVar:
+    """
+    Create a BoolVar, named only when debugging.
+    
+    `name` is a str.format template filled with `args`, e.g.
+    new_bool_var(model, "flood_{}_{}", r, c). With `puzzlekit.configure(debug_names=True)`
+    the variable is named "flood_3_4"; otherwise it is unnamed and the template is
+    never formatted, which saves both the formatting and the name in the model proto.
+    """
+    if _SETTINGS["debug_names"]:
+        return model.NewBoolVar(name.format(*args))
+    return model.NewBoolVar("")
+
+def new_int_var(model: cp.CpModel, lb: int, ub: int, name: str = "", *args) -> cp.IntVar:
+    """IntVar counterpart of `new_bool_var`."""
+    if _SETTINGS["debug_names"]:
+        return model.NewIntVar(lb, ub, name.format(*args))
+    return model.NewIntVar(lb, ub, "")
+
+def new_int_var_from_domain(model: cp.CpModel, domain: cp.Domain, name: str = "", *args) -> cp.IntVar:
+    """`new_int_var` over a `cp.Domain`, e.g. cp.Domain.FromValues([1, 3, 5])."""
+    if _SETTINGS["debug_names"]:
+        return model.NewIntVarFromDomain(domain, name.format(*args))
+    return model.NewIntVarFromDomain(domain, "")
 
 def ortools_and_constr(model: cp.CpModel, target: cp.IntVar, vars: list[cp.IntVar]):
     model.AddBoolAnd(vars).OnlyEnforceIf(target)  # target => (c1 ∧ ... ∧ cn)
@@ -33,10 +63,10 @@ def add_connected_subgraph_constraint(
     
     # 1. Variables
     # rank[u]: Depth/Order in the tree. 0 if root or inactive.
-    rank = {n: model.NewIntVar(0, num_nodes, f"rank_{n}_{prefix}") for n in nodes}
+    rank = {n: new_int_var(model, 0, num_nodes, "rank_{}_{}", n, prefix) for n in nodes}
     
     # is_root[u]: True if node u is the root of the tree.
-    is_root = {n: model.NewBoolVar(f"is_root_{n}_{prefix}") for n in nodes}
+    is_root = {n: new_bool_var(model, "is_root_{}_{}", n, prefix) for n in nodes}
     
     # 2. Global Constraints
     # - There must be exactly one structure root.
@@ -70,7 +100,7 @@ def add_connected_subgraph_constraint(
                 
             # BoolVar: "neighbor is the parent of curr"
             # Note: We don't need to store this in a dict unless we want to visualize the tree edges
-            p_var = model.NewBoolVar(f"parent_{curr}_is_{neighbor}_{prefix}")
+            p_var = new_bool_var(model, "parent_{}_is_{}_{}", curr, neighbor, prefix)
             parent_vars.append(p_var)
             
             # If neighbor is parent:
@@ -133,17 +163,17 @@ def add_connected_subgraph_by_height(
     max_neighbor_height: Dict[Hashable, cp.IntVar] = {} 
     
     for n in nodes:
-        is_root[n] = model.NewBoolVar(f"{prefix}_is_root_{n}")
+        is_root[n] = new_bool_var(model, "{}_is_root_{}", prefix, n)
         # Height ranges from 0 to num_nodes
-        node_height[n] = model.NewIntVar(0, num_nodes, f"{prefix}_height_{n}")
-        max_neighbor_height[n] = model.NewIntVar(0, num_nodes, f"{prefix}_max_nh_{n}")
+        node_height[n] = new_int_var(model, 0, num_nodes, "{}_height_{}", prefix, n)
+        max_neighbor_height[n] = new_int_var(model, 0, num_nodes, "{}_max_nh_{}", prefix, n)
     
     # 3. Canonical Root Selection (Symmetry Breaking)
     # The Root MUST be the *first* active node in the ordered list 'nodes'.
     # prefix_zero[i] is True iff ALL previous nodes in the list are Inactive.
     prev_n = None
     for n in nodes:
-        b = model.NewBoolVar(f"{prefix}_prefix_zero_{n}")
+        b = new_bool_var(model, "{}_prefix_zero_{}", prefix, n)
         prefix_zero[n] = b
         
         if prev_n is None:
@@ -202,40 +232,34 @@ def add_circuit_constraint_from_undirected(
     nodes: List[Hashable],
     undirected_edges: Dict[Tuple[Hashable, Hashable], cp.IntVar]
 ) -> Dict[Hashable, cp.IntVar]:
-
+    """
+    Enforce that the active undirected edges form a single cycle (or no edges at all).
+    
+    Each edge (u, v) is split into two arcs for AddCircuit, tied to the edge literal by
+    ExactlyOne(u->v, v->u, NOT edge), so a used edge is traversed in exactly one direction.
+    A node is active iff it is not skipped by its self-loop; AddCircuit itself links this
+    to the arcs, so no further implications are needed.
+    
+    Returns:
+        Mapping from node to a BoolVar that is true iff the node lies on the cycle.
+    """
     node_to_index = {node: i for i, node in enumerate(nodes)}
     circuit_arcs = []
-    node_active = {node: model.NewBoolVar(f"active_{node}") for node in nodes}
+    node_active = {node: new_bool_var(model, "active_{}", node) for node in nodes}
 
     for node in nodes:
         idx = node_to_index[node]
-        self_loop_lit = node_active[node].Not()
-        circuit_arcs.append([idx, idx, self_loop_lit])
+        circuit_arcs.append([idx, idx, node_active[node].Not()])
         
     for (u, v), edge_var in undirected_edges.items():
         if u not in node_to_index or v not in node_to_index:
             continue # ignore edges that are not in graph
-            
-        u_idx = node_to_index[u]
-        v_idx = node_to_index[v]
         
-        arc_u_v = model.NewBoolVar(f"arc_{u}->{v}")
-        arc_v_u = model.NewBoolVar(f"arc_{v}->{u}")
-        
-        circuit_arcs.append([u_idx, v_idx, arc_u_v])
-        circuit_arcs.append([v_idx, u_idx, arc_v_u])
-        
-        
-        model.AddImplication(arc_u_v, edge_var)
-        model.AddImplication(arc_v_u, edge_var)
-        model.AddBoolOr([arc_u_v, arc_v_u]).OnlyEnforceIf(edge_var)
-        
-        model.AddImplication(arc_u_v, arc_v_u.Not())
-        model.AddImplication(arc_u_v, node_active[u])
-        model.AddImplication(arc_u_v, node_active[v])
-        
-        model.AddImplication(arc_v_u, node_active[u])
-        model.AddImplication(arc_v_u, node_active[v])
+        arc_u_v = new_bool_var(model, "arc_{}->{}", u, v)
+        arc_v_u = new_bool_var(model, "arc_{}->{}", v, u)
+        circuit_arcs.append([node_to_index[u], node_to_index[v], arc_u_v])
+        circuit_arcs.append([node_to_index[v], node_to_index[u], arc_v_u])
+        model.AddExactlyOne([arc_u_v, arc_v_u, edge_var.Not()])
     if circuit_arcs:
         model.AddCircuit(circuit_arcs)
         
@@ -245,7 +269,7 @@ def add_contiguous_area_constraint(
     model: cp.CpModel,  
     grid: Grid,  
     start: Position,  
-    is_good: Callable[[Position], cp.IntVar],  
+    is_good: Callable[[Position], Any],  
     target_area: int,  
     prefix: str = ""  
 ) -> Dict[Position, cp.IntVar]:  
@@ -255,22 +279,31 @@ def add_contiguous_area_constraint(
     Starting from 'start', flood fill through cells where is_good(pos) is true.  
     The total number of filled cells must equal 'target_area'.  
       
+    A region of 'target_area' cells lies within 'target_area - 1' steps of 'start',  
+    so variables are only created for cells inside that radius, and cells for which  
+    is_good returns the constant 0 are neither filled nor walked through. Each cell  
+    gets one reachability literal per step, with the expansion written as clauses  
+    directly on it, so the model grows with the area around 'start' rather than with  
+    the grid. A closure constraint forbids good cells next to the filled region.  
+      
     Args:  
         model: CP-SAT model  
         grid: The puzzle grid (for getting neighbors)  
         start: Starting position for flood fill  
-        is_good: Function that returns a BoolVar indicating if a cell can be part of the region  
+        is_good: Function that returns a BoolVar indicating if a cell can be part of the region,  
+                 or a constant 0/1 for cells known in advance  
         target_area: Required total area  
         prefix: Variable name prefix (for uniqueness)  
       
     Returns:  
-        Dictionary mapping positions to their final reachability variables  
+        Dictionary mapping positions within reach of 'start' to their final reachability  
+        variables (cells not in the dictionary are never filled)  
       
     Example usage for Kurotto:  
         # good(pos) = (pos == start) OR shaded[pos]  
         def is_good(pos):  
             if pos == start:  
-                return model.NewConstant(1)  
+                return 1  
             return shaded[pos]  
           
         add_contiguous_area_constraint(model, grid, start, is_good, number + 1)  
@@ -281,73 +314,84 @@ def add_contiguous_area_constraint(
           
         add_contiguous_area_constraint(model, grid, start, is_good, expected_count)  
     """  
-    all_positions = [  
-        Position(r, c)   
-        for r in range(grid.num_rows)   
-        for c in range(grid.num_cols)  
-    ]  
-      
-    max_iterations = min(target_area, grid.num_rows + grid.num_cols)  
     pfx = f"{prefix}_" if prefix else ""  
+    good: Dict[Position, Any] = {}  
+  
+    def good_of(pos: Position):  
+        if pos not in good:  
+            good[pos] = is_good(pos)  
+        return good[pos]  
+  
+    def as_literal(value):  
+        return model.NewConstant(value) if isinstance(value, int) else value  
+  
+    steps = max(target_area - 1, 0)  
       
-    # Initialize: only start is reachable (if it's good)  
-    reachable = {}  
-    for pos in all_positions:  
-        reachable[pos] = model.NewBoolVar(f"{pfx}reach_0_{start.r}_{start.c}_{pos.r}_{pos.c}")  
-        if pos == start:  
-            # Start is reachable iff it's good  
-            good_var = is_good(pos)  
-            if isinstance(good_var, int):  
-                model.Add(reachable[pos] == good_var)  
-            else:  
-                model.Add(reachable[pos] == 1).OnlyEnforceIf(good_var)  
-                model.Add(reachable[pos] == 0).OnlyEnforceIf(good_var.Not())  
-        else:  
-            model.Add(reachable[pos] == 0)  
+    # Cells within `steps` of start, walking only through cells that may be good  
+    dist = {start: 0}  
+    frontier = [start] if not (isinstance(good_of(start), int) and good_of(start) == 0) else []  
+    for d in range(1, steps + 1):  
+        next_frontier = []  
+        for pos in frontier:  
+            for nbr in grid.get_neighbors(pos):  
+                if nbr in dist:  
+                    continue  
+                g = good_of(nbr)  
+                if isinstance(g, int) and g == 0:  
+                    continue  
+                dist[nbr] = d  
+                next_frontier.append(nbr)  
+        frontier = next_frontier  
       
-    # Iterative expansion  
-    for step in range(max_iterations):  
-        new_reachable = {}  
-        for pos in all_positions:  
-            new_reachable[pos] = model.NewBoolVar(  
-                f"{pfx}reach_{step+1}_{start.r}_{start.c}_{pos.r}_{pos.c}"  
-            )  
-              
-            neighbors = grid.get_neighbors(pos)  
-            expand_vars = []  
-              
-            good_var = is_good(pos)  
-              
-            for nbr in neighbors:  
-                e = model.NewBoolVar(  
-                    f"{pfx}exp_{step}_{start.r}_{start.c}_{pos.r}_{pos.c}_{nbr.r}_{nbr.c}"  
-                )  
-                # e <=> (is_good(pos) AND reachable[nbr])  
-                if isinstance(good_var, int):  
-                    if good_var == 1:  
-                        model.Add(e == reachable[nbr])  
-                    else:  
-                        model.Add(e == 0)  
-                else:  
-                    model.AddBoolAnd([good_var, reachable[nbr]]).OnlyEnforceIf(e)  
-                    model.AddBoolOr([good_var.Not(), reachable[nbr].Not()]).OnlyEnforceIf(e.Not())  
-                expand_vars.append(e)  
+    # Start is reachable iff it's good, at every step  
+    start_var = as_literal(good_of(start))  
+    reachable = {(step, start): start_var for step in range(steps + 1)}  
+      
+    # Iterative expansion: reach[t+1][pos] <=> reach[t][pos] OR (good(pos) AND any reach[t][nbr])  
+    for step in range(steps):  
+        for pos, d in dist.items():  
+            if pos == start or d > step + 1:  
+                continue  
+            cur = new_bool_var(model, "{}reach_{}_{}_{}_{}_{}", pfx, step+1, start.r, start.c, pos.r, pos.c)  
+            reachable[(step + 1, pos)] = cur  
+            prev = [reachable[(step, pos)]] if (step, pos) in reachable else []  
+            nbr_reached = [  
+                reachable[(step, nbr)] for nbr in grid.get_neighbors(pos)  
+                if (step, nbr) in reachable  
+            ]  
+            g = good_of(pos)  
+            good_lits = [] if isinstance(g, int) else [g]  
               
-            all_conditions = [reachable[pos]] + expand_vars  
-            model.AddBoolOr(all_conditions).OnlyEnforceIf(new_reachable[pos])  
-            model.AddBoolAnd([c.Not() for c in all_conditions]).OnlyEnforceIf(new_reachable[pos].Not())  
-          
-        reachable = new_reachable  
+            for p in prev:  
+                model.AddImplication(p, cur)  
+            for n in nbr_reached:  
+                model.AddBoolOr([n.Not()] + [v.Not() for v in good_lits] + [cur])  
+            if good_lits:  
+                model.AddBoolOr(prev + good_lits).OnlyEnforceIf(cur)  
+            model.AddBoolOr(prev + nbr_reached).OnlyEnforceIf(cur)  
       
-    model.Add(sum(reachable[pos] for pos in all_positions) == target_area)  
+    final = {pos: reachable[(steps, pos)] for pos in dist}  
+    model.Add(sum(final.values()) == target_area)  
       
-    return reachable  
+    # Closure: a good neighbor of the filled region would make it larger than target_area  
+    for pos, var in final.items():  
+        for nbr in grid.get_neighbors(pos):  
+            g = good_of(nbr)  
+            if isinstance(g, int) and g == 0:  
+                continue  
+            good_lits = [] if isinstance(g, int) else [g.Not()]  
+            if nbr in final:  
+                model.AddBoolOr([var.Not()] + good_lits + [final[nbr]])  
+            else:  
+                model.AddBoolOr([var.Not()] + good_lits)  
+      
+    return final  
 
 
 
 def add_connectivity_cut_node_based(
-    solver: pywraplp.Solver,
-    active_vars: Dict[Position, pywraplp.Variable],
+    solver: 'pywraplp.Solver',
+    active_vars: Dict[Position, 'pywraplp.Variable'],
     current_values: Dict[Position, int],
     neighbors_fn: Callable[[Position], List[Position]]
 ) -> bool:
@@ -425,6 +469,204 @@ def add_connectivity_cut_node_based(
         
     return cuts_added
 
+class ConnectivityCutPool:
+    """
+    Separation of node-connectivity cuts for a MIP, with a pool of the cuts added so far.
+
+    For a solution whose active nodes split into several components, each component S
+    is checked against every region of the graph beyond its inactive boundary that holds
+    another component. For each such pair, the boundary nodes touching that region form
+    a minimal separator N between u in S and v in the other component. The cut is
+    sum(N) >= x_u + x_v - 1 (u and v cannot both be active while N is all inactive).
+    Unlike a plain boundary cut, it stays valid when S could vanish altogether.
+    Several cuts are separated per round. A cut already in the pool is never added
+    twice. Cuts go to `solver` with `Add`, so it may be a pywraplp Solver or a CpModel.
+
+    Usage:
+        pool = ConnectivityCutPool(solver, active_vars, neighbors_fn)
+        num_new = pool.separate(current_values)  # 0: the active nodes are connected
+    """
+    def __init__(
+        self,
+        solver: Any,
+        active_vars: Dict[Hashable, Any],
+        neighbors_fn: Callable[[Hashable], List[Hashable]],
+        max_cuts_per_round: int = 0
+    ):
+        self.solver = solver
+        self.active_vars = active_vars
+        self.neighbors_fn = neighbors_fn
+        self.max_cuts_per_round = max_cuts_per_round
+        self.pool: Set[Tuple[frozenset, frozenset]] = set()
+        self.duplicates = 0
+        # Components of the active nodes in the last separated solution.
+        self.num_components = 0
+
+    def _components(self, nodes: Set[Hashable]) -> List[List[Hashable]]:
+        components, visited = [], set()
+        for start in sorted(nodes):
+            if start in visited:
+                continue
+            visited.add(start)
+            component, queue = [], deque([start])
+            while queue:
+                curr = queue.popleft()
+                component.append(curr)
+                for nbr in self.neighbors_fn(curr):
+                    if nbr in nodes and nbr not in visited:
+                        visited.add(nbr)
+                        queue.append(nbr)
+            components.append(component)
+        return components
+
+    def separate(self, current_values: Dict[Hashable, int]) -> int:
+        """Add the violated cuts for this solution. Returns the number of new cuts."""
+        active = {node for node, val in current_values.items() if val == 1}
+        components = self._components(active)
+        self.num_components = len(components)
+        if len(components) <= 1:
+            return 0
+        component_of = {node: i for i, comp in enumerate(components) for node in comp}
+        # Smallest components first: their cuts are the cheapest to satisfy.
+        order = sorted(range(len(components)), key=lambda i: len(components[i]))
+        num_new = 0
+        for i in order:
+            comp = components[i]
+            comp_set = set(comp)
+            boundary = {
+                nbr for node in comp for nbr in self.neighbors_fn(node)
+                if nbr in current_values and nbr not in comp_set
+            }
+            # Regions of the graph once S and its boundary are removed.
+            outside = set(current_values) - comp_set - boundary
+            for region in self._components(outside):
+                others = sorted({component_of[node] for node in region if node in component_of})
+                if not others:
+                    continue
+                region_set = set(region)
+                separator = frozenset(
+                    b for b in boundary if any(nbr in region_set for nbr in self.neighbors_fn(b))
+                )
+                u, v = comp[0], components[others[0]][0]
+                key = (separator, frozenset((u, v)))
+                if key in self.pool:
+                    self.duplicates += 1
+                    continue
+                self.pool.add(key)
+                self.solver.Add(
+                    sum(self.active_vars[b] for b in separator) >= self.active_vars[u] + self.active_vars[v] - 1
+                )
+                num_new += 1
+                if self.max_cuts_per_round and num_new >= self.max_cuts_per_round:
+                    return num_new
+        return num_new
+
+class LazyConnectivity:
+    """
+    Connectivity of the active nodes of a CP-SAT model, enforced lazily.
+
+    Each round solves the model without a connectivity encoding. If the active nodes
+    of the solution are disconnected, separator cuts are added through a
+    ConnectivityCutPool, plus any cuts from `separate_extra`. Then the model is solved
+    again, with the last solution as its hint. Most shading puzzles need only a few
+    rounds, which is much cheaper than `add_connected_subgraph_constraint`.
+
+    If the rounds stop paying off, the model falls back to that eager encoding.
+    This happens once `min_rounds` rounds have taken more than `patience` times as
+    long as the first round, after `max_rounds` rounds, or if a disconnected solution
+    yields no new cut. With `eager=True` the encoding is added from the start, which
+    is useful for benchmarking the two approaches.
+
+    Usage:
+        lazy = LazyConnectivity(model, is_white, adjacency_map)
+        status = lazy.solve(solver, max_time=10)
+        lazy.rounds, lazy.num_cuts, lazy.eager
+    """
+    def __init__(
+        self,
+        model: cp.CpModel,
+        active_vars: Dict[Hashable, Any],
+        adjacency_map: Dict[Hashable, List[Hashable]],
+        separate_extra: Optional[Callable[[], int]] = None,
+        min_rounds: int = 10,
+        patience: float = 20.0,
+        max_rounds: int = 200,
+        eager: bool = False
+    ):
+        """
+        Args:
+            active_vars: Literal of each node that must be connected when true
+                (`x.Not()` is fine, e.g. for white = not shaded).
+            separate_extra: Called on each disconnected solution, while the solver
+                still holds it; adds puzzle-specific cuts and returns how many.
+        """
+        self.model = model
+        self.active_vars = active_vars
+        self.adjacency_map = adjacency_map
+        self.separate_extra = separate_extra
+        self.min_rounds = min_rounds
+        self.patience = patience
+        self.max_rounds = max_rounds
+        self.pool = ConnectivityCutPool(model, active_vars, lambda node: adjacency_map.get(node, []))
+        self.eager = False
+        self.rounds = 0
+        self.num_cuts = 0
+        self.first_round_time = None
+        self.lazy_time = 0.0
+        if eager:
+            self.add_eager()
+
+    def add_eager(self):
+        """Add the full connectivity encoding (once)."""
+        if not self.eager:
+            self.eager = True
+            add_connected_subgraph_constraint(self.model, self.active_vars, self.adjacency_map, prefix="lazy")
+
+    def _should_fall_back(self) -> bool:
+        if self.rounds >= self.max_rounds:
+            return True
+        return self.rounds >= self.min_rounds and self.lazy_time > self.patience * self.first_round_time
+
+    def _hint(self, solver: cp.CpSolver):
+        response = solver.ResponseProto()
+        self.model.ClearHints()
+        hint = self.model.Proto().solution_hint
+        hint.vars.extend(range(len(response.solution)))
+        hint.values.extend(response.solution)
+
+    def solve(self, solver: cp.CpSolver, max_time: Optional[float] = None) -> int:
+        """
+        Solve until a solution is connected. Returns the CP-SAT status of the last round.
+        May be called again after adding constraints (e.g. a nogood); the cuts are kept.
+        """
+        start = time.perf_counter()
+        while True:
+            if max_time is not None:
+                remaining = max_time - (time.perf_counter() - start)
+                if remaining <= 0:
+                    return cp.UNKNOWN
+                solver.parameters.max_time_in_seconds = remaining
+            tic = time.perf_counter()
+            status = solver.Solve(self.model)
+            round_time = time.perf_counter() - tic
+            self.rounds += 1
+            if self.first_round_time is None:
+                self.first_round_time = max(round_time, 1e-3)
+            if not self.eager:
+                self.lazy_time += round_time
+            if status not in (cp.OPTIMAL, cp.FEASIBLE):
+                return status
+            values = {node: solver.Value(var) for node, var in self.active_vars.items()}
+            num_new = self.pool.separate(values)
+            if self.pool.num_components <= 1:
+                return status
+            if self.separate_extra is not None:
+                num_new += self.separate_extra()
+            self.num_cuts += num_new
+            self._hint(solver)
+            if num_new == 0 or self._should_fall_back():
+                self.add_eager()
+
 # def add_connectivity_cut_node_based(
 #     solver: pywraplp.Solver,
 #     active_vars: Dict[Position, pywraplp.Variable],
@@ -507,6 +749,20 @@ def add_connectivity_cut_node_based(
 
 #     return cuts_added
 
+def holds_ortools_objects(value: Any) -> bool:
+    """
+    Whether `value` is an OR-Tools object (model, solver, variable, constraint...)
+    or a container whose first element is one, e.g. a {Position: BoolVar} dict.
+    """
+    if isinstance(value, dict):
+        value = next(iter(value.values()), None)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        value = next(iter(value), None)
+    if isinstance(value, (dict, list, tuple)):
+        # One more level, e.g. {Position: [BoolVar, ...]}
+        return holds_ortools_objects(value)
+    return type(value).__module__.startswith("ortools.")
+
 def ortools_cpsat_analytics(model: cp.CpModel, solver: cp.CpSolver):
     
     proto = model.Proto()
@@ -535,7 +791,8 @@ def ortools_cpsat_analytics(model: cp.CpModel, solver: cp.CpSolver):
     return analytics_dict
     
 
-def ortools_mip_analytics(solver: pywraplp.Solver) -> dict:
+def ortools_mip_analytics(solver: 'pywraplp.Solver') -> dict:
+    from ortools.linear_solver import pywraplp
     
     if not isinstance(solver, pywraplp.Solver):
         raise ValueError("ortools MIP model invalid. ")
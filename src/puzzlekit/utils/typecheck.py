@@ -0,0 +1,32 @@
+import functools
+from typing import Callable, TypeVar
+from puzzlekit.config import _SETTINGS
+
+F = TypeVar("F", bound=Callable)
+
+
+def typechecked(func: F) -> F:
+    """
+    Drop-in for `typeguard.typechecked` that defers the work to the first call.
+
+    typeguard instruments a function by re-parsing its module source, which at
+    class-definition time costs every solver import a few milliseconds (plus
+    importing typeguard itself). Here the instrumentation happens once, when the
+    function is first called, so importing a solver module stays cheap.
+
+    With `puzzlekit.configure(validate=False)` (or PUZZLEKIT_VALIDATE=0) the check is
+    skipped and the function is called directly.
+    """
+    checked = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal checked
+        if not _SETTINGS["validate"]:
+            return func(*args, **kwargs)
+        if checked is None:
+            from typeguard import typechecked as instrument
+            checked = instrument(func)
+        return checked(*args, **kwargs)
+
+    return wrapper
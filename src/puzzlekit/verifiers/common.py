@@ -1,5 +1,14 @@
-from typing import Any, Container
+from typing import Any, Container, Optional, Tuple
+import numpy as np
 from puzzlekit.core.grid import Grid, Position
+from puzzlekit.core.array_grid import ArrayGrid
+
+def _as_arrays(a: Grid, b: Grid) -> Optional[Tuple[ArrayGrid, ArrayGrid]]:
+    """ Array-backed views of both grids, or None if their shapes differ """
+    arr_a, arr_b = ArrayGrid.from_grid(a), ArrayGrid.from_grid(b)
+    if arr_a.shape != arr_b.shape:
+        return None
+    return arr_a, arr_b
 
 def verify_exact(a: Grid, b: Grid) -> bool:
     return a == b
@@ -7,18 +16,14 @@ def verify_exact(a: Grid, b: Grid) -> bool:
 def verify_target_content(a: Grid, b: Grid, target: Any) -> bool:
     """
     General content verifier.
+    As long as one of the values is target, the other must also be target;
+    cells where neither is target are ignored.
     """
-    def check_cell(pos: Position) -> bool:
-        val_a = a.value(pos)
-        val_b = b.value(pos)
-        # As long as one of the values is target, the other must also be target
-        is_target_a = (val_a == target)
-        is_target_b = (val_b == target)
-        if is_target_a or is_target_b:
-            return val_a == val_b
-        return True # If both are not target, consider them as matched (ignored)
-
-    return all(check_cell(pos) for pos, _ in a)
+    arrays = _as_arrays(a, b)
+    if arrays is None:
+        return False
+    arr_a, arr_b = arrays
+    return bool(np.array_equal(arr_a.mask(target), arr_b.mask(target)))
 
 def verify_bijective(a: Grid, b: Grid) -> bool:
     """ Bijective verification (shapes are the same but IDs are different) """
@@ -26,38 +31,35 @@ def verify_bijective(a: Grid, b: Grid) -> bool:
 
 def verify_target_set(a: Grid, b: Grid, targets: Container) -> bool:
     """ Only verify elements in the grid that belong to the targets container """
-    def check_cell(pos: Position) -> bool:
-        val_a = a.value(pos)
-        val_b = b.value(pos)
-        if (val_a in targets) or (val_b in targets):
-            return val_a == val_b
-        return True
-    return all(check_cell(pos) for pos, _ in a)
+    arrays = _as_arrays(a, b)
+    if arrays is None:
+        return False
+    arr_a, arr_b = arrays
+    checked = arr_a.map_symbols(lambda s: s in targets, bool) | arr_b.map_symbols(lambda s: s in targets, bool)
+    return bool(np.all(arr_a.to_numpy()[checked] == arr_b.to_numpy()[checked]))
 
 def verify_lines(a: Grid, b: Grid) -> bool:
     """ 
     Special verifier for line puzzles (like Masyu, Yajilin) 
     Ignore line order, normalize and compare.
     """
-    for pos, _ in a:
-        val_a = a.value(pos)
-        val_b = b.value(pos)
-        # Assuming value is a string, sort characters to ignore order "vh" == "hv"
-        norm_a = "".join(sorted(str(val_a)))
-        norm_b = "".join(sorted(str(val_b)))
-        if norm_a != norm_b:
-            return False
-    return True
+    arrays = _as_arrays(a, b)
+    if arrays is None:
+        return False
+    arr_a, arr_b = arrays
+    # Assuming value is a string, sort characters to ignore order "vh" == "hv"
+    normalize = lambda s: "".join(sorted(str(s)))
+    return bool(np.array_equal(arr_a.map_symbols(normalize), arr_b.map_symbols(normalize)))
 
 def verify_digits(a: Grid, b: Grid) -> bool:
     """ Only compare digits """
-    for pos, _ in a:
-        val_a = str(a.value(pos))
-        val_b = str(b.value(pos))
-        if val_a.isdigit() or val_b.isdigit():
-            if val_a != val_b:
-                return False
-    return True
+    arrays = _as_arrays(a, b)
+    if arrays is None:
+        return False
+    arr_a, arr_b = arrays
+    str_a, str_b = arr_a.map_symbols(str), arr_b.map_symbols(str)
+    checked = arr_a.map_symbols(lambda s: str(s).isdigit(), bool) | arr_b.map_symbols(lambda s: str(s).isdigit(), bool)
+    return bool(np.all(str_a[checked] == str_b[checked]))
 
 def verify_wall(a: Grid, b: Grid) -> bool:
     """ Verify wall puzzles """
@@ -0,0 +1,52 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import puzzlekit
+from puzzlekit.solvers import get_solver_class
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.sudoku = get_solver_class("sudoku").metadata["input_example"]
+    # Enumerating a huge number of solutions: runs until interrupted.
+    d.endless = {"num_rows": 16, "num_cols": 16, "grid": [["-"] * 16 for _ in range(16)]}
+    return d
+
+def test_solve_async(data):
+    res = asyncio.run(puzzlekit.solve_async(data.sudoku, "sudoku"))
+    assert res.solution_data["status"] == "Optimal"
+    assert res.solution_data["solution_grid"] == puzzlekit.solve(data.sudoku, "sudoku").solution_data["solution_grid"]
+    with pytest.raises(ValueError):
+        asyncio.run(puzzlekit.solve_async(data.sudoku, "no_such_puzzle"))
+
+def test_cancel_interrupts_search(data):
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def main():
+        task = asyncio.create_task(puzzlekit.solve_async(data.endless, "sudoku", count_solutions=10**9, executor=executor))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The single worker thread is free again only if the search was stopped.
+        tic = time.perf_counter()
+        res = await puzzlekit.solve_async(data.sudoku, "sudoku", executor=executor)
+        return res, time.perf_counter() - tic
+
+    res, elapsed = asyncio.run(main())
+    executor.shutdown()
+    assert res.is_solved
+    assert elapsed < 5
+
+def test_solve_many_async(data):
+    async def main():
+        sources = [data.sudoku] * 4 + ["1 1\nq"]
+        return [res async for res in puzzlekit.solve_many_async(sources, "sudoku", concurrency=2)]
+
+    results = asyncio.run(main())
+    statuses = sorted(res.solution_data["status"] for res in results)
+    assert statuses == ["Error"] + ["Optimal"] * 4
@@ -0,0 +1,32 @@
+import pytest
+import puzzlekit
+from puzzlekit.core.grid import Grid
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.hitori_str = "4 4\n3 3 1 4\n4 3 2 2\n1 3 4 2\n3 4 3 2"
+    d.exp_grid = Grid(list(map(lambda x: x.split(" "), "- x - -\n- - - x\n- x - -\nx - - x".split("\n"))))
+    return d
+
+def test_solve_many_in_process(data):
+    results = list(puzzlekit.solve_many([data.hitori_str, "garbage", data.hitori_str], "hitori", workers=1))
+    assert [res.solution_data['status'] for res in results] == ["Optimal", "Error", "Optimal"]
+    assert results[0].solution_data['solution_grid'] == data.exp_grid
+
+def test_solve_many_pool(data):
+    sources = [data.hitori_str] * 5 + ["garbage"]
+    results = list(puzzlekit.solve_many(iter(sources), "hitori", workers=2, chunk_size=2))
+    assert len(results) == 6
+    assert results[-1].solution_data['status'] == "Error"
+    assert all(res.solution_data['solution_grid'] == data.exp_grid for res in results[:-1])
+    
+    unordered = list(puzzlekit.solve_many(sources, "hitori", workers=2, ordered=False))
+    assert sorted(res.solution_data['status'] for res in unordered) == ["Error"] + ["Optimal"] * 5
+
+def test_solve_many_unknown_type(data):
+    with pytest.raises(ValueError):
+        puzzlekit.solve_many([data.hitori_str], "not_a_puzzle")
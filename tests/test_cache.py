@@ -0,0 +1,68 @@
+import pytest
+import puzzlekit
+from puzzlekit.cache import SolutionCache, cache_key
+from puzzlekit.core.grid import Grid
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers import get_solver_class
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.hitori_str = "4 4\n3 3 1 4\n4 3 2 2\n1 3 4 2\n3 4 3 2"
+    d.hitori_dict = {
+        "num_rows": 4,
+        "num_cols": 4,
+        "grid": [row.split(" ") for row in "3 3 1 4\n4 3 2 2\n1 3 4 2\n3 4 3 2".split("\n")]
+    }
+    d.exp_grid = Grid(list(map(lambda x: x.split(" "), "- x - -\n- - - x\n- x - -\nx - - x".split("\n"))))
+    return d
+
+def test_cache_key(data):
+    # A raw string and the equivalent dict (tuples or lists) share a key.
+    as_tuples = dict(data.hitori_dict, grid=[tuple(row) for row in data.hitori_dict["grid"]])
+    assert cache_key("hitori", data.hitori_dict) == cache_key("hitori", as_tuples)
+    assert cache_key("hitori", data.hitori_dict) != cache_key("akari", data.hitori_dict)
+
+def test_memory_cache(data):
+    cache = SolutionCache(max_entries=1)
+    first = puzzlekit.solve(data.hitori_str, "hitori", cache=cache)
+    second = puzzlekit.solve(data.hitori_dict, "hitori", cache=cache)
+    assert first.solution_data['cache_hit'] is False
+    assert second.solution_data['cache_hit'] is True
+    assert second.solution_data['status'] == first.solution_data['status']
+    assert second.solution_data['solution_grid'] == data.exp_grid
+    assert cache.cache_info()['memory_hits'] == 1
+
+    instance = puzzlekit.solver("hitori", data.hitori_dict, cache=cache)
+    assert instance.solve().solution_data['cache_hit'] is True
+
+def test_cache_key_covers_renamed_inputs():
+    # StitchesSolver keeps region_grid as self.regions_grid: puzzles that differ only
+    # in their regions must not share a cache entry.
+    solver_class = get_solver_class("stitches")
+    params = get_parser("stitches")(solver_class.metadata["input_example"].strip())
+    one_region = dict(params, region_grid=[["1"] * len(row) for row in params["region_grid"]])
+    cache = SolutionCache()
+    assert puzzlekit.solver("stitches", params, cache=cache).solve().solution_data['status'] == 'Optimal'
+    res = puzzlekit.solver("stitches", one_region, cache=cache).solve()
+    assert res.solution_data['cache_hit'] is False
+    assert res.solution_data['status'] == 'Infeasible'
+    res = puzzlekit.solve(one_region, "stitches", cache=cache)
+    assert res.solution_data['cache_hit'] is True
+    assert res.solution_data['status'] == 'Infeasible'
+
+def test_disk_cache(data, tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    cache = SolutionCache(path=path)
+    puzzlekit.solve(data.hitori_str, "hitori", cache=cache)
+    cache.close()
+
+    reopened = SolutionCache(path=path)
+    res = puzzlekit.solve(data.hitori_str, "hitori", cache=reopened)
+    assert res.solution_data['cache_hit'] is True
+    assert res.solution_data['solution_grid'] == data.exp_grid
+    assert reopened.cache_info()['disk_hits'] == 1
+    reopened.close()
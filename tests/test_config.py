@@ -0,0 +1,60 @@
+import pytest
+import puzzlekit
+from typeguard import TypeCheckError
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers import get_solver_class
+from puzzlekit.solvers.sudoku import SudokuSolver
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.grid = [["1", "-", "-", "-"], ["-", "-", "-", "-"], ["-", "-", "-", "-"], ["-", "-", "-", "-"]]
+    return d
+
+def test_validate_default(data):
+    with pytest.raises(TypeCheckError):
+        SudokuSolver(4, 4, [tuple(row) for row in data.grid])
+    with pytest.raises(ValueError, match=r"Invalid value 'a' at \(1,2\)"):
+        SudokuSolver(4, 4, [data.grid[0], ["-", "-", "a", "b"]] + data.grid[2:])
+
+def test_validate_off(data):
+    previous = puzzlekit.configure(validate=False)
+    try:
+        # typeguard is skipped, validate_input still runs.
+        SudokuSolver(4, 4, [tuple(row) for row in data.grid])
+        with pytest.raises(ValueError):
+            SudokuSolver(4, 4, [data.grid[0], ["-", "-", "a", "-"]] + data.grid[2:])
+        assert puzzlekit.solve({"num_rows": 4, "num_cols": 4, "grid": data.grid}, "sudoku").is_solved
+    finally:
+        puzzlekit.configure(**previous)
+    assert puzzlekit.config.get_config()["validate"] is True
+
+def test_debug_names(data):
+    solver = SudokuSolver(4, 4, data.grid)
+    solver._add_constr()
+    assert all(var.name == "" for var in solver.model.Proto().variables)
+    previous = puzzlekit.configure(debug_names=True)
+    try:
+        solver = SudokuSolver(4, 4, data.grid)
+        solver._add_constr()
+        names = [var.name for var in solver.model.Proto().variables]
+        assert all(names) and len(set(names)) == len(names)
+    finally:
+        puzzlekit.configure(**previous)
+
+def test_debug_names_domain_vars():
+    solver_class = get_solver_class("pfeilzahlen")
+    params = get_parser("pfeilzahlen")(solver_class.metadata["input_example"].strip())
+    solver = solver_class(**params)
+    solver._add_constr()
+    assert all(var.name == "" for var in solver.model.Proto().variables)
+    previous = puzzlekit.configure(debug_names=True)
+    try:
+        solver = solver_class(**params)
+        solver._add_constr()
+        assert "x[0,1]" in {var.name for var in solver.model.Proto().variables}
+    finally:
+        puzzlekit.configure(**previous)
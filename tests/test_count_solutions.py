@@ -0,0 +1,45 @@
+import pytest
+import puzzlekit
+from puzzlekit.solvers import get_solver_class
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.empty_sudoku = {"num_rows": 4, "num_cols": 4, "grid": [["-"] * 4 for _ in range(4)]}
+    d.hitori = {"num_rows": 1, "num_cols": 3, "grid": [["1", "2", "1"]]}
+    return d
+
+@pytest.mark.parametrize("puzzle_type", ["sudoku", "masyu", "hitori", "heyawake"])
+def test_unique_examples(puzzle_type):
+    example = get_solver_class(puzzle_type).metadata["input_example"]
+    res = puzzlekit.solve(example, puzzle_type, count_solutions=2)
+    assert res.is_solved
+    assert res.solution_data["num_solutions"] == 1
+    assert res.solution_data["is_unique"] is True
+
+def test_bounded_count(data):
+    res = puzzlekit.solve(data.empty_sudoku, "sudoku", count_solutions=3)
+    assert res.solution_data["num_solutions"] == 3
+    assert res.solution_data["is_unique"] is False
+    # A limit above the true count enumerates all of them.
+    first_row = dict(data.empty_sudoku, grid=[["1", "2", "3", "4"]] + data.empty_sudoku["grid"][1:])
+    res = puzzlekit.solve(first_row, "sudoku", count_solutions=100)
+    assert res.solution_data["num_solutions"] == 288 // 24
+    res = puzzlekit.solve(data.empty_sudoku, "sudoku", count_solutions=1)
+    assert res.solution_data["is_unique"] is None
+
+def test_iterative_count(data):
+    res = puzzlekit.solve(data.hitori, "hitori", count_solutions=10)
+    assert res.solution_data["num_solutions"] == 3
+    assert res.solution_data["is_unique"] is False
+    assert "num_solutions" not in puzzlekit.solve(data.hitori, "hitori").solution_data
+
+def test_count_infeasible():
+    res = puzzlekit.solve({"num_rows": 2, "num_cols": 2, "grid": [["1", "1"], ["1", "1"]]}, "hitori", count_solutions=2)
+    assert res.solution_data["num_solutions"] == 0
+    assert res.solution_data["is_unique"] is False
+    with pytest.raises(ValueError):
+        puzzlekit.solve({"num_rows": 1, "num_cols": 3, "grid": [["1", "2", "1"]]}, "hitori", count_solutions=0)
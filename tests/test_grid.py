@@ -1,5 +1,6 @@
 import pytest
 from puzzlekit.core.grid import Grid
+from puzzlekit.core.array_grid import ArrayGrid
 from puzzlekit.core.regionsgrid import RegionsGrid
 from puzzlekit.core.direction import Direction
 from puzzlekit.core.position import Position
@@ -109,3 +110,32 @@ def test_value_out_of_bounds(data):
     with pytest.raises(IndexError):
         data.grid_2x2.value(-10, 0)
 
+
+def test_array_grid(data):
+    arr = ArrayGrid(data.grid_4x4.matrix)
+    assert arr == data.grid_4x4 and data.grid_4x4 == arr
+    assert arr.matrix == data.grid_4x4.matrix
+    assert arr.value(Position(1, 2)) == "6" and arr.value(2, 0) == "7"
+    assert arr.count("0") == 7
+    assert arr.get_neighbors(Position(3, 3)) == {Position(3, 2), Position(2, 3)}
+    assert list(arr) == list(data.grid_4x4)
+    
+    arr.set_value(Position(3, 3), "x")
+    assert arr.value(3, 3) == "x" and arr != data.grid_4x4
+    assert ArrayGrid([["x", "-"]]) == ArrayGrid([["x", "-"]])
+    assert ArrayGrid([["x", "-"]]) != ArrayGrid([["-", "x"]])
+    assert ArrayGrid([[]]).is_empty()
+
+def test_position_interning(data):
+    assert Position(1, 1) is data.position_11
+    assert data.position_11.up is Position(0, 1)
+    assert Position(0.5, 1) == Position(0.5, 1)
+    with pytest.raises(AttributeError):
+        data.position_11.r = 2
+    with pytest.raises(TypeError):
+        data.position_11[0] = 2
+    
+    # Cached neighbor tables hand out fresh sets
+    nbrs = data.grid_4x4.get_neighbors(Position(0, 0))
+    nbrs.add(Position(3, 3))
+    assert data.grid_4x4.get_neighbors(Position(0, 0)) == {Position(0, 1), Position(1, 0)}
@@ -1,6 +1,8 @@
 import pytest
+from ortools.sat.python import cp_model as cp
 from puzzlekit.core.grid import Grid
 from puzzlekit.solvers.heyawake import HeyawakeSolver 
+from puzzlekit.utils.ortools_utils import LazyConnectivity, new_bool_var
 
 class TestData:
     pass
@@ -14,10 +16,45 @@ def data():
         "grid": list(map(lambda x: x.split(" "), "- - - - - -\n- - - - - -\n1 - 3 - 0 -\n- - - - - -\n- - - - - -\n2 - - - - -".split("\n"))),
         "region_grid": list(map(lambda x: x.split(" "), "1 1 8 6 6 6\n1 1 8 6 6 6\n2 2 3 3 5 5\n2 2 3 3 5 5\n2 2 3 3 5 5\n4 4 4 7 7 7".split("\n"))),
         }
+    d.exp_grid = list(map(lambda x: x.split(" "), "- - x - - -\n- x - - x -\n- - - x - -\nx - x - - -\n- - - x - -\nx - x - - x".split("\n")))
     return d
 
 def test_heyawake(data):
-    exp_grid = list(map(lambda x: x.split(" "), "- - x - - -\n- x - - x -\n- - - x - -\nx - x - - -\n- - - x - -\nx - x - - x".split("\n")))
     solver = HeyawakeSolver(**data.puzzle_dict)
     res_grid = solver.solve().solution_data.get('solution_grid', [])
-    assert Grid(exp_grid) == res_grid
\ No newline at end of file
+    assert Grid(data.exp_grid) == res_grid
+
+def test_heyawake_eager_connectivity(data, monkeypatch):
+    monkeypatch.setattr(HeyawakeSolver, "eager_connectivity", True)
+    solution_data = HeyawakeSolver(**data.puzzle_dict).solve().solution_data
+    assert solution_data["eager_connectivity"]
+    assert solution_data["num_cuts"] == 0
+    assert Grid(data.exp_grid) == solution_data.get('solution_grid', [])
+
+
+def test_lazy_connectivity():
+    model = cp.CpModel()
+    active = {i: new_bool_var(model, "a{}", i) for i in range(5)}
+    model.Add(active[0] == 1)
+    model.Add(active[4] == 1)
+    model.Minimize(sum(active.values()))
+    adjacency_map = {i: [j for j in (i - 1, i + 1) if 0 <= j < 5] for i in range(5)}
+    lazy = LazyConnectivity(model, active, adjacency_map)
+    solver = cp.CpSolver()
+    assert lazy.solve(solver) == cp.OPTIMAL
+    assert [solver.Value(active[i]) for i in range(5)] == [1] * 5
+    assert lazy.rounds >= 2 and lazy.num_cuts >= 1
+    assert not lazy.eager
+
+
+def test_lazy_connectivity_fallback():
+    model = cp.CpModel()
+    active = {i: new_bool_var(model, "a{}", i) for i in range(5)}
+    model.Add(active[0] + active[4] == 2)
+    model.Minimize(sum(active.values()))
+    adjacency_map = {i: [j for j in (i - 1, i + 1) if 0 <= j < 5] for i in range(5)}
+    lazy = LazyConnectivity(model, active, adjacency_map, max_rounds=1)
+    solver = cp.CpSolver()
+    assert lazy.solve(solver) == cp.OPTIMAL
+    assert lazy.eager
+    assert sum(solver.Value(v) for v in active.values()) == 5
@@ -1,5 +1,6 @@
 import pytest
 from puzzlekit.core.grid import Grid
+from puzzlekit.core.position import Position
 from puzzlekit.solvers.hitori import HitoriSolver 
 
 class TestData:
@@ -19,4 +20,53 @@ def test_hitori(data):
     exp_grid = list(map(lambda x: x.split(" "), "- x - -\n- - - x\n- x - -\nx - - x".split("\n")))
     solver = HitoriSolver(**data.puzzle_dict)
     res_grid = solver.solve().solution_data.get('solution_grid', [])
-    assert Grid(exp_grid) == res_grid
\ No newline at end of file
+    assert Grid(exp_grid) == res_grid
+
+def test_hitori_cut_stats(data):
+    solution_data = HitoriSolver(**data.puzzle_dict).solve().solution_data
+    stats = solution_data["iteration_stats"]
+    assert len(stats) == solution_data["iterations"]
+    assert solution_data["num_cuts"] == sum(s["cuts"] for s in stats)
+    # The last round is the accepted solution: nothing left to cut.
+    assert stats[-1]["cuts"] == 0
+
+
+def test_connectivity_cut_pool_dedupes():
+    from ortools.linear_solver import pywraplp
+    from puzzlekit.utils.ortools_utils import ConnectivityCutPool
+    solver = pywraplp.Solver.CreateSolver("SCIP")
+    nodes = [(0, c) for c in range(5)]
+    x = {p: solver.BoolVar(f"x_{p}") for p in nodes}
+    pool = ConnectivityCutPool(solver, x, lambda p: [(0, p[1] + d) for d in (-1, 1) if 0 <= p[1] + d < 5])
+    # Two active runs, separated by the inactive node (0, 2).
+    values = {(0, 0): 1, (0, 1): 1, (0, 2): 0, (0, 3): 1, (0, 4): 1}
+    assert pool.separate(values) == 1
+    assert solver.NumConstraints() == 1
+    # The same solution again: no new cut, but it is still disconnected.
+    assert pool.separate(values) == 0
+    assert pool.duplicates >= 1
+    assert pool.num_components == 2
+    assert pool.separate({p: 1 for p in nodes}) == 0
+    assert pool.num_components == 1
+
+
+def test_hitori_disconnected_without_new_cuts():
+    from ortools.linear_solver import pywraplp
+    from puzzlekit.utils.ortools_utils import ConnectivityCutPool
+    grid = [["1", "1", "2"], ["1", "3", "4"], ["5", "6", "7"]]
+    solver = HitoriSolver(num_rows=3, num_cols=3, grid=grid)
+    solver._add_constr()
+    # Shading (0, 1) and (1, 0) cuts off the corner; its cuts are in the pool already.
+    values = {pos: int(pos not in [Position(0, 1), Position(1, 0)]) for pos in solver.is_white}
+    class Discard:
+        def Add(self, constraint):
+            pass
+    pooled = ConnectivityCutPool(Discard(), solver.is_white, solver.cut_pool.neighbors_fn)
+    assert pooled.separate(values) > 0
+    solver.cut_pool.pool |= pooled.pool
+    for pos, var in solver.is_white.items():
+        var.SetBounds(values[pos], values[pos])
+    assert solver.solver.Solve() == pywraplp.Solver.OPTIMAL
+    num_constraints = solver.solver.NumConstraints()
+    assert solver._check_and_add_cuts() == 1
+    assert solver.solver.NumConstraints() == num_constraints + 1
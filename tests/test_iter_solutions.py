@@ -0,0 +1,65 @@
+import itertools
+import time
+import pytest
+from puzzlekit.solvers import get_solver_class
+from puzzlekit.parsers import get_parser
+from puzzlekit.solvers.sudoku import SudokuSolver
+from puzzlekit.solvers.hitori import HitoriSolver
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.empty_4x4 = [["-"] * 4 for _ in range(4)]
+    d.empty_9x9 = [["-"] * 9 for _ in range(9)]
+    return d
+
+def test_enumerate_all(data):
+    solutions = SudokuSolver(4, 4, data.empty_4x4).iter_solutions()
+    grids = list(solutions)
+    assert len(grids) == 288
+    assert len({str(grid.matrix) for grid in grids}) == 288
+    assert solutions.exhausted and solutions.num_solutions == 288
+
+def test_limit_and_early_close(data):
+    solutions = SudokuSolver(9, 9, data.empty_9x9).iter_solutions(limit=5)
+    assert len(list(solutions)) == 5
+    assert solutions.stop_reason == "limit"
+    solutions = SudokuSolver(9, 9, data.empty_9x9).iter_solutions()
+    assert len(list(itertools.islice(solutions, 3))) == 3
+    assert solutions.stop_reason is None
+    solutions.close()
+    assert solutions.stop_reason == "closed"
+    assert list(solutions) == []
+
+def test_timeout(data):
+    solutions = SudokuSolver(9, 9, data.empty_9x9).iter_solutions(timeout=0.5)
+    assert len(list(solutions)) > 0
+    assert solutions.stop_reason == "timeout"
+
+def test_auxiliary_variables_deduplicated():
+    # Masyu's loop can be oriented either way; only the grid counts.
+    cls = get_solver_class("masyu")
+    solver = cls(**get_parser("masyu")(cls.metadata["input_example"].strip()))
+    assert len(list(solver.iter_solutions(timeout=30))) == 1
+
+@pytest.mark.parametrize("puzzle_type", ["nurikabe", "heyawake"])
+def test_connectivity_solvers_finish(puzzle_type):
+    # Auxiliary connectivity variables (Nurikabe) and lazily added cuts (Heyawake)
+    # must not keep the enumeration busy once the single grid is found.
+    cls = get_solver_class(puzzle_type)
+    params = get_parser(puzzle_type)(cls.metadata["input_example"].strip())
+    expected = cls(**params).solve().solution_data['solution_grid']
+    tic = time.perf_counter()
+    solutions = cls(**params).iter_solutions(timeout=15)
+    assert list(solutions) == [expected]
+    assert solutions.exhausted
+    assert time.perf_counter() - tic < 10
+
+def test_iterative_solver():
+    solutions = HitoriSolver(1, 3, [["1", "2", "1"]]).iter_solutions()
+    grids = [grid.matrix for grid in solutions]
+    assert sorted(grids) == [[["-", "-", "x"]], [["x", "-", "-"]], [["x", "-", "x"]]]
+    assert solutions.exhausted
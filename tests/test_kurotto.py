@@ -0,0 +1,22 @@
+import pytest
+from puzzlekit.core.grid import Grid
+from puzzlekit.solvers.kurotto import KurottoSolver
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.puzzle_dict = {
+        "num_rows": 3,
+        "num_cols": 4,
+        "grid": list(map(lambda x: x.split(" "), "4 - - -\n- - - 0\n- 2 - -".split("\n")))
+        }
+    return d
+
+def test_kurotto(data):
+    exp_grid = list(map(lambda x: x.split(" "), "- x x -\nx - - -\nx - - -".split("\n")))
+    solver = KurottoSolver(**data.puzzle_dict)
+    res_grid = solver.solve().solution_data.get('solution_grid', [])
+    assert Grid(exp_grid) == res_grid
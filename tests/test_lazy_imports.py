@@ -0,0 +1,18 @@
+import os
+import sys
+import subprocess
+import puzzlekit
+
+def _loaded_after(code: str, modules):
+    src = os.path.dirname(os.path.dirname(os.path.abspath(puzzlekit.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src, os.environ.get("PYTHONPATH", "")]))
+    probe = f"import sys\n{code}\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True, env=env)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+def test_import_is_lazy():
+    assert _loaded_after("import puzzlekit", ["matplotlib", "ortools.linear_solver.pywraplp", "typeguard", "asyncio"]) == []
+
+def test_cpsat_solver_skips_linear_solver():
+    code = "import puzzlekit\npuzzlekit.solve('4 4\\n1 - - -\\n- - - -\\n- - - -\\n- - - -', 'sudoku')"
+    assert _loaded_after(code, ["matplotlib", "ortools.linear_solver.pywraplp"]) == []
@@ -0,0 +1,38 @@
+import pytest
+import puzzlekit
+from puzzlekit.solvers.sudoku import SudokuSolver
+from puzzlekit.core.model_template import clear_model_templates, model_template_info
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.grid_a = [["1", "-", "-", "-"], ["-", "-", "3", "-"], ["-", "4", "-", "-"], ["-", "-", "-", "2"]]
+    d.grid_b = [["-", "-", "-", "4"], ["-", "-", "-", "-"], ["2", "-", "-", "-"], ["-", "-", "-", "-"]]
+    return d
+
+def test_shared_template(data):
+    clear_model_templates()
+    first = SudokuSolver(4, 4, data.grid_a)
+    res_a = first.solve()
+    res_b = SudokuSolver(4, 4, data.grid_b).solve()
+    assert model_template_info() == {"hits": 1, "misses": 1, "size": 1}
+    # Clues go to the copies only: each solution keeps its own givens.
+    for grid, res in ((data.grid_a, res_a), (data.grid_b, res_b)):
+        assert res.is_solved
+        solution = res.solution_data["solution_grid"].matrix
+        assert all(v == "-" or v == solution[i][j] for i, row in enumerate(grid) for j, v in enumerate(row))
+    assert len(first.model.Proto().constraints) == 12 + 4
+    SudokuSolver(9, 9, [["-"] * 9 for _ in range(9)])._add_constr()
+    assert model_template_info()["size"] == 2
+
+def test_template_follows_debug_names(data):
+    previous = puzzlekit.configure(debug_names=True)
+    try:
+        solver = SudokuSolver(4, 4, data.grid_a)
+        solver._add_constr()
+        assert solver.model.Proto().variables[0].name == "x[0, 0]"
+    finally:
+        puzzlekit.configure(**previous)
@@ -1,5 +1,9 @@
+import copy
+import numpy as np
 import pytest
+import puzzlekit
 from puzzlekit.core.grid import Grid
+from puzzlekit.core.presolve import PresolveConflict, UNKNOWN
 from puzzlekit.solvers.nonogram import NonogramSolver 
 
 class TestData:
@@ -21,4 +25,62 @@ def test_nonogram(data):
     exp_grid = list(map(lambda x: x.split(" "), "- - - - - - - - - x x - - - x x - - - -\nx - x - - - - - x x x x - x x x x - - -\nx - x - - - - x x - - x x x - - x x - -\n- - - - - - - x - - - - - - - - - x - -\nx x x x - - x x - - - x - x - - - x x -\nx x x x - - x - x x - - - - - x x - x -\nx x x x - - x - - - - - x - - - - - x -\nx x x x - - x - x x - - - - - x x - x -\nx x - x - - x - - - - x x x - - - - x -\nx - - x x - x x - - - - - - - - - x x -\nx - - - x x - x x - - - - - - - - x - -\nx x - - - x x x - - - - - - - - x x x -\n- x x - - - - - - - - - - - - - x x x x\n- - x x x - - - - - - - - - x - x x x x\n- - - - x x x x - - - - - - x - x x x x\n- - - - - x x x x - - - - x x - x x x x\n- - - - - x x x x - - - x x - - - x x x\n- - - - - x x x x - - - x - - - - - - x\n- - - - - x x x - - - - x x - - - - x x\n- - - - - - x x x x x x x x x x x x x -".split("\n")))
     solver = NonogramSolver(**data.puzzle_dict)
     res_grid = solver.solve().solution_data.get('solution_grid', [])
-    # assert Grid(exp_grid) == res_grid
\ No newline at end of file
+    # assert Grid(exp_grid) == res_grid
+
+def test_nonogram_encodings_agree(data):
+    grids = {}
+    for encoding in NonogramSolver.ENCODINGS:
+        solver = NonogramSolver(**copy.deepcopy(data.puzzle_dict), encoding=encoding)
+        solution_data = solver.solve().solution_data
+        assert solution_data['status'] == 'Optimal'
+        grids[encoding] = solution_data['solution_grid']
+    assert grids['automaton'] == grids['blocks']
+
+
+def test_nonogram_metadata_example():
+    metadata = NonogramSolver.metadata
+    exp_grid = Grid([row.split() for row in metadata['output_example'].strip().split("\n")[1:]])
+    res = puzzlekit.solve(metadata['input_example'], "nonogram")
+    assert res.solution_data['solution_grid'] == exp_grid
+    # Line logic alone solves it.
+    assert res.solution_data['presolve']['solved']
+    previous = puzzlekit.configure(presolve=False)
+    try:
+        res = puzzlekit.solve(metadata['input_example'], "nonogram")
+    finally:
+        puzzlekit.configure(**previous)
+    assert 'presolve' not in res.solution_data
+    assert res.solution_data['solution_grid'] == exp_grid
+
+
+def test_nonogram_line_automaton():
+    transitions, final_states = NonogramSolver._line_automaton([2, 1])
+    assert sorted(transitions) == [(0, 0, 0), (0, 1, 1), (1, 1, 2), (2, 0, 3), (3, 0, 3), (3, 1, 4), (4, 0, 5), (5, 0, 5)]
+    assert final_states == [4, 5]
+    # An empty line only accepts zeros.
+    transitions, final_states = NonogramSolver._line_automaton([])
+    assert 0 in final_states and all(value == 0 for _, value, _ in transitions)
+
+
+def test_nonogram_invalid_encoding(data):
+    with pytest.raises(ValueError):
+        NonogramSolver(**data.puzzle_dict, encoding="sat")
+
+
+def test_nonogram_solve_lines():
+    U = UNKNOWN
+    values = np.array([[U, U, U, U, U], [U, 1, U, U, U], [U, U, U, 0, U]], dtype=np.int8)
+    lengths = np.array([[3, 0], [1, 1], [2, 1]])
+    counts = np.array([1, 2, 2])
+    deduced = NonogramSolver._solve_lines(values, lengths, counts)
+    assert deduced.tolist() == [[U, U, 1, U, U], [0, 1, 0, U, U], [U, 1, U, 0, 1]]
+    with pytest.raises(PresolveConflict):
+        NonogramSolver._solve_lines(np.array([[1, 0, 1]], dtype=np.int8), np.array([[3]]), np.array([1]))
+
+
+def test_nonogram_presolve_partial(data):
+    # The 20x20 puzzle needs search beyond line logic: the pinned cells must agree with it.
+    solution_data = NonogramSolver(**data.puzzle_dict).solve().solution_data
+    assert solution_data['status'] == 'Optimal'
+    assert not solution_data['presolve']['solved']
+    assert 0 < solution_data['presolve']['fixed'] < 400
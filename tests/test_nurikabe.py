@@ -0,0 +1,21 @@
+"""Metadata-based test for Nurikabe."""
+
+import pytest
+
+from puzzlekit.solvers.nurikabe import NurikabeSolver
+from tests.metadata_test_utils import run_metadata_test_and_verify
+
+
+def test_nurikabe_from_metadata():
+    assert run_metadata_test_and_verify("nurikabe")
+
+
+def test_nurikabe_islands_do_not_touch():
+    # Transposed example: the islands of the 2-hints at (6, 0) and (6, 3) must not merge.
+    rows = NurikabeSolver.metadata["input_example"].strip().splitlines()[1:]
+    grid = [list(col) for col in zip(*(row.split() for row in rows))]
+    expected = NurikabeSolver.metadata["output_example"].strip().splitlines()[1:]
+    expected = [list(col) for col in zip(*(row.split() for row in expected))]
+
+    result = NurikabeSolver(10, 10, grid).solve()
+    assert result.solution_data["solution_grid"].matrix == expected
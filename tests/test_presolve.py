@@ -0,0 +1,53 @@
+import pytest
+import puzzlekit
+from puzzlekit.core.presolve import Presolver, exactly, at_most_one
+from puzzlekit.solvers.hitori import HitoriSolver
+from puzzlekit.solvers.starbattle import StarbattleSolver
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.hitori = {
+        "num_rows": 4,
+        "num_cols": 4,
+        "grid": list(map(lambda x: x.split(" "), "3 3 1 4\n4 3 2 2\n1 3 4 2\n3 4 3 2".split("\n")))
+    }
+    d.starbattle = {
+        "num_rows": 6,
+        "num_cols": 6,
+        "num_stars": 1,
+        "region_grid": list(map(lambda x: x.split(" "), "1 2 2 2 2 2\n1 1 1 1 2 2\n1 2 2 2 2 6\n1 3 4 3 5 6\n1 3 4 3 5 5\n1 3 3 3 5 5".split("\n")))
+    }
+    return d
+
+def test_presolver_fixpoint():
+    row = [(0, c) for c in range(4)]
+    presolver = Presolver(1, 4, [lambda state: at_most_one(state, row), lambda state: exactly(state, row[2:], 1)])
+    fixed = presolver.run({(0, 3): 0})
+    assert fixed == {(0, 0): 0, (0, 1): 0, (0, 2): 1, (0, 3): 0}
+    assert presolver.stats["given"] == 1
+    assert presolver.stats["fixed"] == 3
+    assert not presolver.stats["conflict"]
+
+def test_presolver_conflict():
+    row = [(0, 0), (0, 1)]
+    presolver = Presolver(1, 2, [lambda state: exactly(state, row, 2)])
+    # The model is left to prove infeasibility: nothing is fixed.
+    assert presolver.run({(0, 0): 0}) == {}
+    assert presolver.stats["conflict"]
+
+def test_presolve_same_solution(data):
+    for solver_class, params in ((HitoriSolver, data.hitori), (StarbattleSolver, data.starbattle)):
+        on = solver_class(**params).solve(count_solutions=2).solution_data
+        previous = puzzlekit.configure(presolve=False)
+        try:
+            off = solver_class(**params).solve(count_solutions=2).solution_data
+        finally:
+            puzzlekit.configure(**previous)
+        assert on["presolve"]["fixed"] > 0
+        assert "presolve" not in off
+        assert on["solution_grid"] == off["solution_grid"]
+        assert on["num_solutions"] == off["num_solutions"] == 1
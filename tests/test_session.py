@@ -0,0 +1,83 @@
+import pytest
+import puzzlekit
+from puzzlekit.session import PuzzleSession
+from puzzlekit.solvers import get_solver_class
+from puzzlekit.parsers import get_parser
+from puzzlekit.utils.ortools_utils import new_bool_var
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    cls = get_solver_class("sudoku")
+    d.sudoku = get_parser("sudoku")(cls.metadata["input_example"].strip())
+    d.sudoku_solution = puzzlekit.solve(d.sudoku, "sudoku").solution_data["solution_grid"]
+    return d
+
+def test_check_and_retract(data):
+    session = PuzzleSession(puzzlekit.solver("sudoku", data.sudoku))
+    assert session.check()
+    session.assign(0, 2, "9")
+    assert session.check()
+    session.assign(1, 1, "5")  # correct value is 4
+    assert not session.check()
+    assert session.conflicts == [(1, 1)]
+    session.retract(1, 1)
+    assert session.solution() == data.sudoku_solution
+
+def test_hint(data):
+    session = PuzzleSession(puzzlekit.solver("sudoku", data.sudoku))
+    r, c, value = session.hint()
+    assert data.sudoku["grid"][r][c] == "-"
+    assert data.sudoku_solution.value(r, c) == value
+    # A unique puzzle forces every open cell.
+    open_cells = sum(row.count("-") for row in data.sudoku["grid"])
+    assert len(session.deductions()) == open_cells
+
+def test_partial_deductions():
+    grid = [["1", "2", "3", "-"], ["-", "-", "-", "-"], ["-", "-", "-", "-"], ["-", "-", "-", "-"]]
+    session = PuzzleSession(puzzlekit.solver("sudoku", {"num_rows": 4, "num_cols": 4, "grid": grid}))
+    assert session.deductions() == {(0, 3): "4"}
+    session.assign(1, 0, "4")
+    assert session.deductions()[1, 1] == "3"
+
+def test_deductions_keep_model_size(data):
+    session = PuzzleSession(puzzlekit.solver("sudoku", data.sudoku))
+    session.hint()
+    size = (len(session.model.Proto().variables), len(session.model.Proto().constraints))
+    for _ in range(3):
+        session.hint()
+    assert (len(session.model.Proto().variables), len(session.model.Proto().constraints)) == size
+
+@pytest.mark.parametrize("puzzle_type", ["binairo", "kakuro", "hidoku"])
+def test_non_sudoku_grids(puzzle_type):
+    # Boolean grids (binairo), other open-cell markers (kakuro) and shifted values (hidoku).
+    cls = get_solver_class(puzzle_type)
+    params = get_parser(puzzle_type)(cls.metadata["input_example"].strip())
+    solution = puzzlekit.solve(params, puzzle_type).solution_data["solution_grid"]
+    session = PuzzleSession(puzzlekit.solver(puzzle_type, params), max_time=10)
+    forced = session.deductions()
+    assert forced and all(solution.value(r, c) == value for (r, c), value in forced.items())
+    r, c, value = session.hint()
+    session.assign(r, c, value)
+    assert session.check()
+
+def test_boolean_grids_need_cell_literal():
+    solver = puzzlekit.solver("square_o", {"num_rows": 1, "num_cols": 1, "grid": [["-"]]})
+    session = PuzzleSession(solver)
+    with pytest.raises(NotImplementedError):
+        session.assign(0, 0, "0")
+
+def test_mismatched_literals_raise(monkeypatch):
+    cls = get_solver_class("binairo")
+    params = get_parser("binairo")(cls.metadata["input_example"].strip())
+    solver = puzzlekit.solver("binairo", params)
+    monkeypatch.setattr(cls, "cell_literal", lambda self, r, c, value: new_bool_var(self.model))
+    with pytest.raises(RuntimeError):
+        PuzzleSession(solver).deductions()
+
+def test_unsupported_solvers():
+    with pytest.raises(TypeError):
+        PuzzleSession(puzzlekit.solver("hitori", {"num_rows": 1, "num_cols": 3, "grid": [["1", "2", "1"]]}))
@@ -0,0 +1,59 @@
+import pytest
+import puzzlekit
+from puzzlekit.parsers import get_parser
+from puzzlekit.core.grid import Grid
+from puzzlekit.solvers import get_solver_class
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.sudoku_str = "\n".join(line.strip() for line in get_solver_class("sudoku").metadata["input_example"].strip().splitlines())
+    d.sudoku_sol = "\n".join(line.strip() for line in get_solver_class("sudoku").metadata["output_example"].strip().splitlines()[1:])
+    d.hitori_str = "4 4\n3 3 1 4\n4 3 2 2\n1 3 4 2\n3 4 3 2"
+    return d
+
+def test_cpsat_params(data):
+    res = puzzlekit.solve(data.sudoku_str, "sudoku", max_time=10, num_workers=1, seed=7, sat_params={"cp_model_presolve": True})
+    assert res.is_solved
+    exp_grid = Grid(list(map(lambda x: x.split(" "), data.sudoku_sol.split("\n"))))
+    assert exp_grid == res.solution_data['solution_grid']
+
+def test_invalid_cpsat_param(data):
+    with pytest.raises(ValueError):
+        puzzlekit.solve(data.sudoku_str, "sudoku", sat_params={"no_such_parameter": 1})
+
+def test_mip_params(data):
+    res = puzzlekit.solve(data.hitori_str, "hitori", max_time=10, num_workers=1, seed=3)
+    assert res.is_solved
+
+def test_slim_result(data):
+    solver = puzzlekit.solver("sudoku", get_parser("sudoku")(data.sudoku_str))
+    res = solver.solve(slim=True)
+    assert res.is_solved
+    assert set(res.puzzle_data) == {"num_rows", "num_cols", "grid"}
+    assert isinstance(res.puzzle_data["grid"], list)
+    assert solver.model is None and solver.solver is None
+    # The solver can still be solved again after releasing its model.
+    assert solver.solve().is_solved
+
+def test_slim_result_keeps_renamed_inputs():
+    # StitchesSolver stores its region_grid argument as self.regions_grid.
+    solver_class = get_solver_class("stitches")
+    params = get_parser("stitches")(solver_class.metadata["input_example"].strip())
+    res = solver_class(**params).solve(slim=True)
+    assert set(res.puzzle_data) == set(params)
+    assert res.puzzle_data["region_grid"] == params["region_grid"]
+    # The slim puzzle_data rebuilds the same puzzle.
+    again = solver_class(**res.puzzle_data).solve()
+    assert again.solution_data["solution_grid"] == res.solution_data["solution_grid"]
+
+def test_build_profile(data):
+    res = puzzlekit.solve(data.hitori_str, "hitori", profile_build=True)
+    profile = res.solution_data['build_profile']
+    assert profile['steps']['_setup_initial_model']['num_vars'] == 16
+    assert profile['steps']['_add_unique_number_constraints']['calls'] == 1
+    assert profile['total_time'] == res.solution_data['build_time']
+    assert 'build_profile' not in puzzlekit.solve(data.hitori_str, "hitori").solution_data
@@ -0,0 +1,48 @@
+import pytest
+import puzzlekit
+from puzzlekit.cache import SolutionCache
+from puzzlekit.core.grid import Grid
+from puzzlekit.parsers.registry import get_parser
+from puzzlekit.solvers.sudoku import SudokuSolver
+from puzzlekit.symmetry import canonicalize, canonical_key, inverse_transform, transform_matrix, ALL_TRANSFORMS
+
+class TestData:
+    pass
+
+@pytest.fixture
+def data():
+    d = TestData()
+    d.sudoku = get_parser("sudoku")(SudokuSolver.metadata["input_example"].strip())
+    # Same puzzle, rotated by 90 degrees and with digits 1 <-> 9 and 2 <-> 8 swapped.
+    swap = {"1": "9", "9": "1", "2": "8", "8": "2"}
+    rotated = transform_matrix(d.sudoku["grid"], "rot90")
+    d.sudoku_variant = dict(d.sudoku, grid=[[swap.get(v, v) for v in row] for row in rotated])
+    d.hitori = {"num_rows": 2, "num_cols": 3, "grid": [["1", "1", "2"], ["2", "3", "1"]]}
+    return d
+
+def test_transforms_roundtrip():
+    matrix = [["a", "b", "c"], ["d", "e", "f"]]
+    for name in ALL_TRANSFORMS:
+        assert transform_matrix(transform_matrix(matrix, name), inverse_transform(name)) == matrix
+    assert transform_matrix(matrix, "rot90") == [["d", "a"], ["e", "b"], ["f", "c"]]
+
+def test_canonical_key(data):
+    assert canonical_key("sudoku", data.sudoku) == canonical_key("sudoku", data.sudoku_variant)
+    mirrored = dict(data.hitori, grid=[row[::-1] for row in data.hitori["grid"]])
+    relabeled = dict(data.hitori, grid=[[{"1": "7", "2": "5", "3": "1"}[v] for v in row] for row in data.hitori["grid"]])
+    assert canonical_key("hitori", data.hitori) == canonical_key("hitori", mirrored) == canonical_key("hitori", relabeled)
+    # Types without declared symmetries are only equal to themselves.
+    assert canonical_key("akari", data.hitori) != canonical_key("akari", mirrored)
+
+def test_canonical_solution_mapping(data):
+    form = canonicalize("sudoku", data.sudoku_variant)
+    solution = puzzlekit.solve(data.sudoku_variant, "sudoku").solution_data["solution_grid"]
+    assert form.from_canonical_solution(form.to_canonical_solution(solution)) == solution
+
+def test_canonical_cache(data):
+    cache = SolutionCache(canonical=True)
+    puzzlekit.solve(data.sudoku, "sudoku", cache=cache)
+    res = puzzlekit.solve(data.sudoku_variant, "sudoku", cache=cache)
+    assert res.solution_data["cache_hit"] is True
+    expected = puzzlekit.solve(data.sudoku_variant, "sudoku").solution_data["solution_grid"]
+    assert res.solution_data["solution_grid"] == expected